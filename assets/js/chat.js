@@ -1781,48 +1781,52 @@ async function sendOrchestratorMessage(text) {
       if (eventType === "execution_progress") {
         const task = eventData.task && typeof eventData.task === "object" ? eventData.task : {};
         const taskIndex = typeof eventData.task_index === "number" ? eventData.task_index : null;
-        const progress = eventData.progress && typeof eventData.progress === "object" ? eventData.progress : {};
+        // Bursts of progress updates arrive as one event with progress_batch; single updates use progress.
+        const progressItems = Array.isArray(eventData.progress_batch)
+          ? eventData.progress_batch
+          : [eventData.progress];
         const agentRaw = typeof task.agent === "string" ? task.agent.trim().toLowerCase() : "";
         const agentLabel = agentRaw ? (ORCHESTRATOR_AGENT_LABELS[agentRaw] || agentRaw) : "エージェント";
-        const textValue = typeof progress.text === "string" ? progress.text.trim() : "";
-        if (!textValue) {
-          continue;
-        }
-        if (agentRaw === "browser") {
-          disableOrchestratorBrowserMirrorFallback();
-        }
-        const messageId = typeof progress.message_id === "number" ? progress.message_id : null;
-        const formatted = `[${agentLabel}] ${textValue}`;
-        if (taskIndex === null) {
-          const fallbackMessage = addOrchestratorAssistantMessage(formatted);
-          fallbackMessage.pending = false;
-          fallbackMessage.ts = Date.now();
-          continue;
-        }
-        const entry = ensureTaskEntry(taskIndex);
-        if (!entry) {
-          const fallbackMessage = addOrchestratorAssistantMessage(formatted);
-          fallbackMessage.pending = false;
-          fallbackMessage.ts = Date.now();
-          continue;
-        }
-        if (!(entry.progress instanceof Map)) {
-          entry.progress = new Map();
-        }
-        const existingProgress = messageId !== null ? entry.progress.get(messageId) : null;
-        if (existingProgress) {
-          existingProgress.text = formatted;
-          existingProgress.pending = false;
-          existingProgress.ts = Date.now();
-        } else {
-          const progressMessage = addOrchestratorAssistantMessage(formatted);
-          progressMessage.pending = false;
-          progressMessage.ts = Date.now();
-          if (messageId !== null) {
-            entry.progress.set(messageId, progressMessage);
+        let rendered = false;
+        for (const progressItem of progressItems) {
+          const progress = progressItem && typeof progressItem === "object" ? progressItem : {};
+          const textValue = typeof progress.text === "string" ? progress.text.trim() : "";
+          if (!textValue) {
+            continue;
+          }
+          if (agentRaw === "browser") {
+            disableOrchestratorBrowserMirrorFallback();
+          }
+          const messageId = typeof progress.message_id === "number" ? progress.message_id : null;
+          const formatted = `[${agentLabel}] ${textValue}`;
+          const entry = taskIndex !== null ? ensureTaskEntry(taskIndex) : null;
+          if (!entry) {
+            const fallbackMessage = addOrchestratorAssistantMessage(formatted);
+            fallbackMessage.pending = false;
+            fallbackMessage.ts = Date.now();
+            continue;
+          }
+          if (!(entry.progress instanceof Map)) {
+            entry.progress = new Map();
+          }
+          const existingProgress = messageId !== null ? entry.progress.get(messageId) : null;
+          if (existingProgress) {
+            existingProgress.text = formatted;
+            existingProgress.pending = false;
+            existingProgress.ts = Date.now();
+          } else {
+            const progressMessage = addOrchestratorAssistantMessage(formatted);
+            progressMessage.pending = false;
+            progressMessage.ts = Date.now();
+            if (messageId !== null) {
+              entry.progress.set(messageId, progressMessage);
+            }
           }
+          rendered = true;
+        }
+        if (rendered) {
+          renderOrchestratorChat({ forceSidebar: currentChatMode === "orchestrator" });
         }
-        renderOrchestratorChat({ forceSidebar: currentChatMode === "orchestrator" });
         continue;
       }
 
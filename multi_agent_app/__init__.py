@@ -12,6 +12,7 @@ from fastapi.staticfiles import StaticFiles
 from jinja2 import pass_context
 from starlette.templating import Jinja2Templates
 
+from .http_client import _close_shared_async_client
 from .routes import router
 
 logging.basicConfig(level=logging.INFO)
@@ -23,7 +24,8 @@ def create_app() -> FastAPI:
     """Create and configure the FastAPI application."""
 
     app = FastAPI()
-    app.state.base_dir = BASE_DIR
+    # Resolved once here so serve_file can containment-check without resolving per request.
+    app.state.base_dir = BASE_DIR.resolve()
 
     templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
 
@@ -61,4 +63,5 @@ def create_app() -> FastAPI:
 
     app.mount("/assets", StaticFiles(directory=str(BASE_DIR / "assets")), name="static")
     app.include_router(router)
+    app.add_event_handler("shutdown", _close_shared_async_client)
     return app
@@ -21,6 +21,7 @@ from .config import (
     DEFAULT_BROWSER_AGENT_BASES,
 )
 from .errors import BrowserAgentError
+from .http_client import _get_shared_async_client
 from .request_context import get_browser_agent_bases
 
 _USE_BROWSER_AGENT_MCP = os.environ.get("BROWSER_AGENT_USE_MCP", "0").strip().lower() not in {"0", "false", "no", "off"}
@@ -383,17 +384,17 @@ async def _post_browser_agent(path: str, payload: Dict[str, Any], *, timeout: ht
     last_exception: Exception | None = None
     response: httpx.Response | None = None
 
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        for base in _iter_browser_agent_bases():
-            url = _build_browser_agent_url(base, path)
-            try:
-                response = await client.post(url, json=payload)
-            except httpx.RequestError as exc:  # pragma: no cover - network failure
-                connection_errors.append(f"{url}: {exc}")
-                last_exception = exc
-                continue
-            else:
-                break
+    client = _get_shared_async_client()
+    for base in _iter_browser_agent_bases():
+        url = _build_browser_agent_url(base, path)
+        try:
+            response = await client.post(url, json=payload, timeout=timeout)
+        except httpx.RequestError as exc:  # pragma: no cover - network failure
+            connection_errors.append(f"{url}: {exc}")
+            last_exception = exc
+            continue
+        else:
+            break
 
     if response is None:
         message_lines = ["ブラウザエージェント API への接続に失敗しました。"]
@@ -528,14 +529,17 @@ def _summarise_browser_messages(messages: Any) -> str:
     if not isinstance(messages, list):
         return ""
     for item in reversed(messages):
-        if not isinstance(item, dict):
+        if type(item) is not dict:
             continue
-        role = str(item.get("role") or "").lower()
-        if role != "assistant":
+        role = item.get("role")
+        # The Browser Agent sends lowercase roles; normalise only the rare other spelling.
+        if role != "assistant" and (not isinstance(role, str) or role.lower() != "assistant"):
             continue
         content = item.get("content") or item.get("text")
-        if isinstance(content, str) and content.strip():
-            return content.strip()
+        if isinstance(content, str):
+            text = content.strip()
+            if text:
+                return text
     return ""
 
 
@@ -564,31 +568,32 @@ async def _poll_browser_history_for_completion(
     latest_summary = ""
     last_seen = -1
 
-    async with httpx.AsyncClient(timeout=_browser_agent_timeout(10.0)) as client:
-        while time.monotonic() < deadline:
-            try:
-                response = await client.get(history_url)
-                if not response.is_success:
-                    break
-                data = response.json()
-            except Exception as exc:
-                logging.debug("Browser history poll failed: %s", exc)
-                await asyncio.sleep(interval)
-                continue
-            messages = data.get("messages") if isinstance(data, dict) else None
-            summary = _summarise_browser_messages(messages)
-            latest_id = _latest_message_id(messages)
+    client = _get_shared_async_client()
+    history_timeout = _browser_agent_timeout(10.0)
+    while time.monotonic() < deadline:
+        try:
+            response = await client.get(history_url, timeout=history_timeout)
+            if not response.is_success:
+                break
+            data = response.json()
+        except Exception as exc:
+            logging.debug("Browser history poll failed: %s", exc)
+            await asyncio.sleep(interval)
+            continue
+        messages = data.get("messages") if isinstance(data, dict) else None
+        summary = _summarise_browser_messages(messages)
+        latest_id = _latest_message_id(messages)
 
-            if summary:
-                if _has_browser_final_marker(summary):
-                    return summary
-                if latest_id > last_seen or summary != latest_summary:
-                    latest_summary = summary
+        if summary:
+            if _has_browser_final_marker(summary):
+                return summary
+            if latest_id > last_seen or summary != latest_summary:
+                latest_summary = summary
 
-            if latest_id > last_seen:
-                last_seen = latest_id
+        if latest_id > last_seen:
+            last_seen = latest_id
 
-            await asyncio.sleep(interval)
+        await asyncio.sleep(interval)
 
     return latest_summary
 
@@ -95,6 +95,8 @@ SCHEDULER_AGENT_CONNECT_TIMEOUT = _parse_timeout_env("SCHEDULER_AGENT_CONNECT_TI
 SCHEDULER_AGENT_TIMEOUT = float(os.environ.get("SCHEDULER_AGENT_TIMEOUT", "30"))
 SCHEDULER_MODEL_SYNC_CONNECT_TIMEOUT = _parse_timeout_env("SCHEDULER_MODEL_SYNC_CONNECT_TIMEOUT", 0.5)
 SCHEDULER_MODEL_SYNC_TIMEOUT = float(os.environ.get("SCHEDULER_MODEL_SYNC_TIMEOUT", "1.0"))
+# Seconds a Scheduler UI read (calendar, day view, routines) is reused across page renders (0 disables).
+SCHEDULER_UI_CACHE_TTL = float(os.environ.get("SCHEDULER_UI_CACHE_TTL", "10"))
 
 DEFAULT_BROWSER_AGENT_BASES = (
     "http://browser-agent:5005",
@@ -121,6 +123,15 @@ BROWSER_AGENT_FINAL_NOTICE = "※ ブラウザエージェントの応答はこ
 
 ORCHESTRATOR_MODEL = os.environ.get("ORCHESTRATOR_MODEL", "openai/gpt-oss-20b")
 ORCHESTRATOR_MAX_TASKS = int(os.environ.get("ORCHESTRATOR_MAX_TASKS", "5"))
+# Seconds an incremental re-plan may be reused for an identical planning context (0 disables).
+ORCHESTRATOR_REPLAN_CACHE_TTL = float(os.environ.get("ORCHESTRATOR_REPLAN_CACHE_TTL", "120"))
+# Seconds an LLM actionability verdict is reused for the same agent and command (0 disables).
+ORCHESTRATOR_ACTIONABILITY_CACHE_TTL = float(os.environ.get("ORCHESTRATOR_ACTIONABILITY_CACHE_TTL", "3600"))
+# Opt-in: continue with the remaining planned tasks after a successful step instead of
+# re-planning. Off by default because later tasks may need details from earlier results.
+ORCHESTRATOR_SKIP_REPLAN_ON_SUCCESS = os.environ.get(
+    "ORCHESTRATOR_SKIP_REPLAN_ON_SUCCESS", "0"
+).strip().lower() not in {"0", "false", "no", "off"}
 
 
 def _resolve_browser_embed_url() -> str:
@@ -8,15 +8,17 @@ import logging
 import threading
 import asyncio
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from .browser import _call_browser_agent_chat, _call_browser_agent_history_check
 from .errors import BrowserAgentError, LifestyleAPIError, IotAgentError, SchedulerAgentError
+from .http_client import _run_and_close_shared_async_client
+from .json_codec import json_dumps_indented, json_loads
 from .lifestyle import _call_lifestyle
 from .iot import _call_iot_agent_command, _call_iot_agent_conversation_review
 from .scheduler import _call_scheduler_agent_conversation_review
 from .settings import load_memory_settings
-from .memory_manager import MemoryManager, get_memory_llm
+from .memory_manager import get_memory_llm, get_memory_manager
 from .agent_status import get_agent_availability
 
 _browser_history_supported = True
@@ -30,16 +32,43 @@ _SHORT_TO_LONG_THRESHOLD = 3
 _short_updates_since_last_long = 0
 _short_update_lock = threading.Lock()
 
+# Parsed chat history keyed by path and validated against the file's
+# (mtime_ns, size) so repeated reads within a request skip the JSON parse.
+_chat_history_cache: Dict[Path, tuple[tuple[int, int], List[Dict[str, Any]]]] = {}
+_chat_history_cache_lock = threading.Lock()
+_chat_history_contents_cache: Dict[tuple[Path, int], tuple[tuple[int, int], frozenset[str]]] = {}
+
 
 def _run_async_history_sync(history: List[Dict[str, str]]) -> None:
     """Run async history sync logic in a background thread."""
 
     try:
-        asyncio.run(_send_recent_history_to_agents(history))
+        asyncio.run(_run_and_close_shared_async_client(_send_recent_history_to_agents(history)))
     except Exception as exc:  # noqa: BLE001
         logging.warning("Async history sync failed: %s", exc)
 
 
+def _chat_history_stat_key(path: Path) -> tuple[int, int]:
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _remember_chat_history(
+    path: Path, history: List[Dict[str, Any]], key: tuple[int, int] | None = None
+) -> None:
+    """Record the parsed history for ``path`` against its stat key."""
+
+    if key is None:
+        try:
+            key = _chat_history_stat_key(path)
+        except OSError:
+            with _chat_history_cache_lock:
+                _chat_history_cache.pop(path, None)
+            return
+    with _chat_history_cache_lock:
+        _chat_history_cache[path] = (key, list(history))
+
+
 def _load_chat_history(prefer_fallback: bool = True) -> tuple[List[Dict[str, Any]], Path]:
     """Return chat history and the path it was loaded from with permission-aware fallbacks."""
 
@@ -55,9 +84,16 @@ def _load_chat_history(prefer_fallback: bool = True) -> tuple[List[Dict[str, Any
 
     for path in candidates:
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            key = _chat_history_stat_key(path)
+            with _chat_history_cache_lock:
+                cached = _chat_history_cache.get(path)
+            if cached is not None and cached[0] == key:
+                # Hand out a copy so callers appending to the list do not mutate the cache.
+                return list(cached[1]), path
+            with open(path, "rb") as f:
+                data = json_loads(f.read())
             if isinstance(data, list):
+                _remember_chat_history(path, data, key)
                 return data, path
             logging.warning("Chat history at %s was not a list. Resetting.", path)
             return [], path
@@ -92,6 +128,8 @@ def _write_chat_history(history: List[Dict[str, Any]], preferred_path: Path | No
 
     seen: set[Path] = set()
     last_error: Exception | None = None
+    # Serialised once and reused for the mirror copies.
+    content = json_dumps_indented(history)
 
     for path in candidate_paths:
         if path in seen:
@@ -100,8 +138,9 @@ def _write_chat_history(history: List[Dict[str, Any]], preferred_path: Path | No
 
         try:
             path.parent.mkdir(parents=True, exist_ok=True)
-            with open(path, "w", encoding="utf-8") as f:
-                json.dump(history, f, ensure_ascii=False, indent=2)
+            with open(path, "wb") as f:
+                f.write(content)
+            _remember_chat_history(path, history)
 
             # Best-effort mirror to other known locations for compatibility.
             mirror_targets = [_PRIMARY_CHAT_HISTORY_PATH, _FALLBACK_CHAT_HISTORY_PATH]
@@ -112,8 +151,9 @@ def _write_chat_history(history: List[Dict[str, Any]], preferred_path: Path | No
                     if mirror.exists() and not os.access(mirror, os.W_OK):
                         continue
                     mirror.parent.mkdir(parents=True, exist_ok=True)
-                    with open(mirror, "w", encoding="utf-8") as mf:
-                        json.dump(history, mf, ensure_ascii=False, indent=2)
+                    with open(mirror, "wb") as mf:
+                        mf.write(content)
+                    _remember_chat_history(mirror, history)
                 except Exception as exc:  # noqa: BLE001
                     logging.debug("Skipping mirror write to %s: %s", mirror, exc)
 
@@ -141,6 +181,49 @@ def _read_chat_history(limit: int | None = None) -> List[Dict[str, Any]]:
     return history[-limit:]
 
 
+def _read_chat_history_bytes() -> bytes:
+    """Return the chat history as JSON, reusing the file's bytes when it is known to be valid."""
+
+    history, path = _load_chat_history()
+    with _chat_history_cache_lock:
+        cached = _chat_history_cache.get(path)
+    if cached is not None:
+        try:
+            with open(path, "rb") as f:
+                raw = f.read()
+            # The cache entry means this exact file already parsed as a list; a size
+            # mismatch means it changed since, so serialise the parsed copy instead.
+            if _chat_history_stat_key(path) == cached[0] and len(raw) == cached[0][1]:
+                return raw
+        except OSError:
+            pass
+    return json_dumps_indented(history)
+
+
+def _recent_chat_history_contents(limit: int) -> frozenset[str]:
+    """Return the stripped contents of the latest ``limit`` entries for membership checks."""
+
+    history, path = _load_chat_history()
+    # Build the set from the cached list itself so it always matches the key it is stored under.
+    with _chat_history_cache_lock:
+        cached_history = _chat_history_cache.get(path)
+    key: tuple[int, int] | None = None
+    if cached_history is not None:
+        key, history = cached_history
+        with _chat_history_cache_lock:
+            cached = _chat_history_contents_cache.get((path, limit))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+    contents = frozenset(
+        str(entry.get("content") or "").strip() for entry in history[-limit:] if isinstance(entry, dict)
+    )
+    if key is not None:
+        with _chat_history_cache_lock:
+            _chat_history_contents_cache[(path, limit)] = (key, contents)
+    return contents
+
+
 def _reset_chat_history() -> None:
     """Reset chat history, preferring the writable fallback path."""
 
@@ -235,7 +318,7 @@ def _refresh_memory(memory_kind: str, recent_history: List[Dict[str, str]]) -> N
     else:
         memory_path = "long_term_memory.json"
 
-    manager = MemoryManager(memory_path)
+    manager = get_memory_manager(memory_path)
     try:
         snapshot = manager.consolidate_memory(
             normalized_history,
@@ -263,10 +346,10 @@ def _consolidate_short_into_long(recent_history: List[Dict[str, str]]) -> None:
     if llm is None:
         return
 
-    short_manager = MemoryManager("short_term_memory.json")
+    short_manager = get_memory_manager("short_term_memory.json")
     short_snapshot = short_manager.load_memory()
 
-    long_manager = MemoryManager("long_term_memory.json")
+    long_manager = get_memory_manager("long_term_memory.json")
     try:
         long_manager.consolidate_memory(
             recent_history,
@@ -497,17 +580,30 @@ def _append_to_chat_history(
 ) -> None:
     """Append a message to the chat history file."""
 
-    extras = metadata if isinstance(metadata, dict) else None
-    history, source_path = _load_chat_history()
+    _append_to_chat_history_many([(role, content, metadata)], broadcast=broadcast)
 
-    next_id = len(history) + 1
-    entry: Dict[str, Any] = {"id": next_id, "role": role, "content": content}
-    if extras:
-        for key, value in extras.items():
-            if key in {"id", "role", "content"}:
-                continue
-            entry[key] = value
-    history.append(entry)
+
+def _append_to_chat_history_many(
+    messages: Iterable[tuple[str, str, Optional[Dict[str, Any]]]], *, broadcast: bool = True
+) -> None:
+    """Append several messages with a single read/write and one round of follow-up work."""
+
+    pending = list(messages)
+    if not pending:
+        return
+
+    history, source_path = _load_chat_history()
+    previous_total = len(history)
+
+    for role, content, metadata in pending:
+        extras = metadata if isinstance(metadata, dict) else None
+        entry: Dict[str, Any] = {"id": len(history) + 1, "role": role, "content": content}
+        if extras:
+            for key, value in extras.items():
+                if key in {"id", "role", "content"}:
+                    continue
+                entry[key] = value
+        history.append(entry)
 
     try:
         _write_chat_history(history, preferred_path=source_path)
@@ -519,14 +615,15 @@ def _append_to_chat_history(
     if total_entries == 0:
         return
 
-    # Keep agents loosely in sync
-    if broadcast and total_entries % 5 == 0:
+    # Keep agents loosely in sync: broadcast whenever the batch crossed a multiple of five.
+    if broadcast and total_entries // 5 > previous_total // 5:
         memory_settings = load_memory_settings()
         if memory_settings.get("history_sync_enabled", True):
             threading.Thread(target=_run_async_history_sync, args=(history,)).start()
 
     # Short-term memory: refresh every turn using the latest few lines as context
-    threading.Thread(target=_refresh_memory, args=("short", history[-6:])).start()
+    recent_window = max(6, len(pending) + 1)
+    threading.Thread(target=_refresh_memory, args=("short", history[-recent_window:])).start()
 
     # Long-term memory: consolidate only after several short updates to avoid homogenization
     with _short_update_lock:
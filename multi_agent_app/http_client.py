@@ -0,0 +1,54 @@
+"""Shared keep-alive HTTP client for calls to the downstream agents."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import Awaitable, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+_AGENT_HTTP_LIMITS = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+
+# httpx connections are bound to the event loop that opened them, and background
+# history syncs run their own loops via asyncio.run, so keep one client per loop.
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_clients_lock = threading.Lock()
+
+
+def _get_shared_async_client() -> httpx.AsyncClient:
+    """Return the pooled client for the running event loop, creating it on first use."""
+
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=_AGENT_HTTP_LIMITS)
+            _clients[loop] = client
+    return client
+
+
+async def _close_shared_async_client() -> None:
+    """Close the pooled client owned by the running event loop, if any."""
+
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
+
+
+async def _run_and_close_shared_async_client(coro: Awaitable[T]) -> T:
+    """Await ``coro`` and then close the running loop's pooled client.
+
+    Use this for coroutines driven by short-lived loops (``asyncio.run`` and friends). Open
+    connections keep their loop alive, so an unclosed client would never leave ``_clients``.
+    """
+
+    try:
+        return await coro
+    finally:
+        await _close_shared_async_client()
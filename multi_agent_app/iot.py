@@ -30,6 +30,7 @@ from .settings import resolve_llm_config
 
 # Context fetch should be best-effort to avoid blocking orchestrator planning.
 from .errors import IotAgentError
+from .http_client import _get_shared_async_client
 
 IOT_DEVICE_CONTEXT_TIMEOUT = float(os.environ.get("IOT_DEVICE_CONTEXT_TIMEOUT", "8.0"))
 IOT_MCP_SSE_TIMEOUT = float(os.environ.get("IOT_MCP_SSE_TIMEOUT", "15.0"))
@@ -94,17 +95,17 @@ async def _post_iot_agent(path: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     connection_errors: list[str] = []
     last_exception: Exception | None = None
     response: httpx.Response | None = None
-    async with httpx.AsyncClient(timeout=IOT_AGENT_TIMEOUT) as client:
-        for base in bases:
-            url = _build_iot_agent_url(base, path)
-            try:
-                response = await client.post(url, json=payload)
-            except httpx.RequestError as exc:  # pragma: no cover - network failure
-                connection_errors.append(f"{url}: {exc}")
-                last_exception = exc
-                continue
-            else:
-                break
+    client = _get_shared_async_client()
+    for base in bases:
+        url = _build_iot_agent_url(base, path)
+        try:
+            response = await client.post(url, json=payload, timeout=IOT_AGENT_TIMEOUT)
+        except httpx.RequestError as exc:  # pragma: no cover - network failure
+            connection_errors.append(f"{url}: {exc}")
+            last_exception = exc
+            continue
+        else:
+            break
 
     if response is None:
         message_lines = ["IoT Agent API への接続に失敗しました。"]
@@ -604,11 +605,11 @@ async def _execute_via_http_chat(command: str, base_url: str) -> Dict[str, Any]:
     """Execute a command via the HTTP /api/chat endpoint (for external endpoints)."""
     url = _build_iot_agent_url(base_url, "/api/chat")
     try:
-        async with httpx.AsyncClient(timeout=IOT_AGENT_TIMEOUT) as client:
-            response = await client.post(
-                url,
-                json={"messages": [{"role": "user", "content": command}]},
-            )
+        response = await _get_shared_async_client().post(
+            url,
+            json={"messages": [{"role": "user", "content": command}]},
+            timeout=IOT_AGENT_TIMEOUT,
+        )
         if response.is_success:
             return response.json()
         error_msg = response.text or f"{response.status_code} {response.reason_phrase}"
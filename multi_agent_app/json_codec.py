@@ -0,0 +1,35 @@
+"""JSON helpers shared by the routes, history, memory and settings modules.
+
+orjson is used when installed; otherwise the stdlib ``json`` module produces the same output.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+# Both accept bytes as well as str. orjson.JSONDecodeError subclasses json.JSONDecodeError, so
+# callers catch the stdlib exception either way; the stdlib also raises UnicodeDecodeError
+# (a ValueError) for invalid UTF-8 bytes.
+json_loads = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(value: Any) -> bytes:
+    """Serialise ``value`` as compact UTF-8 JSON."""
+
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def json_dumps_indented(value: Any) -> bytes:
+    """Serialise ``value`` as two-space indented UTF-8 JSON, the on-disk format of the app's files."""
+
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2)
+    return json.dumps(value, ensure_ascii=False, indent=2).encode("utf-8")
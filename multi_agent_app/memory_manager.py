@@ -6,6 +6,7 @@ import json
 import logging
 import os
 import difflib
+import functools
 import re
 import hashlib
 import threading
@@ -20,6 +21,8 @@ from langchain_anthropic import ChatAnthropic
 
 from .settings import resolve_llm_config, load_memory_settings, DEFAULT_MEMORY_SETTINGS
 from .config import _current_datetime_line
+from .json_codec import json_dumps_indented, json_loads
+
 
 # Type Definitions
 
@@ -227,6 +230,19 @@ _memory_llm_instance = None
 _memory_llm_lock = threading.Lock()
 _memory_llm_signature: tuple[str, str, str, str] | None = None
 
+# Prompt-ready memory text per file, reused while the file is unchanged on disk.
+# Entries: path -> ((mtime_ns, size), formatted text, short-term expiry or None).
+_formatted_memory_cache: Dict[str, tuple[tuple[int, int], str, datetime | None]] = {}
+_formatted_memory_lock = threading.Lock()
+
+
+def _memory_file_key(path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
 
 def _normalise_history(conversation: List[Dict[str, Any]]) -> List[Dict[str, str]]:
     """Return a sanitised list of {role, content} lines for prompts."""
@@ -656,9 +672,9 @@ class MemoryManager:
             return self._finalize_loaded_memory(self._create_empty_memory())
 
         try:
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-        except (json.JSONDecodeError, OSError):
+            with open(self.file_path, "rb") as f:
+                data = json_loads(f.read())
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
             logging.warning(f"Failed to load memory from {self.file_path}, resetting.")
             return self._finalize_loaded_memory(self._create_empty_memory())
 
@@ -911,8 +927,9 @@ class MemoryManager:
         """Save memory to file."""
         memory["last_updated"] = datetime.now().isoformat()
         try:
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(memory, f, ensure_ascii=False, indent=2)
+            content = json_dumps_indented(memory)
+            with open(self.file_path, "wb") as f:
+                f.write(content)
         except OSError as e:
             logging.error(f"Failed to save memory to {self.file_path}: {e}")
 
@@ -1791,7 +1808,28 @@ class MemoryManager:
 
     def get_formatted_memory(self) -> str:
         """Get memory formatted for prompt injection, organized by category and structured data."""
+        file_key = _memory_file_key(self.file_path)
+        if file_key is not None:
+            with _formatted_memory_lock:
+                cached = _formatted_memory_cache.get(self.file_path)
+            # Short-term memory is rewritten once it expires, so a cached copy only lives until then.
+            if cached is not None and cached[0] == file_key and (cached[2] is None or datetime.now() < cached[2]):
+                return cached[1]
+
         memory = self.load_memory()
+        formatted = self._format_memory(memory)
+        if file_key is not None:
+            expires_at: datetime | None = None
+            if self._is_short_term:
+                try:
+                    expires_at = datetime.fromisoformat(str(memory.get("expires_at") or ""))
+                except ValueError:
+                    expires_at = datetime.now()
+            with _formatted_memory_lock:
+                _formatted_memory_cache[self.file_path] = (file_key, formatted, expires_at)
+        return formatted
+
+    def _format_memory(self, memory: MemoryStore) -> str:
         sections = []
         titles = memory.get("category_titles") if isinstance(memory.get("category_titles"), dict) else {}
 
@@ -2099,3 +2137,10 @@ class MemoryManager:
             }
             
             target_slots_list.append(new_slot)
+
+
+@functools.lru_cache(maxsize=8)
+def get_memory_manager(file_path: str) -> MemoryManager:
+    """Return the shared MemoryManager for ``file_path``; managers hold no per-call state."""
+
+    return MemoryManager(file_path)
@@ -4,19 +4,26 @@ from __future__ import annotations
 
 import ast
 import asyncio
+import copy
+import hashlib
 import json
 import logging
 import re
 import threading
 import time
-from typing import Any, Dict, Iterable, List, Literal, TypedDict, cast, AsyncIterator
+from collections import OrderedDict, deque
+from contextlib import aclosing
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import Any, Awaitable, Callable, Deque, Dict, Iterable, List, Literal, NamedTuple, NotRequired, TypedDict, cast, AsyncIterator
 
 import httpx
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
 from langchain_openai import ChatOpenAI
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_anthropic import ChatAnthropic
 from langgraph.graph import END, StateGraph
+from pydantic import BaseModel
 
 from multi_agent_app.config import BROWSER_AGENT_CONNECT_TIMEOUT
 from .browser import (
@@ -26,6 +33,7 @@ from .browser import (
     _call_browser_agent_chat_via_mcp,
     _extract_browser_error_message,
     _iter_browser_agent_bases,
+    _summarise_browser_messages,
     _USE_BROWSER_AGENT_MCP,
 )
 from .config import (
@@ -33,7 +41,10 @@ from .config import (
     BROWSER_AGENT_FINAL_MARKER,
     BROWSER_AGENT_FINAL_NOTICE,
     BROWSER_AGENT_STREAM_TIMEOUT,
+    ORCHESTRATOR_ACTIONABILITY_CACHE_TTL,
     ORCHESTRATOR_MAX_TASKS,
+    ORCHESTRATOR_REPLAN_CACHE_TTL,
+    ORCHESTRATOR_SKIP_REPLAN_ON_SUCCESS,
     _current_datetime_line,
 )
 from .errors import (
@@ -44,19 +55,142 @@ from .errors import (
     SchedulerAgentError,
 )
 from .lifestyle import _call_lifestyle
-from .history import _append_to_chat_history, _read_chat_history
+from .history import (
+    _append_to_chat_history,
+    _append_to_chat_history_many,
+    _read_chat_history,
+    _recent_chat_history_contents,
+)
+from .http_client import _get_shared_async_client, _run_and_close_shared_async_client
+from .json_codec import json_loads
 from .iot import _call_iot_agent_command, _count_iot_devices, _fetch_iot_device_context
 from .scheduler import _call_scheduler_agent_chat
 from .settings import load_agent_connections, resolve_llm_config, load_memory_settings
-from .memory_manager import MemoryManager, get_memory_llm
+from .memory_manager import get_memory_llm, get_memory_manager
 from .agent_status import get_agent_availability
 
 
+_NEEDS_INFO_QUESTION_PREFIX = "追加の情報が必要です。以下の質問に回答してください: "
+_NEEDS_INFO_FALLBACK_TEXT = "追加の情報が必要です。上記の質問に回答してください。"
+_BROWSER_MESSAGE_EVENT_TYPES = frozenset(("message", "update"))
+
+
+def _first_nonempty_stripped(data: Dict[str, Any], *keys: str) -> str:
+    """Return the first value under ``keys`` that is non-empty once stripped."""
+
+    for key in keys:
+        value = data.get(key)
+        if value is None:
+            continue
+        text = (value if isinstance(value, str) else str(value)).strip()
+        if text:
+            return text
+    return ""
+
+
+@lru_cache(maxsize=1024)
+def _normalised_task_key(agent: Any, command: str) -> tuple[Any, str]:
+    # Each re-plan re-scans every earlier execution, so normalise a given command only once.
+    return agent, command.strip()
+
+
+async def _iter_sse_frames(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[str, bytes]]:
+    """Yield ``(event, data)`` for each server-sent event in a byte stream.
+
+    Only event names are decoded; the data stays as bytes so it can go straight to
+    the JSON parser. Comment lines and lines without a field separator are skipped.
+    """
+
+    event_type = "message"
+    data_lines: list[bytes] = []
+    pending = b""
+    async for chunk in chunks:
+        lines = (pending + chunk).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if not line:
+                if data_lines:
+                    yield event_type, b"\n".join(data_lines)
+                    data_lines = []
+                    event_type = "message"
+                continue
+            field, sep, value = line.partition(b":")
+            if not sep:
+                continue
+            if field == b"data":
+                data_lines.append(value.lstrip())
+            elif field == b"event":
+                event_type = value.strip().decode("utf-8", "replace") or "message"
+
+
+class _BrowserWorkerEvent(NamedTuple):
+    """Item handed from the Browser Agent stream/chat workers to the progress consumer."""
+
+    kind: str
+    payload: Any = None
+
+
+class _LazyEvent:
+    """Stream event whose payload is only built when a consumer asks for it.
+
+    The builder reads the live run state, so ``materialize`` must be called before
+    the producing generator is resumed.
+    """
+
+    __slots__ = ("event", "_builder", "_payload")
+
+    def __init__(self, event: str, builder: Callable[[], Dict[str, Any]]) -> None:
+        self.event = event
+        self._builder = builder
+        self._payload: Dict[str, Any] | None = None
+
+    def materialize(self) -> Dict[str, Any]:
+        if self._payload is None:
+            self._payload = self._builder()
+        return self._payload
+
+
+class _ReviewSchema(BaseModel):
+    """Structured reviewer verdict requested from the LLM."""
+
+    review_status: Literal["ok", "retry"]
+    review_reason: str = ""
+
+
+class _ActionabilitySchema(BaseModel):
+    """Structured actionability verdict requested from the LLM."""
+
+    status: Literal["ok", "needs_info"]
+    message: str = ""
+
+
+# Provider errors that mean the request itself was refused (e.g. tools not supported), as
+# opposed to timeouts, rate limits or 5xx responses that may succeed on the next call.
+_STRUCTURED_OUTPUT_REJECTED_STATUSES = frozenset((400, 422))
+_STRUCTURED_OUTPUT_REJECTED_ERRORS = frozenset(("BadRequestError", "InvalidArgument", "UnprocessableEntityError"))
+
+
+def _structured_output_unsupported(exc: BaseException) -> bool:
+    """Return True when ``exc`` shows the provider cannot serve structured output at all."""
+
+    if isinstance(exc, NotImplementedError):
+        return True
+    if type(exc).__name__ in _STRUCTURED_OUTPUT_REJECTED_ERRORS:
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status in _STRUCTURED_OUTPUT_REJECTED_STATUSES
+
+
 class TaskSpec(TypedDict):
     """Specification describing the agent and command to run."""
 
     agent: Literal["lifestyle", "browser", "iot", "scheduler"]
     command: str
+    parallel: NotRequired[bool]
 
 
 class ExecutionResult(TypedDict, total=False):
@@ -84,11 +218,12 @@ class OrchestratorState(TypedDict, total=False):
     retry_counts: Dict[int, int]
     agent_connections: Dict[str, bool]
     session_history: List[Dict[str, Any]]
+    session_history_summary: str
 
 class MultiAgentOrchestrator:
     """LangGraph-based orchestrator that routes work to specialised agents."""
 
-    _AGENT_ALIASES = {
+    _AGENT_ALIASES = MappingProxyType({
         "faq": "lifestyle",
         "qa": "lifestyle",
         "qa_agent": "lifestyle",
@@ -114,7 +249,7 @@ class MultiAgentOrchestrator:
         "schedule": "scheduler",
         "calendar": "scheduler",
         "task": "scheduler",
-    }
+    })
 
     _AGENT_DISPLAY_NAMES = {
         "lifestyle": "Life-Styleエージェント",
@@ -122,14 +257,36 @@ class MultiAgentOrchestrator:
         "iot": "IoT エージェント",
         "scheduler": "Scheduler エージェント",
     }
+    _AGENT_LABEL_PREFIXES = {agent: f"[{label}] " for agent, label in _AGENT_DISPLAY_NAMES.items()}
 
     _ORCHESTRATOR_LABEL = "[Orchestrator]"
+    _ORCHESTRATOR_LABEL_LOWER = _ORCHESTRATOR_LABEL.lower()
+    _ORCHESTRATOR_MESSAGE_TYPES = frozenset({"plan", "status"})
+    _LABEL_STRIP_RE = re.compile(r"^\[[^\]]+\]\s*")
+    _JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+    _CODE_BLOCK_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+    _BROWSER_FINAL_MARKERS_RE = re.compile(
+        "|".join(map(re.escape, (BROWSER_AGENT_FINAL_MARKER, BROWSER_AGENT_FINAL_NOTICE)))
+    )
+    _TRAILING_COMMA_RE = re.compile(r",\s*([\]}])")
+    _PLAN_SUMMARY_FIELD_RE = re.compile(r'"plan_summary"\\s*:\\s*"([^"]+)"')
+    _TASKS_FIELD_RE = re.compile(r'"tasks"\\s*:\\s*(\\[.*?\\])')
 
     MAX_RETRIES = 2
+    _PROGRESS_BATCH_WINDOW = 0.05
+    _FULL_STATE_EVENTS = frozenset({"plan", "complete"})
+    _PROGRESS_BATCH_MAX_ITEMS = 8
+    # Seconds the Browser Agent stream may stay open once the chat call has returned.
+    _BROWSER_STREAM_DRAIN_TIMEOUT = 5.0
+    # Most recent Browser Agent messages remembered per run for update detection.
+    _BROWSER_PROGRESS_MESSAGE_LIMIT = 1024
+    _REPLAN_CACHE_SIZE = 32
+    _ACTIONABILITY_CACHE_SIZE = 256
+    _SESSION_HISTORY_WINDOW = 20
+    _SESSION_SUMMARY_ENTRY_CHARS = 200
+    _SESSION_SUMMARY_MAX_CHARS = 2000
 
     _REVIEWER_PROMPT = """
-現在の日時ー{current_datetime}
-
 あなたはマルチエージェントシステムのオーケストレーターで、エージェントの実行結果をレビューする役割を担っています。
 
 - ユーザーの当初の依頼とエージェントの実行結果を比較し、結果が依頼内容を満たしているか確認してください。
@@ -139,6 +296,8 @@ class MultiAgentOrchestrator:
   - "review_status": "ok" または "retry" のいずれかの文字列。
   - "review_reason": "ok" の場合は簡単な承認理由、"retry" の場合は再実行を指示する具体的な理由や修正点を記述した文字列。
 
+{current_datetime}
+
 レビュー対象の情報:
 - ユーザーの依頼: {user_input}
 - エージェント名: {agent_name}
@@ -146,46 +305,59 @@ class MultiAgentOrchestrator:
 - 実行結果: {result}
 """
 
-    _PLANNER_PROMPT = """
-現在の日時ー{current_datetime}
-
-【重要：記憶情報の取り扱い】
-- 提供される「ユーザーの特性（長期記憶）」や「ユーザーの最近の動向（短期記憶）」は、あくまで**参考情報**です。
-- これら過去の記憶情報だけに基づいて、ユーザーから明示的な指示がないタスクを勝手に開始してはいけません。
-- 最優先すべきは**直近のユーザー入力**です。記憶情報は、直近のユーザー入力を理解し補助するためだけに使用してください。
--エージェントのみが使用でき、googleカレンダーやnotionなどの外部サービスは使うことができません。
-
-あなたはマルチエージェントシステムのオーケストレーターです。ユーザーの依頼を読み、まず次の二択を厳密に判定してください。
-1) **直接回答モード**: エージェントを使わなくても十分に答えられる場合は、計画もタスクも作らず `plan_summary` にユーザーへの最終回答をそのまま書く（挨拶や前置きだけにしない）。`tasks` は必ず空配列にする。
-2) **計画・割当モード**: 外部操作・最新情報・デバイス制御・記録など、エージェントを使うことが不可欠または明確に有利な場合に限りタスクを設計して割り当てる。
-この判定結果を JSON に正確に反映し、Markdown や余計な文章は出力しないでください。
-
-- 利用可能なエージェント:
+    # Kept free of per-request values so the formatted text is an identical prefix on every
+    # call, which lets provider-side prompt caching reuse it.
+    # Per-agent sections of the planner prompt; only the enabled agents are described.
+    _PLANNER_AGENT_SECTIONS = {
+        "lifestyle": """\
   - "lifestyle"（Life-Styleエージェント）:
     - **役割**: 家庭内の生活全般の知識（料理、掃除、家電、メンタルヘルスなど）に関する質問回答、相談、雑談を担当します。RAG（検索拡張生成）を用いて内部知識ベースから回答を生成します。
     - **重要**: 「献立」「レシピ」「食事の提案」など、食事に関する依頼は**必ず**このエージェントに割り当ててください。
     - **非対応**: ユーザーの個別の予定管理、日報の記録、外部サイトの操作、IoT機器の制御は**行いません**。「覚えておいて」などの記憶依頼も、予定や記録としての側面が強い場合はSchedulerへ、事実としての記憶なら長期記憶へ（ここではタスク化しない）となります。
+""",
+        "browser": """\
   - "browser"（Browserエージェント）:
     - **役割**: Webブラウザを自動操作して、最新情報の検索、Webサイトの閲覧、フォーム入力などを行います。
     - **使い分け**: 内部知識（過去の学習データ）で完結する質問には lifestyle を使用し、天気、ニュース、最新価格、特定店舗の予約など**リアルタイム情報**や**外部サイト操作**が必要な場合にこちらを使用します。
     - **補完**: 検索エンジンやサイトが指定されていない場合は、Yahoo! JAPANなどをデフォルトとしてコマンドを作成してください。
+""",
+        "iot": """\
   - "iot"（IoTエージェント）:
     - **役割**: IoTデバイス（ライト、ブザー、モーター、カメラ、センサーなど）の制御と状態確認を行います。
     - **方針**: ユーザーの意図が推測可能な場合は、**確認質問をせずに**積極的に実行コマンドを発行してください。
       - デバイスが特定できないが1台しかない場合 → そのデバイスIDを対象とする。
       - パラメータ（時間や強度）が不明 → 一般的なデフォルト値（例: 5秒）を設定する。
       - 周囲の状況を確認したいと言われたら、raspi4のカメラを使います。
+""",
+        "scheduler": """\
   - "scheduler"（Schedulerエージェント）:
     - **役割**: ユーザーのスケジュール管理、タスク管理、日報（日記・メモ）の記録・更新・参照を担当します。「予定を入れて」「タスクに追加して」「日報を書いて」「今日の予定は？」などの依頼は必ずこのエージェントを選択します。
     - **仕様**:
       - **日付省略時**: 日付が明示されていない場合は**「今日」**を対象としてコマンドを作成してください。
       - **保存先**: **外部カレンダー（Google Calendar等）や外部メモアプリ（Notion等）との連携機能はありません。** ユーザーが「Googleカレンダーに入れて」と指示しても、外部連携はできないため、自動的に**エージェント内部のデータベース**に登録するコマンドを作成してください。その際、ユーザーに「Googleカレンダーは使えませんがよろしいですか？」と確認する必要はありません。
     - **重要**: **lifestyle エージェントは記録機能を持たないため、記録・保存・スケジュールに関する依頼は必ず scheduler に割り当ててください。**
+""",
+    }
+
+    _PLANNER_PROMPT = """
+【重要：記憶情報の取り扱い】
+- 提供される「ユーザーの特性（長期記憶）」や「ユーザーの最近の動向（短期記憶）」は、あくまで**参考情報**です。
+- これら過去の記憶情報だけに基づいて、ユーザーから明示的な指示がないタスクを勝手に開始してはいけません。
+- 最優先すべきは**直近のユーザー入力**です。記憶情報は、直近のユーザー入力を理解し補助するためだけに使用してください。
+-エージェントのみが使用でき、googleカレンダーやnotionなどの外部サービスは使うことができません。
+
+あなたはマルチエージェントシステムのオーケストレーターです。ユーザーの依頼を読み、まず次の二択を厳密に判定してください。
+1) **直接回答モード**: エージェントを使わなくても十分に答えられる場合は、計画もタスクも作らず `plan_summary` にユーザーへの最終回答をそのまま書く（挨拶や前置きだけにしない）。`tasks` は必ず空配列にする。
+2) **計画・割当モード**: 外部操作・最新情報・デバイス制御・記録など、エージェントを使うことが不可欠または明確に有利な場合に限りタスクを設計して割り当てる。
+この判定結果を JSON に正確に反映し、Markdown や余計な文章は出力しないでください。
 
+- 利用可能なエージェント:
+{agent_sections}
 - 出力は JSON オブジェクトのみで、追加の説明やマークダウンを含めてはいけません。
 - JSON には必ず次のキーを含めてください:
   - "plan_summary": 実行方針または直接回答を 1 文でまとめた文字列。
   - "tasks": タスクの配列。各要素は {{"agent": <上記のいずれか>, "command": <エージェントに渡す命令>}} です。
+  - 前後のタスクの結果を一切必要とせず同時に実行してよいタスクにだけ、"parallel": true を付けてもかまいません（browser タスクには付けない）。
 - タスク数は 0〜{max_tasks} 件の範囲に収めてください。不要なタスクは作成しないでください。
   - 直接回答モードの場合は `tasks` を空にし、plan_summary にはユーザーへの最終回答本文を入れてください（「回答します」だけで終わらせない）。
   - エージェントを使わずに回答できる場合（一般的な知識質問や現在日時のような確認など）は、このモードを選びます。
@@ -291,6 +463,13 @@ class MultiAgentOrchestrator:
         "住所",
         "電話番号",
     )
+    _LIFESTYLE_QUESTION_RE = re.compile(r"[?？]|教えて|とは|知りたい|方法|やり方|おすすめ|レシピ|どう|なぜ|何")
+    # Commands made only of punctuation, symbols or whitespace.
+    _NO_WORD_RE = re.compile(r"[\W_]+")
+    _SCHEDULER_DATETIME_RE = re.compile(
+        r"\d{4}-\d{1,2}-\d{1,2}|\d{1,2}/\d{1,2}|\d{1,2}月\d{1,2}日|\d{1,2}:\d{2}|\d{1,2}時"
+        r"|今日|明日|明後日|昨日|今週|来週|今月|来月"
+    )
 
     def __init__(self, llm_config: Dict[str, Any] | None = None) -> None:
         try:
@@ -335,6 +514,19 @@ class MultiAgentOrchestrator:
             raise OrchestratorError(f"LangGraph LLM の初期化に失敗しました: {exc}") from exc
 
         self._llm_config = resolved_config
+        # Incremental plans keyed by their planning context: (stored_at, plan state).
+        self._replan_cache: OrderedDict[tuple, tuple[float, OrchestratorState]] = OrderedDict()
+        # LLM actionability verdicts keyed by (agent, command): (stored_at, assessment).
+        self._actionability_cache: OrderedDict[tuple[str, str], tuple[float, Dict[str, str]]] = OrderedDict()
+        self.actionability_cache_stats = {"hits": 0, "misses": 0}
+        self._agent_handlers: Dict[str, Callable[[str, str], Awaitable[ExecutionResult]]] = {
+            "lifestyle": self._execute_lifestyle_task,
+            "browser": self._execute_browser_task,
+            "iot": self._execute_iot_task,
+            "scheduler": self._execute_scheduler_task,
+        }
+        # Schema-bound runnables built on first use; ``None`` marks a provider without support.
+        self._structured_llms: Dict[type[BaseModel], Any] = {}
         self._graph = self._build_graph()
 
     def _build_graph(self) -> Any:
@@ -352,6 +544,8 @@ class MultiAgentOrchestrator:
     def _run_async(coro):
         """Run an async coroutine from sync contexts."""
 
+        # The loop below is discarded afterwards, so its pooled HTTP client must be closed with it.
+        coro = _run_and_close_shared_async_client(coro)
         try:
             asyncio.get_running_loop()
         except RuntimeError:
@@ -386,7 +580,7 @@ class MultiAgentOrchestrator:
         return "execute" if tasks else "end"
 
     async def _review_node(self, state: OrchestratorState) -> OrchestratorState:
-        executions = list(state.get("executions") or [])
+        executions = state.get("executions") or []
         if not executions:
             return state
 
@@ -410,9 +604,7 @@ class MultiAgentOrchestrator:
         messages = [SystemMessage(content=prompt)]
 
         try:
-            response = await asyncio.to_thread(self._llm.invoke, messages)
-            review_text = self._extract_text(response)
-            review_data = self._parse_plan(review_text)
+            review_data = await self._invoke_structured(_ReviewSchema, messages)
         except (OrchestratorError, Exception) as exc:  # noqa: BLE001
             logging.warning("Review LLM call failed, defaulting to 'ok': %s", exc)
             review_data = {"review_status": "ok", "review_reason": "レビューに失敗したため自動承認されました。"}
@@ -431,7 +623,8 @@ class MultiAgentOrchestrator:
                 state["current_index"] = index  # Re-run the same task
             state["retry_counts"] = retry_counts
 
-        return {"executions": executions, **state}
+        # The verdict is recorded on the execution in place, so the state is returned as is.
+        return state
 
     def _execution_context_for_prompt(self, executions: List[ExecutionResult]) -> str:
         """Render completed execution results for the planner prompt."""
@@ -442,7 +635,7 @@ class MultiAgentOrchestrator:
             agent_label = self._AGENT_DISPLAY_NAMES.get(agent, agent)
             command = (item.get("command") or "").strip()
             status = item.get("status") or "unknown"
-            outcome = str(item.get("response") or item.get("error") or "").strip() or "結果なし"
+            outcome = _first_nonempty_stripped(item, "response", "error") or "結果なし"
             if len(outcome) > 300:
                 outcome = outcome[:300] + "..."
             header_bits = []
@@ -599,6 +792,16 @@ class MultiAgentOrchestrator:
             updated.append({**task, "command": updated_command})
         return updated
 
+    @staticmethod
+    def _task_key(item: Dict[str, Any]) -> tuple[Any, str]:
+        """Return the (agent, stripped command) pair used to match tasks with executions."""
+
+        agent = item.get("agent")
+        command = item.get("command") or ""
+        if isinstance(command, str) and (agent is None or isinstance(agent, str)):
+            return _normalised_task_key(agent, command)
+        return agent, str(command).strip()
+
     def _pending_tasks_for_prompt(
         self,
         tasks: List[TaskSpec],
@@ -606,21 +809,9 @@ class MultiAgentOrchestrator:
     ) -> List[TaskSpec]:
         if not tasks:
             return []
-        completed = {
-            (res.get("agent"), (res.get("command") or "").strip())
-            for res in executions
-            if res.get("status") == "success"
-        }
-        pending: List[TaskSpec] = []
-        for task in tasks:
-            if not isinstance(task, dict):
-                continue
-            agent = task.get("agent")
-            command = (task.get("command") or "").strip()
-            if (agent, command) in completed:
-                continue
-            pending.append(task)
-        return pending
+        task_key = self._task_key
+        completed = {task_key(res) for res in executions if res.get("status") == "success"}
+        return [task for task in tasks if isinstance(task, dict) and task_key(task) not in completed]
 
     def _tasks_context_for_prompt(self, tasks: List[TaskSpec]) -> str:
         lines: list[str] = []
@@ -631,13 +822,48 @@ class MultiAgentOrchestrator:
             lines.append(f"{idx}. [{agent_label}] {command}")
         return "\n".join(lines)
 
+    @staticmethod
+    async def _device_context_for_prompt(agent_connections: Dict[str, bool]) -> str | None:
+        if not agent_connections.get("iot"):
+            return None
+        try:
+            return await _fetch_iot_device_context()
+        except Exception as exc:  # noqa: BLE001 - best-effort enrichment
+            logging.info("Failed to fetch IoT device context for planner prompt: %s", exc)
+            return None
+
+    @staticmethod
+    def _memory_for_prompt() -> tuple[str, str]:
+        """Return the formatted (long-term, short-term) memory, or blanks when memory is off."""
+
+        if not load_memory_settings().get("enabled", True):
+            return "", ""
+
+        long_term_memory = ""
+        short_term_memory = ""
+        try:
+            long_term_memory = get_memory_manager("long_term_memory.json").get_formatted_memory()
+        except Exception as exc:
+            logging.warning("Failed to load long-term memory: %s", exc)
+
+        try:
+            short_term_memory = get_memory_manager("short_term_memory.json").get_formatted_memory()
+        except Exception as exc:
+            logging.warning("Failed to load short-term memory: %s", exc)
+        return long_term_memory, short_term_memory
+
     async def _plan_node(self, state: OrchestratorState, *, incremental: bool = False) -> OrchestratorState:
         user_input = state.get("user_input", "")
         if not user_input:
             raise OrchestratorError("オーケストレーターに渡された入力が空でした。")
 
         agent_connections = state.get("agent_connections") or load_agent_connections()
-        availability = await get_agent_availability()
+        # Agent health, IoT devices and memory files are independent, so fetch them together.
+        availability, device_context, (long_term_memory, short_term_memory) = await asyncio.gather(
+            get_agent_availability(),
+            self._device_context_for_prompt(agent_connections),
+            asyncio.to_thread(self._memory_for_prompt),
+        )
         enabled_agents = [
             agent for agent, enabled in agent_connections.items()
             if enabled and availability.get(agent, True)
@@ -654,38 +880,14 @@ class MultiAgentOrchestrator:
         previous_tasks: List[TaskSpec] = list(state.get("tasks") or [])
         pending_tasks = self._pending_tasks_for_prompt(previous_tasks, previous_executions)
 
-        device_context: str | None = None
-        if agent_connections.get("iot"):
-            try:
-                device_context = await _fetch_iot_device_context()
-            except Exception as exc:  # noqa: BLE001 - best-effort enrichment
-                logging.info("Failed to fetch IoT device context for planner prompt: %s", exc)
-
-        memory_settings = load_memory_settings()
-        memory_enabled = memory_settings.get("enabled", True)
-        long_term_memory = ""
-        short_term_memory = ""
-
-        if memory_enabled:
-            try:
-                lt_mgr = MemoryManager("long_term_memory.json")
-                long_term_memory = lt_mgr.get_formatted_memory()
-            except Exception as exc:
-                logging.warning("Failed to load long-term memory: %s", exc)
-                long_term_memory = ""
-
-            try:
-                st_mgr = MemoryManager("short_term_memory.json")
-                short_term_memory = st_mgr.get_formatted_memory()
-            except Exception as exc:
-                logging.warning("Failed to load short-term memory: %s", exc)
-                short_term_memory = ""
-
         history_for_prompt = state.get("session_history") or []
         if not history_for_prompt:
             history_for_prompt = self._history_from_last_user_turn(self._load_recent_chat_history(limit=20))
         history_entries = self._normalise_history_entries(history_for_prompt)
-        history_prompt = "\n".join([f"{msg['role']}: {msg['content']}" for msg in history_entries])
+        # The request itself goes last so every provider sees a user turn at the end.
+        current_turn = {"role": "user", "content": user_input}
+        if not history_entries or history_entries[-1] != current_turn:
+            history_entries.append(current_turn)
 
         prompt = self._planner_prompt(enabled_agents, disabled_agents, device_context)
         execution_context = self._execution_context_for_prompt(previous_executions)
@@ -710,8 +912,11 @@ class MultiAgentOrchestrator:
             prompt += "\n\nユーザーの特性:\n" + long_term_memory
         if short_term_memory:
             prompt += "\n\nユーザーの最近の動向:\n" + short_term_memory
-        prompt += "\n\n以下は直近の会話履歴です:\n" + history_prompt
-        messages = [SystemMessage(content=prompt), HumanMessage(content=user_input)]
+        history_summary = state.get("session_history_summary")
+        if history_summary:
+            prompt += "\n\n(これより前のやり取りの要約)\n" + history_summary
+        prompt += "\n\n直近の会話履歴は続くメッセージのとおりです。"
+        messages = [SystemMessage(content=prompt), *self._history_messages(history_entries)]
 
         plan_data: Dict[str, Any] | None = None
         last_plan_text: str | None = None
@@ -735,30 +940,27 @@ class MultiAgentOrchestrator:
                     raise OrchestratorError(f"プラン生成に失敗しました: {exc}") from exc
 
         raw_tasks = plan_data.get("tasks")
-        tasks = self._normalise_tasks(raw_tasks, allowed_agents=enabled_agents)
-        plan_summary = str(plan_data.get("plan_summary") or plan_data.get("plan") or "").strip()
+        tasks, skipped_agents = self._normalise_tasks(
+            raw_tasks, allowed_agents=enabled_agents, disabled_agents=disabled_agents
+        )
+        plan_summary = _first_nonempty_stripped(plan_data, "plan_summary", "plan")
         if incremental and pending_tasks and not tasks:
             logging.warning("Planner returned no tasks despite pending tasks; continuing with pending tasks.")
             tasks = pending_tasks
             if not plan_summary or plan_summary == previous_plan_summary:
                 plan_summary = "未完了のタスクがあるため継続します。"
             plan_data["tasks"] = tasks
-        skipped_agents: set[str] = set()
-        if isinstance(raw_tasks, Iterable):
-            for item in raw_tasks:
-                if not isinstance(item, dict):
-                    continue
-                agent_raw = str(item.get("agent") or "").strip().lower()
-                canonical = self._AGENT_ALIASES.get(agent_raw)
-                if canonical and canonical in disabled_agents:
-                    skipped_agents.add(canonical)
         notices: list[str] = []
         if skipped_agents:
-            skipped_labels = [self._AGENT_DISPLAY_NAMES.get(agent, agent) for agent in sorted(skipped_agents)]
-            notices.append("接続がオフのため次のエージェントタスクをスキップしました: " + ", ".join(skipped_labels))
+            notices.append(
+                "接続がオフのため次のエージェントタスクをスキップしました: "
+                + self._agent_labels(tuple(sorted(skipped_agents)))
+            )
         if disconnected_agents:
-            disconnected_labels = [self._AGENT_DISPLAY_NAMES.get(agent, agent) for agent in sorted(disconnected_agents)]
-            notices.append("接続できないため次のエージェントは使用しません: " + ", ".join(disconnected_labels))
+            notices.append(
+                "接続できないため次のエージェントは使用しません: "
+                + self._agent_labels(tuple(sorted(disconnected_agents)))
+            )
         if notices:
             notice_text = "\n".join(notices)
             plan_summary = f"{plan_summary}\n\n{notice_text}" if plan_summary else notice_text
@@ -774,12 +976,70 @@ class MultiAgentOrchestrator:
             "agent_connections": agent_connections,
         }
 
+    @staticmethod
+    def _session_history_digest(replan_input: OrchestratorState) -> bytes:
+        """Digest of the session history and its summary, which the planner prompt includes."""
+
+        digest = hashlib.blake2b(digest_size=16)
+        for entry in replan_input.get("session_history") or []:
+            if isinstance(entry, dict):
+                digest.update(str(entry.get("role") or "").encode("utf-8") + b"\0")
+                digest.update(str(entry.get("content") or "").encode("utf-8") + b"\0")
+            digest.update(b"\1")
+        digest.update(str(replan_input.get("session_history_summary") or "").encode("utf-8"))
+        return digest.digest()
+
+    @classmethod
+    def _replan_cache_key(cls, replan_input: OrchestratorState) -> tuple:
+        """Return a hashable signature of the per-run inputs the incremental planner depends on.
+
+        Covers the request, previous plan, executions, remaining tasks, agent connections and
+        the session history. User memory is shared by every session and is bounded by the TTL.
+        """
+
+        executions = replan_input.get("executions") or []
+        tasks = replan_input.get("tasks") or []
+        connections = replan_input.get("agent_connections") or {}
+        task_key = cls._task_key
+        return (
+            replan_input.get("user_input") or "",
+            replan_input.get("plan_summary") or "",
+            tuple((*task_key(res), res.get("status"), res.get("response") or res.get("error")) for res in executions),
+            tuple(task_key(task) for task in tasks),
+            tuple(sorted(connections.items())),
+            cls._session_history_digest(replan_input),
+        )
+
+    async def _replan(self, replan_input: OrchestratorState) -> OrchestratorState:
+        """Run an incremental plan, reusing a recent plan for an identical context."""
+
+        if ORCHESTRATOR_REPLAN_CACHE_TTL <= 0:
+            return await self._plan_node(replan_input, incremental=True)
+
+        key = self._replan_cache_key(replan_input)
+        now = time.monotonic()
+        cached = self._replan_cache.get(key)
+        if cached is not None and now - cached[0] <= ORCHESTRATOR_REPLAN_CACHE_TTL:
+            self._replan_cache.move_to_end(key)
+            plan_state = copy.deepcopy(cached[1])
+        else:
+            plan_state = await self._plan_node(replan_input, incremental=True)
+            stored = {k: v for k, v in plan_state.items() if k not in {"executions", "agent_connections"}}
+            self._replan_cache[key] = (now, cast(OrchestratorState, copy.deepcopy(stored)))
+            self._replan_cache.move_to_end(key)
+            while len(self._replan_cache) > self._REPLAN_CACHE_SIZE:
+                self._replan_cache.popitem(last=False)
+
+        plan_state["executions"] = replan_input.get("executions") or []
+        plan_state["agent_connections"] = replan_input.get("agent_connections") or {}
+        return plan_state
+
     async def _execute_node(self, state: OrchestratorState) -> OrchestratorState:
-        tasks = list(state.get("tasks") or [])
-        tasks = self._apply_execution_results_to_tasks(tasks, list(state.get("executions") or []))
+        # One copy: the graph state keeps its own list and this node returns the extended one.
+        executions = list(state.get("executions") or [])
+        tasks = self._apply_execution_results_to_tasks(state.get("tasks") or [], executions)
         state["tasks"] = tasks
         index = state.get("current_index", 0)
-        executions = list(state.get("executions") or [])
 
         if index >= len(tasks):
             return {"executions": executions, "current_index": index}
@@ -790,6 +1050,69 @@ class MultiAgentOrchestrator:
 
         return {"executions": executions, "current_index": index + 1, "tasks": tasks}
 
+    def _structured_llm(self, schema: type[BaseModel]) -> Any:
+        """Return ``self._llm`` bound to ``schema`` via tool calling, or ``None`` if unsupported."""
+
+        if schema in self._structured_llms:
+            return self._structured_llms[schema]
+        runnable = None
+        binder = getattr(self._llm, "with_structured_output", None)
+        if binder is not None:
+            try:
+                runnable = binder(schema, method="function_calling", include_raw=True)
+            except Exception as exc:  # noqa: BLE001 - fall back to free-form JSON
+                logging.debug("Structured output unavailable for %s: %s", schema.__name__, exc)
+        self._structured_llms[schema] = runnable
+        return runnable
+
+    def _structured_data(self, response: Any) -> Dict[str, Any]:
+        """Return the verdict dict from a structured or plain-text LLM response."""
+
+        if isinstance(response, dict) and "raw" in response and "parsed" in response:
+            parsed = response["parsed"]
+            if isinstance(parsed, BaseModel):
+                return parsed.model_dump()
+            if isinstance(parsed, dict):
+                return parsed
+            # The model answered in prose instead of calling the schema tool.
+            response = response["raw"]
+        return self._parse_plan(self._extract_text(response))
+
+    async def _invoke_structured(self, schema: type[BaseModel], messages: List[Any]) -> Dict[str, Any]:
+        """Invoke the LLM for a JSON verdict, preferring the provider's structured output."""
+
+        runnable = self._structured_llm(schema)
+        if runnable is not None:
+            try:
+                response = await asyncio.to_thread(runnable.invoke, messages)
+            except Exception as exc:  # noqa: BLE001
+                # Only a refusal of the call itself disables structured output; transient
+                # failures fall back to plain JSON for this call and keep the binding.
+                if _structured_output_unsupported(exc):
+                    self._structured_llms[schema] = None
+                logging.info("Structured output failed for %s, using plain JSON: %s", schema.__name__, exc)
+            else:
+                try:
+                    return self._structured_data(response)
+                except Exception as exc:  # noqa: BLE001
+                    # The model answered in unparseable prose; retry this call as plain JSON.
+                    logging.info("Structured response for %s was not parseable: %s", schema.__name__, exc)
+        return self._structured_data(await asyncio.to_thread(self._llm.invoke, messages))
+
+    async def _batch_structured(self, schema: type[BaseModel], batch_messages: List[List[Any]]) -> List[Any]:
+        """Batch variant of ``_invoke_structured``; failed items are returned as exceptions."""
+
+        config = {"max_concurrency": 5}
+        runnable = self._structured_llm(schema)
+        if runnable is not None:
+            responses = await asyncio.to_thread(runnable.batch, batch_messages, config=config, return_exceptions=True)
+            if not all(isinstance(response, Exception) for response in responses):
+                return responses
+            logging.info("Structured output failed for %s, using plain JSON: %s", schema.__name__, responses[0])
+            if any(_structured_output_unsupported(response) for response in responses):
+                self._structured_llms[schema] = None
+        return await asyncio.to_thread(self._llm.batch, batch_messages, config=config, return_exceptions=True)
+
     def _extract_text(self, content: Any) -> str:
         if content is None:
             return ""
@@ -838,13 +1161,13 @@ class MultiAgentOrchestrator:
             if not isinstance(text, str) or not text.strip():
                 return None
             try:
-                return json.loads(text)
+                return json_loads(text)
             except json.JSONDecodeError:
                 pass
             # Try removing trailing commas
             try:
-                sanitized = re.sub(r",\s*([\]}])", r"\1", text)
-                return json.loads(sanitized)
+                sanitized = self._TRAILING_COMMA_RE.sub(r"\1", text)
+                return json_loads(sanitized)
             except json.JSONDecodeError:
                 pass
             # Handle Python-style dicts with single quotes
@@ -894,9 +1217,9 @@ class MultiAgentOrchestrator:
         # Heuristic 3: plan_summary/tasks が含まれるが JSON でない場合は、キーと値を簡易抽出して補完
         if "plan_summary" in raw_str and "tasks" in raw_str:
             try:
-                ps_match = re.search(r'"plan_summary"\\s*:\\s*"([^"]+)"', raw_str)
+                ps_match = self._PLAN_SUMMARY_FIELD_RE.search(raw_str)
                 plan_summary = ps_match.group(1).strip() if ps_match else raw_str
-                tasks_match = re.search(r'"tasks"\\s*:\\s*(\\[.*?\\])', raw_str)
+                tasks_match = self._TASKS_FIELD_RE.search(raw_str)
                 tasks_str = tasks_match.group(1) if tasks_match else "[]"
                 tasks = try_parse(tasks_str) if tasks_str else []
                 if not isinstance(tasks, list):
@@ -906,8 +1229,7 @@ class MultiAgentOrchestrator:
                 pass
 
         # Attempt 2: Extract from Markdown code blocks
-        code_block_pattern = r"```(?:json)?\s*(.*?)\s*```"
-        match = re.search(code_block_pattern, raw_str, re.DOTALL)
+        match = self._CODE_BLOCK_RE.search(raw_str)
         if match:
             block_content = match.group(1)
             parsed = try_parse(block_content)
@@ -915,18 +1237,16 @@ class MultiAgentOrchestrator:
                 return parsed
             
             # Try finding braces inside the block
-            brace_pattern = r"(\{.*\})"
-            brace_match = re.search(brace_pattern, block_content, re.DOTALL)
+            brace_match = self._JSON_OBJECT_RE.search(block_content)
             if brace_match:
-                parsed = try_parse(brace_match.group(1))
+                parsed = try_parse(brace_match.group(0))
                 if isinstance(parsed, dict):
                     return parsed
 
         # Attempt 3: Extract from first '{' to last '}' in the whole text
-        brace_pattern = r"(\{.*\})"
-        match = re.search(brace_pattern, raw_str, re.DOTALL)
+        match = self._JSON_OBJECT_RE.search(raw_str)
         if match:
-            parsed = try_parse(match.group(1))
+            parsed = try_parse(match.group(0))
             if isinstance(parsed, dict):
                 return parsed
 
@@ -934,17 +1254,31 @@ class MultiAgentOrchestrator:
         logging.error(f"JSON Parse Failed. Raw output:\n{raw_str}")
         raise OrchestratorError("プラン応答の JSON 解析に失敗しました。")
 
-    def _planner_prompt(self, enabled_agents: List[str], disabled_agents: List[str], device_context: str | None) -> str:
-        prompt = self._PLANNER_PROMPT.format(
+    @classmethod
+    @lru_cache(maxsize=16)
+    def _planner_prompt_prefix(cls, enabled_agents: frozenset[str]) -> str:
+        """Return the static planner instructions describing only ``enabled_agents``, formatted once per subset."""
+
+        sections = "".join(
+            section for agent, section in cls._PLANNER_AGENT_SECTIONS.items() if agent in enabled_agents
+        )
+        return cls._PLANNER_PROMPT.format(
             max_tasks=ORCHESTRATOR_MAX_TASKS,
-            current_datetime=_current_datetime_line(),
+            agent_sections=sections or "  - （現在利用できるエージェントはありません）\n",
         )
-        enabled_labels = [self._AGENT_DISPLAY_NAMES.get(key, key) for key in enabled_agents]
-        if enabled_labels:
-            prompt += "\n\n現在利用可能なエージェント: " + ", ".join(enabled_labels)
+
+    @classmethod
+    @lru_cache(maxsize=64)
+    def _agent_labels(cls, agents: tuple[str, ...]) -> str:
+        return ", ".join(cls._AGENT_DISPLAY_NAMES.get(key, key) for key in agents)
+
+    def _planner_prompt(self, enabled_agents: List[str], disabled_agents: List[str], device_context: str | None) -> str:
+        # Static instructions first, then everything that varies per request.
+        prompt = self._planner_prompt_prefix(frozenset(enabled_agents)) + "\n" + _current_datetime_line()
+        if enabled_agents:
+            prompt += "\n\n現在利用可能なエージェント: " + self._agent_labels(tuple(enabled_agents))
         if disabled_agents:
-            disabled_labels = [self._AGENT_DISPLAY_NAMES.get(key, key) for key in disabled_agents]
-            prompt += "\n\n現在接続がオフのエージェント: " + ", ".join(disabled_labels)
+            prompt += "\n\n現在接続がオフのエージェント: " + self._agent_labels(tuple(disabled_agents))
             prompt += "。これらのエージェントを使うタスクは生成せず、必要なら他の手段で回答してください。"
         else:
             prompt += "\n\nすべてのエージェントが利用可能です。"
@@ -952,28 +1286,68 @@ class MultiAgentOrchestrator:
             prompt += "\n\n利用可能なIoTデバイス情報:\n" + (device_context or "No devices are currently registered.")
         return prompt
 
-    def _normalise_tasks(self, raw_tasks: Any, *, allowed_agents: Iterable[str] | None = None) -> List[TaskSpec]:
+    @staticmethod
+    def _parallel_batch(tasks: List[TaskSpec], start: int) -> List[int]:
+        """Return the indices to run together from ``start``: the consecutive run of tasks the
+        planner marked as independent, or just ``start`` itself.
+
+        Browser tasks stream progress events and always run on their own.
+        """
+
+        batch = [start]
+        if not tasks[start].get("parallel") or tasks[start].get("agent") == "browser":
+            return batch
+        for idx in range(start + 1, len(tasks)):
+            task = tasks[idx]
+            if not task.get("parallel") or task.get("agent") == "browser":
+                break
+            batch.append(idx)
+        return batch
+
+    def _normalise_tasks(
+        self,
+        raw_tasks: Any,
+        *,
+        allowed_agents: Iterable[str] | None = None,
+        disabled_agents: Iterable[str] = (),
+    ) -> tuple[List[TaskSpec], set[str]]:
+        """Return the usable tasks and the disabled agents the planner still asked for."""
+
         tasks: List[TaskSpec] = []
-        allowed = set(allowed_agents) if allowed_agents is not None else None
+        skipped_agents: set[str] = set()
         if not isinstance(raw_tasks, Iterable):
-            return tasks
+            return tasks, skipped_agents
+        allowed = frozenset(allowed_agents) if allowed_agents is not None else None
+        disabled = frozenset(disabled_agents)
+        aliases = self._AGENT_ALIASES
 
         for item in raw_tasks:
             if not isinstance(item, dict):
                 continue
-            agent_raw = str(item.get("agent") or "").strip().lower()
-            command = str(item.get("command") or "").strip()
-            if not agent_raw or not command:
-                continue
-            agent = self._AGENT_ALIASES.get(agent_raw)
+            agent_raw = item.get("agent")
+            # Planners almost always emit the canonical lowercase name; normalise only on a miss.
+            agent = aliases.get(agent_raw) if isinstance(agent_raw, str) else None
+            if agent is None:
+                agent = aliases.get(str(agent_raw or "").strip().lower())
             if not agent:
                 continue
+            if agent in disabled:
+                skipped_agents.add(agent)
+            if len(tasks) >= ORCHESTRATOR_MAX_TASKS:
+                if not disabled:
+                    break
+                # Keep scanning only to report every skipped agent.
+                continue
             if allowed is not None and agent not in allowed:
                 continue
-            tasks.append({"agent": agent, "command": command})
-            if len(tasks) >= ORCHESTRATOR_MAX_TASKS:
-                break
-        return tasks
+            command = str(item.get("command") or "").strip()
+            if not command:
+                continue
+            task: TaskSpec = {"agent": agent, "command": command}
+            if item.get("parallel") is True:
+                task["parallel"] = True
+            tasks.append(task)
+        return tasks, skipped_agents
 
     @staticmethod
     def _has_browser_final_marker(text: str) -> bool:
@@ -1017,32 +1391,33 @@ class MultiAgentOrchestrator:
         last_seen = since_id if isinstance(since_id, int) else -1
         latest_summary = ""
 
-        async with httpx.AsyncClient(timeout=_browser_agent_timeout(10.0)) as client:
-            while time.monotonic() < deadline:
-                try:
-                    response = await client.get(history_url)
-                    if not response.is_success:
-                        break
-                    data = response.json()
-                except Exception as exc:  # noqa: BLE001
-                    logging.debug("Browser history poll failed: %s", exc)
-                    await asyncio.sleep(interval)
-                    continue
+        client = _get_shared_async_client()
+        history_timeout = _browser_agent_timeout(10.0)
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get(history_url, timeout=history_timeout)
+                if not response.is_success:
+                    break
+                data = json_loads(response.content)
+            except Exception as exc:  # noqa: BLE001
+                logging.debug("Browser history poll failed: %s", exc)
+                await asyncio.sleep(interval)
+                continue
 
-                messages = data.get("messages") if isinstance(data, dict) else None
-                summary = self._summarise_browser_messages(messages)
-                latest_id = self._latest_message_id(messages)
+            messages = data.get("messages") if isinstance(data, dict) else None
+            summary = self._summarise_browser_messages(messages)
+            latest_id = self._latest_message_id(messages)
 
-                if summary:
-                    if self._has_browser_final_marker(summary):
-                        return summary
-                    if latest_id > last_seen or summary != latest_summary:
-                        latest_summary = summary
+            if summary:
+                if self._has_browser_final_marker(summary):
+                    return summary
+                if latest_id > last_seen or summary != latest_summary:
+                    latest_summary = summary
 
-                if latest_id > last_seen:
-                    last_seen = latest_id
+            if latest_id > last_seen:
+                last_seen = latest_id
 
-                await asyncio.sleep(interval)
+            await asyncio.sleep(interval)
 
         # Timed out without a final marker; return the latest summary we observed (if any).
         return latest_summary
@@ -1052,11 +1427,12 @@ class MultiAgentOrchestrator:
 
         history_url = _build_browser_agent_url(base, "/api/history")
         try:
-            async with httpx.AsyncClient(timeout=_browser_agent_timeout(10.0)) as client:
-                response = await client.get(history_url)
-                if not response.is_success:
-                    return -1, ""
-                data = response.json()
+            response = await _get_shared_async_client().get(
+                history_url, timeout=_browser_agent_timeout(10.0)
+            )
+            if not response.is_success:
+                return -1, ""
+            data = json_loads(response.content)
         except Exception:  # noqa: BLE001 - best effort
             return -1, ""
 
@@ -1240,14 +1616,33 @@ class MultiAgentOrchestrator:
         lowered = command.lower()
         return any(keyword in lowered or keyword in command for keyword in self._BROWSER_RISK_KEYWORDS)
 
-    async def _assess_actionability(self, task: TaskSpec) -> Dict[str, str]:
-        """Ask the LLM whether the given task is actionable for the target agent."""
+    def _is_trivially_actionable(self, agent: str, command: str) -> bool:
+        """Return True when the task can run without asking the LLM for an actionability check."""
+
+        if agent == "lifestyle":
+            # Plain Q&A has no irreversible side effects, so a clear question is always runnable.
+            return bool(self._LIFESTYLE_QUESTION_RE.search(command))
+        if agent == "iot":
+            return self._iot_action_is_clear(command)
+        if agent == "browser":
+            # A browser needs_info verdict is overridden unless the action is high risk,
+            # so the LLM round-trip only matters for high-risk commands.
+            return not self._browser_action_is_high_risk(command)
+        if agent == "scheduler":
+            return bool(self._SCHEDULER_DATETIME_RE.search(command))
+        return False
+
+    async def _actionability_precheck(self, task: TaskSpec) -> Dict[str, str] | None:
+        """Return an assessment decided without the LLM, or ``None`` when it must be asked."""
 
         agent = task.get("agent")
         command = str(task.get("command") or "").strip()
-        if not agent or not command:
+        if not agent or not command or self._NO_WORD_RE.fullmatch(command):
             return {"status": "needs_info", "message": "実行コマンドが空です。もう一度入力してください。"}
 
+        if self._is_trivially_actionable(agent, command):
+            return {"status": "ok", "message": ""}
+
         if agent == "iot":
             # IoT は「迷いなく実行」を優先。デバイスが複数でも基本は実行に進む。
             try:
@@ -1256,11 +1651,34 @@ class MultiAgentOrchestrator:
                 logging.debug("Failed to count IoT devices for actionability check: %s", exc)
                 device_count = None
 
-            if self._iot_action_is_clear(command):
-                return {"status": "ok", "message": ""}
             if device_count is None or device_count >= 1:
                 return {"status": "ok", "message": ""}
+        return self._cached_actionability(agent, command)
+
+    def _cached_actionability(self, agent: str, command: str) -> Dict[str, str] | None:
+        """Return a recent LLM verdict for the same agent and command, if any."""
 
+        if ORCHESTRATOR_ACTIONABILITY_CACHE_TTL <= 0:
+            return None
+        key = (agent, command)
+        cached = self._actionability_cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] <= ORCHESTRATOR_ACTIONABILITY_CACHE_TTL:
+            self._actionability_cache.move_to_end(key)
+            self.actionability_cache_stats["hits"] += 1
+            return dict(cached[1])
+        self.actionability_cache_stats["misses"] += 1
+        return None
+
+    def _store_actionability(self, agent: str, command: str, assessment: Dict[str, str]) -> None:
+        if ORCHESTRATOR_ACTIONABILITY_CACHE_TTL <= 0:
+            return
+        key = (agent, command)
+        self._actionability_cache[key] = (time.monotonic(), dict(assessment))
+        self._actionability_cache.move_to_end(key)
+        while len(self._actionability_cache) > self._ACTIONABILITY_CACHE_SIZE:
+            self._actionability_cache.popitem(last=False)
+
+    def _actionability_messages(self, agent: str, command: str) -> List[Any]:
         agent_name = self._AGENT_DISPLAY_NAMES.get(agent, agent)
         capability = self._AGENT_CAPABILITIES.get(agent, "")
         prompt = self._ACTIONABILITY_PROMPT.format(
@@ -1268,19 +1686,20 @@ class MultiAgentOrchestrator:
             agent_capability=capability,
             command=command,
         )
-        messages = [
+        return [
             SystemMessage(content=prompt),
             HumanMessage(content="上記のタスクの実行可能性を判定してJSONで回答してください。"),
         ]
 
+    def _actionability_from_response(self, agent: str, command: str, response: Any) -> Dict[str, str]:
         try:
-            response = await asyncio.to_thread(self._llm.invoke, messages)
-            text = self._extract_text(response)
-            data = self._parse_plan(text)
+            data = self._structured_data(response)
         except Exception as exc:  # noqa: BLE001
             logging.warning("Actionability check failed for %s: %s", agent, exc)
             return {"status": "ok"}
+        return self._actionability_from_data(agent, command, data)
 
+    def _actionability_from_data(self, agent: str, command: str, data: Dict[str, Any]) -> Dict[str, str]:
         status = str(data.get("status") or "").strip().lower()
         message = str(data.get("message") or "").strip()
         if agent == "browser" and status == "needs_info" and not self._browser_action_is_high_risk(command):
@@ -1288,12 +1707,61 @@ class MultiAgentOrchestrator:
             message = ""
         if status not in {"ok", "needs_info"}:
             status = "ok"
-        return {"status": status, "message": message}
+        assessment = {"status": status, "message": message}
+        self._store_actionability(agent, command, assessment)
+        return assessment
+
+    async def _assess_actionability(self, task: TaskSpec) -> Dict[str, str]:
+        """Ask the LLM whether the given task is actionable for the target agent."""
+
+        assessment = await self._actionability_precheck(task)
+        if assessment is not None:
+            return assessment
+
+        agent = task["agent"]
+        command = str(task.get("command") or "").strip()
+        try:
+            data = await self._invoke_structured(_ActionabilitySchema, self._actionability_messages(agent, command))
+        except Exception as exc:  # noqa: BLE001
+            logging.warning("Actionability check failed for %s: %s", agent, exc)
+            return {"status": "ok"}
+        return self._actionability_from_data(agent, command, data)
+
+    async def _assess_actionability_many(self, tasks: List[TaskSpec]) -> List[Dict[str, str]]:
+        """Assess several tasks, sending the ones that need the LLM as a single batch."""
 
-    async def _maybe_request_clarification(self, task: TaskSpec) -> ExecutionResult | None:
+        assessments: List[Dict[str, str] | None] = list(
+            await asyncio.gather(*(self._actionability_precheck(task) for task in tasks))
+        )
+        pending = [idx for idx, assessment in enumerate(assessments) if assessment is None]
+        if pending:
+            commands = [str(tasks[idx].get("command") or "").strip() for idx in pending]
+            batch_messages = [
+                self._actionability_messages(tasks[idx]["agent"], command) for idx, command in zip(pending, commands)
+            ]
+            try:
+                responses = await self._batch_structured(_ActionabilitySchema, batch_messages)
+            except Exception as exc:  # noqa: BLE001
+                logging.warning("Batched actionability check failed: %s", exc)
+                responses = [exc] * len(pending)
+            for idx, command, response in zip(pending, commands, responses):
+                agent = tasks[idx]["agent"]
+                if isinstance(response, Exception):
+                    logging.warning("Actionability check failed for %s: %s", agent, response)
+                    assessments[idx] = {"status": "ok"}
+                else:
+                    assessments[idx] = self._actionability_from_response(agent, command, response)
+        return cast(List[Dict[str, str]], assessments)
+
+    async def _maybe_request_clarification(
+        self,
+        task: TaskSpec,
+        assessment: Dict[str, str] | None = None,
+    ) -> ExecutionResult | None:
         """Return a clarification result when the task is not actionable."""
 
-        assessment = await self._assess_actionability(task)
+        if assessment is None:
+            assessment = await self._assess_actionability(task)
         if assessment.get("status") != "needs_info":
             return None
 
@@ -1309,12 +1777,12 @@ class MultiAgentOrchestrator:
             "finalized": True,
         }
 
-    async def _execute_task(self, task: TaskSpec) -> ExecutionResult:
+    async def _execute_task(self, task: TaskSpec, *, assessment: Dict[str, str] | None = None) -> ExecutionResult:
         agent = task["agent"]
         command = task["command"]
 
         try:
-            clarification = await self._maybe_request_clarification(task)
+            clarification = await self._maybe_request_clarification(task, assessment)
             if clarification is not None:
                 return clarification
 
@@ -1330,68 +1798,9 @@ class MultiAgentOrchestrator:
                     "finalized": True,
                 }
 
-            if agent == "lifestyle":
-                try:
-                    data = await _call_lifestyle("/agent_rag_answer", method="POST", payload={"question": command})
-                except LifestyleAPIError as exc:
-                    return self._execution_error_result(agent, command, exc)
-                answer = str(data.get("answer") or "").strip() or "Life-Styleエージェントから回答が得られませんでした。"
-                return {
-                    "agent": agent,
-                    "command": command,
-                    "status": "success",
-                    "response": answer,
-                    "error": None,
-                }
-
-            if agent == "browser":
-                try:
-                    data = await _call_browser_agent_chat(command)
-                except BrowserAgentError as exc:
-                    return self._browser_error_result(command, exc)
-                # agent-relay returns synchronous results, no need for additional polling
-                result = self._browser_result_from_payload(command, data, fallback_summary="")
-                if self._browser_result_is_failure(result):
-                    fallback_command = self._browser_fallback_command(command)
-                    if fallback_command:
-                        try:
-                            fallback_data = await _call_browser_agent_chat(fallback_command)
-                        except BrowserAgentError as exc:
-                            return self._browser_error_result(fallback_command, exc)
-                        result = self._browser_result_from_payload(fallback_command, fallback_data, fallback_summary="")
-                return result
-
-            if agent == "iot":
-                try:
-                    data = await _call_iot_agent_command(command)
-                except IotAgentError as exc:
-                    return self._execution_error_result(agent, command, exc)
-                reply = str(data.get("reply") or "").strip()
-                if not reply:
-                    reply = "IoT エージェントからの応答が空でした。"
-                return {
-                    "agent": agent,
-                    "command": command,
-                    "status": "success",
-                    "response": reply,
-                    "error": None,
-                }
-
-            if agent == "scheduler":
-                try:
-                    data = await _call_scheduler_agent_chat(command)
-                except SchedulerAgentError as exc:
-                    return self._execution_error_result(agent, command, exc)
-                reply = str(data.get("reply") or data.get("message") or "").strip()
-                if not reply:
-                    reply = "Scheduler エージェントからの応答が空でした。"
-                return {
-                    "agent": agent,
-                    "command": command,
-                    "status": "success",
-                    "response": reply,
-                    "error": None,
-                }
+            handler = self._agent_handlers.get(agent)
+            if handler is not None:
+                return await handler(agent, command)
 
             return {
                 "agent": agent,
@@ -1404,6 +1813,69 @@ class MultiAgentOrchestrator:
             logging.exception("Unexpected error while executing %s task: %s", agent, exc)
             return self._execution_error_result(agent, command, exc)
 
+    async def _execute_lifestyle_task(self, agent: str, command: str) -> ExecutionResult:
+        try:
+            data = await _call_lifestyle("/agent_rag_answer", method="POST", payload={"question": command})
+        except LifestyleAPIError as exc:
+            return self._execution_error_result(agent, command, exc)
+        answer = str(data.get("answer") or "").strip() or "Life-Styleエージェントから回答が得られませんでした。"
+        return {
+            "agent": agent,
+            "command": command,
+            "status": "success",
+            "response": answer,
+            "error": None,
+        }
+
+    async def _execute_browser_task(self, agent: str, command: str) -> ExecutionResult:
+        try:
+            data = await _call_browser_agent_chat(command)
+        except BrowserAgentError as exc:
+            return self._browser_error_result(command, exc)
+        # agent-relay returns synchronous results, no need for additional polling
+        result = self._browser_result_from_payload(command, data, fallback_summary="")
+        if self._browser_result_is_failure(result):
+            fallback_command = self._browser_fallback_command(command)
+            if fallback_command:
+                try:
+                    fallback_data = await _call_browser_agent_chat(fallback_command)
+                except BrowserAgentError as exc:
+                    return self._browser_error_result(fallback_command, exc)
+                result = self._browser_result_from_payload(fallback_command, fallback_data, fallback_summary="")
+        return result
+
+    async def _execute_iot_task(self, agent: str, command: str) -> ExecutionResult:
+        try:
+            data = await _call_iot_agent_command(command)
+        except IotAgentError as exc:
+            return self._execution_error_result(agent, command, exc)
+        reply = str(data.get("reply") or "").strip()
+        if not reply:
+            reply = "IoT エージェントからの応答が空でした。"
+        return {
+            "agent": agent,
+            "command": command,
+            "status": "success",
+            "response": reply,
+            "error": None,
+        }
+
+    async def _execute_scheduler_task(self, agent: str, command: str) -> ExecutionResult:
+        try:
+            data = await _call_scheduler_agent_chat(command)
+        except SchedulerAgentError as exc:
+            return self._execution_error_result(agent, command, exc)
+        reply = _first_nonempty_stripped(data, "reply", "message")
+        if not reply:
+            reply = "Scheduler エージェントからの応答が空でした。"
+        return {
+            "agent": agent,
+            "command": command,
+            "status": "success",
+            "response": reply,
+            "error": None,
+        }
+
     async def _execute_browser_task_with_progress(self, task: TaskSpec) -> AsyncIterator[Dict[str, Any]]:
         command = task["command"]
         try:
@@ -1514,96 +1986,95 @@ class MultiAgentOrchestrator:
         base: str,
         command: str,
     ) -> AsyncIterator[Dict[str, Any]]:
-        event_queue: "asyncio.Queue[Dict[str, Any]]" = asyncio.Queue()
+        # Single consumer in the same event loop: a deque plus a wake-up event is enough.
+        pending_events: Deque[_BrowserWorkerEvent] = deque()
+        events_ready = asyncio.Event()
         stop_event = asyncio.Event()
-        stream_ready = asyncio.Event()
-        stream_status: Dict[str, Any] = {"ok": False, "error": None}
+        stream_init_timeout = min(BROWSER_AGENT_CONNECT_TIMEOUT or 10.0, 6.0)
 
         stream_url = _build_browser_agent_url(base, "/api/stream")
         chat_url = _build_browser_agent_url(base, "/api/chat")
         baseline_last_id, baseline_summary = await self._fetch_browser_history_snapshot(base)
 
+        # The stream and chat workers share the pooled keep-alive client.
+        client = _get_shared_async_client()
+
+        def _emit(kind: str, payload: Any = None) -> None:
+            pending_events.append(_BrowserWorkerEvent(kind, payload))
+            events_ready.set()
+
         async def _stream_worker() -> None:
             try:
-                async with httpx.AsyncClient(timeout=_browser_agent_timeout(BROWSER_AGENT_STREAM_TIMEOUT)) as client:
-                    async with client.stream("GET", stream_url) as response:
+                # Only connecting is bounded; once headers arrive the stream may stay open as long as needed.
+                async with asyncio.timeout(stream_init_timeout) as connect_deadline:
+                    async with client.stream(
+                        "GET",
+                        stream_url,
+                        timeout=_browser_agent_timeout(BROWSER_AGENT_STREAM_TIMEOUT),
+                    ) as response:
+                        connect_deadline.reschedule(None)
                         if not response.is_success:
-                            stream_status["error"] = BrowserAgentError(
-                                _extract_browser_error_message(
-                                    response,
-                                    "ブラウザエージェントのイベントストリームへの接続に失敗しました。",
+                            _emit(
+                                "stream_error",
+                                BrowserAgentError(
+                                    _extract_browser_error_message(
+                                        response,
+                                        "ブラウザエージェントのイベントストリームへの接続に失敗しました。",
+                                    ),
+                                    status_code=response.status_code,
                                 ),
-                                status_code=response.status_code,
                             )
-                            stream_ready.set()
-                            await event_queue.put({"kind": "stream_error", "error": stream_status["error"]})
                             return
 
-                        stream_status["ok"] = True
-                        stream_ready.set()
-
-                        event_type = "message"
-                        data_lines: list[str] = []
-                        async for raw_line in response.aiter_lines():
-                            if stop_event.is_set():
-                                break
-                            if raw_line == "":
-                                if data_lines:
-                                    data_text = "\n".join(data_lines)
-                                    await event_queue.put(
-                                        {"kind": "stream_data", "event": event_type, "data": data_text}
-                                    )
-                                    data_lines = []
-                                    event_type = "message"
-                                continue
-                            if raw_line.startswith(":"):
-                                continue
-                            if raw_line.startswith("event:"):
-                                event_type = raw_line[6:].strip() or "message"
-                            elif raw_line.startswith("data:"):
-                                data_lines.append(raw_line[5:].lstrip())
+                        async with aclosing(_iter_sse_frames(response.aiter_bytes())) as frames:
+                            async for event_type, data in frames:
+                                if stop_event.is_set():
+                                    break
+                                _emit("stream_data", data)
+            except TimeoutError:
+                _emit(
+                    "stream_error",
+                    BrowserAgentError("ブラウザエージェントのイベントストリーム初期化がタイムアウトしました。"),
+                )
             except httpx.RequestError as exc:
-                stream_status["error"] = BrowserAgentError(
-                    f"ブラウザエージェントのイベントストリームに接続できませんでした: {exc}",
+                _emit(
+                    "stream_error",
+                    BrowserAgentError(
+                        f"ブラウザエージェントのイベントストリームに接続できませんでした: {exc}",
+                    ),
                 )
-                stream_ready.set()
-                await event_queue.put({"kind": "stream_error", "error": stream_status["error"]})
             except asyncio.CancelledError:
                 pass
             except Exception as exc:  # noqa: BLE001
                 logging.exception("Unexpected error while consuming browser agent stream: %s", exc)
-                await event_queue.put(
-                    {
-                        "kind": "stream_error",
-                        "error": BrowserAgentError(
-                            "ブラウザエージェントのイベントストリームで予期しないエラーが発生しました。",
-                        ),
-                    }
+                _emit(
+                    "stream_error",
+                    BrowserAgentError(
+                        "ブラウザエージェントのイベントストリームで予期しないエラーが発生しました。",
+                    ),
                 )
             finally:
-                await event_queue.put({"kind": "stream_closed"})
+                _emit("stream_closed")
 
         async def _chat_worker() -> None:
             try:
-                async with httpx.AsyncClient(timeout=_browser_agent_timeout(BROWSER_AGENT_CHAT_TIMEOUT)) as client:
-                    response = await client.post(
-                        chat_url,
-                        json={"prompt": command, "new_task": True, "skip_conversation_review": True},
-                    )
+                response = await client.post(
+                    chat_url,
+                    json={"prompt": command, "new_task": True, "skip_conversation_review": True},
+                    timeout=_browser_agent_timeout(BROWSER_AGENT_CHAT_TIMEOUT),
+                )
             except httpx.RequestError as exc:
-                await event_queue.put(
-                    {
-                        "kind": "chat_error",
-                        "error": BrowserAgentError(
-                            f"ブラウザエージェントの呼び出しに失敗しました: {exc}",
-                        ),
-                    }
+                _emit(
+                    "chat_error",
+                    BrowserAgentError(
+                        f"ブラウザエージェントの呼び出しに失敗しました: {exc}",
+                    ),
                 )
-                await event_queue.put({"kind": "chat_complete"})
+                _emit("chat_complete")
                 return
 
             try:
-                data = response.json()
+                data = json_loads(response.content)
             except ValueError:
                 data = None
 
@@ -1612,55 +2083,41 @@ class MultiAgentOrchestrator:
                     response,
                     "ブラウザエージェントの呼び出しに失敗しました。",
                 )
-                await event_queue.put(
-                    {
-                        "kind": "chat_error",
-                        "error": BrowserAgentError(message, status_code=response.status_code),
-                    }
+                _emit(
+                    "chat_error",
+                    BrowserAgentError(message, status_code=response.status_code),
                 )
-                await event_queue.put({"kind": "chat_complete"})
+                _emit("chat_complete")
                 return
 
             if not isinstance(data, dict):
-                await event_queue.put(
-                    {
-                        "kind": "chat_error",
-                        "error": BrowserAgentError(
-                            "ブラウザエージェントから不正なレスポンス形式が返されました。",
-                            status_code=response.status_code,
-                        ),
-                    }
+                _emit(
+                    "chat_error",
+                    BrowserAgentError(
+                        "ブラウザエージェントから不正なレスポンス形式が返されました。",
+                        status_code=response.status_code,
+                    ),
                 )
-                await event_queue.put({"kind": "chat_complete"})
+                _emit("chat_complete")
                 return
 
-            await event_queue.put({"kind": "chat_result", "data": data})
-            await event_queue.put({"kind": "chat_complete"})
+            _emit("chat_result", data)
+            _emit("chat_complete")
 
+        # Stream failures arrive as "stream_error" events, so the consumer starts right away
+        # instead of waiting for the stream to connect first.
         stream_task = asyncio.create_task(_stream_worker())
         chat_task = asyncio.create_task(_chat_worker())
 
-        stream_init_timeout = min(BROWSER_AGENT_CONNECT_TIMEOUT or 10.0, 6.0)
-        stream_pre_failed = False
-        try:
-            await asyncio.wait_for(stream_ready.wait(), timeout=stream_init_timeout)
-        except asyncio.TimeoutError:
-            stream_status["error"] = BrowserAgentError("ブラウザエージェントのイベントストリーム初期化がタイムアウトしました。")
-            stream_pre_failed = True
-        if stream_status.get("error"):
-            stream_pre_failed = True
-        if stream_pre_failed:
-            stop_event.set()
-            if not stream_task.done():
-                stream_task.cancel()
-
-        progress_messages: Dict[Any, str] = {}
-        anon_counter = 0
+        # Anonymous messages get negative keys so they never collide with Browser Agent ids.
+        progress_messages: OrderedDict[int, str] = OrderedDict()
+        progress_message_limit = self._BROWSER_PROGRESS_MESSAGE_LIMIT
+        anon_counter = -1
         latest_summary = ""
         chat_result: Dict[str, Any] | None = None
         chat_error: BrowserAgentError | None = None
-        stream_finished = stream_pre_failed
-        stream_failed = stream_pre_failed
+        stream_finished = False
+        stream_failed = False
         chat_finished = False
         chat_finished_at: float | None = None
         chat_indicates_running = False
@@ -1675,50 +2132,57 @@ class MultiAgentOrchestrator:
 
         try:
             while True:
-                try:
-                    item = await asyncio.wait_for(event_queue.get(), timeout=0.5)
-                except asyncio.TimeoutError:
-                    if chat_finished and (stream_finished or stream_failed):
-                        break
-                    if chat_finished and not stream_finished and not stream_failed:
-                        if chat_indicates_running:
-                            continue
+                if not pending_events:
+                    events_ready.clear()
+                    # Both workers always emit a terminal event, so sleep until the next one arrives.
+                    # The only deadline is for a stream left open after the chat call has finished.
+                    wait_timeout: float | None = None
+                    if chat_finished and not stream_finished and not chat_indicates_running:
                         if chat_finished_at is None:
                             chat_finished_at = time.monotonic()
-                        elif time.monotonic() - chat_finished_at > 5.0:
-                            logging.warning(
-                                "Browser agent stream did not terminate after chat completion; forcing shutdown."
-                            )
-                            stream_failed = True
-                            stream_finished = True
-                            _stop_stream()
+                        wait_timeout = max(0.0, chat_finished_at + self._BROWSER_STREAM_DRAIN_TIMEOUT - time.monotonic())
+                    try:
+                        await asyncio.wait_for(events_ready.wait(), timeout=wait_timeout)
+                    except asyncio.TimeoutError:
+                        logging.warning(
+                            "Browser agent stream did not terminate after chat completion; forcing shutdown."
+                        )
+                        stream_failed = True
+                        stream_finished = True
+                        _stop_stream()
+                        break
                     continue
 
-                kind = item.get("kind")
+                kind, item_payload = pending_events.popleft()
                 if kind == "stream_data":
-                    data_text = item.get("data") or ""
+                    data_text = item_payload
                     if not data_text:
                         continue
                     try:
-                        payload = json.loads(data_text)
-                    except json.JSONDecodeError:
+                        payload = json_loads(data_text)
+                    except ValueError:  # JSONDecodeError, or UnicodeDecodeError from json_codec's stdlib fallback
                         logging.debug("Failed to decode browser stream payload: %s", data_text)
                         continue
                     if not isinstance(payload, dict):
                         continue
-                    event_type = str(payload.get("type") or "")
+                    event_type = payload.get("type")
+                    if type(event_type) is not str:
+                        event_type = ""
                     body = payload.get("payload")
-                    if event_type in {"message", "update"} and isinstance(body, dict):
+                    if event_type in _BROWSER_MESSAGE_EVENT_TYPES and isinstance(body, dict):
+                        # Roles arrive lowercase in practice; only unusual values pay for str()/lower().
+                        role = body.get("role") or "assistant"
+                        if role != "assistant":
+                            role = str(role).lower()
+                            if role == "user":
+                                continue
                         msg_id_raw = body.get("id")
-                        role = str(body.get("role") or "").lower()
                         content = body.get("content") or body.get("text")
                         if not isinstance(content, str):
                             continue
                         text = content.strip()
                         if not text:
                             continue
-                        if role == "user":
-                            continue
                         if isinstance(msg_id_raw, int):
                             if msg_id_raw <= baseline_last_id:
                                 continue
@@ -1727,17 +2191,20 @@ class MultiAgentOrchestrator:
                         else:
                             if not stream_has_new_message:
                                 continue
-                            message_key = f"anon-{anon_counter}"
-                            anon_counter += 1
+                            message_key = anon_counter
+                            anon_counter -= 1
                         previous_text = progress_messages.get(message_key)
                         if previous_text == text:
                             continue
                         mode = "update" if previous_text is not None else "append"
                         progress_messages[message_key] = text
+                        progress_messages.move_to_end(message_key)
+                        if len(progress_messages) > progress_message_limit:
+                            progress_messages.popitem(last=False)
                         yield {
                             "type": "progress",
                             "text": text,
-                            "role": role or "assistant",
+                            "role": role,
                             "message_id": msg_id_raw if isinstance(msg_id_raw, int) else None,
                             "mode": mode,
                         }
@@ -1752,14 +2219,13 @@ class MultiAgentOrchestrator:
                     elif event_type == "reset":
                         progress_messages.clear()
                 elif kind == "stream_error":
-                    error = item.get("error")
-                    logging.warning("Browser agent stream error: %s", error)
+                    logging.warning("Browser agent stream error: %s", item_payload)
                     stream_failed = True
                     stream_finished = True
                 elif kind == "stream_closed":
                     stream_finished = True
                 elif kind == "chat_result":
-                    chat_result = item.get("data") or {}
+                    chat_result = item_payload or {}
                     chat_finished = True
                     if isinstance(chat_result, dict):
                         chat_indicates_running = bool(chat_result.get("agent_running"))
@@ -1772,8 +2238,11 @@ class MultiAgentOrchestrator:
                     if chat_last_id > baseline_last_id:
                         chat_has_new_messages = True
                 elif kind == "chat_error":
-                    error = item.get("error")
-                    chat_error = error if isinstance(error, BrowserAgentError) else BrowserAgentError(str(error))
+                    chat_error = (
+                        item_payload
+                        if isinstance(item_payload, BrowserAgentError)
+                        else BrowserAgentError(str(item_payload))
+                    )
                     chat_finished = True
                     chat_finished_at = chat_finished_at or time.monotonic()
                     _stop_stream()
@@ -1831,76 +2300,127 @@ class MultiAgentOrchestrator:
             "result": self._browser_result_from_payload(command, chat_result, fallback_summary=fallback_summary),
         }
 
+    async def _iter_progress_batches(
+        self,
+        events: AsyncIterator[Dict[str, Any]],
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Coalesce progress events arriving within a short window into ``progress_batch`` events.
+
+        Successive updates to the same Browser Agent message within a window collapse into its
+        latest text (a pending "append" stays an append). A lone progress event is passed through
+        unchanged; any other event flushes the pending batch first so ordering is preserved.
+        """
+
+        iterator = events.__aiter__()
+        # Keyed by message id (or a fresh key for anonymous messages), in first-seen order.
+        batch: Dict[Any, Dict[str, Any]] = {}
+        deadline = 0.0
+        pending: asyncio.Future[Dict[str, Any]] | None = None
+
+        def _flush() -> Dict[str, Any]:
+            items = list(batch.values())
+            batch.clear()
+            if len(items) == 1:
+                return items[0]
+            return {"type": "progress_batch", "items": items}
+
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(iterator.__anext__())
+                timeout = max(0.0, deadline - time.monotonic()) if batch else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+                if not done:
+                    yield _flush()
+                    continue
+                try:
+                    event = pending.result()
+                except StopAsyncIteration:
+                    pending = None
+                    break
+                pending = None
+                if event.get("type") == "progress":
+                    if not batch:
+                        deadline = time.monotonic() + self._PROGRESS_BATCH_WINDOW
+                    message_id = event.get("message_id")
+                    key = message_id if message_id is not None else object()
+                    previous = batch.get(key)
+                    if previous is not None and previous.get("mode") == "append":
+                        event = {**event, "mode": "append"}
+                    batch[key] = event
+                    if len(batch) >= self._PROGRESS_BATCH_MAX_ITEMS:
+                        yield _flush()
+                    continue
+                if batch:
+                    yield _flush()
+                yield event
+            if batch:
+                yield _flush()
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+            aclose = getattr(iterator, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
     def _summarise_browser_messages(self, messages: Any) -> str:
-        if not isinstance(messages, list):
-            return ""
-        for item in reversed(messages):
-            if not isinstance(item, dict):
-                continue
-            role = str(item.get("role") or "").lower()
-            if role != "assistant":
-                continue
-            content = item.get("content") or item.get("text")
-            if isinstance(content, str) and content.strip():
-                return content.strip()
-        return ""
+        return _summarise_browser_messages(messages)
 
     def _condense_browser_summary(self, summary: str) -> str:
         """Return a user-facing browser summary without step counts or notices."""
 
-        cleaned = (summary or "").strip()
+        if not summary:
+            return ""
+        # Most summaries carry neither marker; a plain substring scan is far cheaper than the regex.
+        if BROWSER_AGENT_FINAL_MARKER in summary or BROWSER_AGENT_FINAL_NOTICE in summary:
+            summary = self._BROWSER_FINAL_MARKERS_RE.sub("", summary)
+        cleaned = summary.strip()
         if not cleaned:
             return ""
-        cleaned = cleaned.replace(BROWSER_AGENT_FINAL_MARKER, "").strip()
-        if BROWSER_AGENT_FINAL_NOTICE in cleaned:
-            cleaned = cleaned.replace(BROWSER_AGENT_FINAL_NOTICE, "").strip()
 
         # Try to extract content between "最終報告:" and "最終URL:"
-        start_marker = "最終報告:"
-        end_marker = "最終URL:"
-
-        start_index = cleaned.find(start_marker)
-        if start_index != -1:
-            end_index = cleaned.find(end_marker, start_index)
-            if end_index != -1:
-                report_part = cleaned[start_index:end_index]
-            else:
-                report_part = cleaned[start_index:]
-
-            # Remove the "最終報告:" prefix itself
-            report_content = report_part[len(start_marker) :].strip()
+        _, start_marker, report_part = cleaned.partition("最終報告:")
+        if start_marker:
+            report_content, _, _ = report_part.partition("最終URL:")
+            report_content = report_content.strip()
             if report_content:
                 return report_content
 
-        lines = [line.strip() for line in cleaned.splitlines() if line.strip()]
-        if not lines:
-            return cleaned
-
-        for line in lines:
-            if "ステップでエージェントが実行されました" in line:
+        # First line that is neither a step count nor a notice, else the first non-empty line.
+        first_line = ""
+        for raw_line in cleaned.splitlines():
+            line = raw_line.strip()
+            if not line:
                 continue
-            if line.startswith("※"):
+            if "ステップでエージェントが実行されました" in line or line.startswith("※"):
+                first_line = first_line or line
                 continue
             return line
-
-        return lines[0]
+        return first_line or cleaned
 
     @classmethod
     def _prepend_orchestrator_label(cls, text: str) -> str:
         """Ensure orchestrator-facing messages carry a consistent prefix."""
 
-        cleaned = text.strip() if isinstance(text, str) else ""
+        if not isinstance(text, str):
+            return ""
+        label = cls._ORCHESTRATOR_LABEL
+        # Already-labelled text with nothing to strip is returned as-is, without copies.
+        if text.startswith(label) and not text[-1].isspace():
+            return text
+        cleaned = text.strip()
         if not cleaned:
             return ""
-        if cleaned.lower().startswith("[orchestrator]"):
+        if cleaned[: len(label)].lower() == cls._ORCHESTRATOR_LABEL_LOWER:
             return cleaned
-        stripped = re.sub(r"^\[[^\]]+\]\s*", "", cleaned).strip()
+        stripped = cls._LABEL_STRIP_RE.sub("", cleaned, count=1).strip()
         body = stripped or cleaned
         return f"{cls._ORCHESTRATOR_LABEL} {body}"
 
     def _execution_result_text(self, result: ExecutionResult) -> str:
         agent_name = str(result.get("agent") or "agent")
-        agent_label = self._AGENT_DISPLAY_NAMES.get(agent_name, agent_name)
+        prefix = self._AGENT_LABEL_PREFIXES.get(agent_name) or f"[{agent_name}] "
         status = result.get("status")
         if status == "success":
             body = result.get("response") or "タスクを完了しました。"
@@ -1908,21 +2428,38 @@ class MultiAgentOrchestrator:
             body = result.get("response") or "実行に必要な追加情報を入力してください。"
         else:
             body = result.get("error") or "タスクの実行に失敗しました。"
-        return f"[{agent_label}] {body}"
+        return prefix + str(body)
 
     @staticmethod
     def _normalise_history_entries(history: Iterable[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Filter history entries down to role/content pairs."""
 
-        entries: List[Dict[str, str]] = []
-        for entry in history or []:
-            if not isinstance(entry, dict):
-                continue
-            role = entry.get("role")
-            content = entry.get("content")
-            if isinstance(role, str) and isinstance(content, str):
-                entries.append({"role": role, "content": content})
-        return entries
+        return [
+            {"role": entry["role"], "content": entry["content"]}
+            for entry in history or []
+            if isinstance(entry, dict)
+            and isinstance(entry.get("role"), str)
+            and isinstance(entry.get("content"), str)
+        ]
+
+    @staticmethod
+    def _history_messages(entries: List[Dict[str, str]]) -> List[HumanMessage | AIMessage]:
+        """Turn history entries into role-typed chat messages.
+
+        Consecutive entries from the same side are merged because some providers
+        reject two user or two assistant turns in a row.
+        """
+
+        messages: List[HumanMessage | AIMessage] = []
+        last_is_user: bool | None = None
+        for entry in entries:
+            is_user = entry["role"] == "user"
+            if is_user is last_is_user:
+                messages[-1] = type(messages[-1])(content=f"{messages[-1].content}\n{entry['content']}")
+            else:
+                messages.append(HumanMessage(content=entry["content"]) if is_user else AIMessage(content=entry["content"]))
+            last_is_user = is_user
+        return messages
 
     def _history_from_last_user_turn(self, history: List[Dict[str, Any]]) -> List[Dict[str, str]]:
         """Return history entries starting from the latest user turn."""
@@ -1931,19 +2468,21 @@ class MultiAgentOrchestrator:
         if not entries:
             return []
 
-        last_user_idx = None
-        for idx in range(len(entries) - 1, -1, -1):
-            if entries[idx].get("role") == "user":
-                last_user_idx = idx
-                break
-
+        last_user_idx = next(
+            (idx for idx in range(len(entries) - 1, -1, -1) if entries[idx]["role"] == "user"),
+            None,
+        )
         if last_user_idx is None:
             return entries
         return entries[last_user_idx:]
 
-    @staticmethod
-    def _append_session_history_entry(state: OrchestratorState, role: str, content: str) -> None:
-        """Append a message to the in-memory session history."""
+    @classmethod
+    def _append_session_history_entry(cls, state: OrchestratorState, role: str, content: str) -> None:
+        """Append a message to the in-memory session history, keeping a bounded window.
+
+        Entries that fall out of the window are condensed into ``session_history_summary``
+        with plain truncation so the planner still sees them without an extra LLM call.
+        """
 
         if not content:
             return
@@ -1952,6 +2491,20 @@ class MultiAgentOrchestrator:
         history.append(entry)
         state["session_history"] = history
 
+        overflow = len(history) - cls._SESSION_HISTORY_WINDOW
+        if overflow <= 0:
+            return
+        dropped = history[:overflow]
+        del history[:overflow]
+        limit = cls._SESSION_SUMMARY_ENTRY_CHARS
+        lines = [
+            f"{item.get('role')}: {str(item.get('content') or '')[:limit]}"
+            for item in dropped
+            if isinstance(item, dict)
+        ]
+        summary = "\n".join(filter(None, [state.get("session_history_summary") or "", *lines]))
+        state["session_history_summary"] = summary[-cls._SESSION_SUMMARY_MAX_CHARS :]
+
     def _load_recent_chat_history(self, limit: int = 30) -> List[Dict[str, Any]]:
         """Return the most recent chat history entries (best-effort)."""
 
@@ -1973,26 +2526,23 @@ class MultiAgentOrchestrator:
 
         return [{"role": "user", "content": user_input}]
 
-    def _ensure_previous_result_logged(self, expected_text: str | None) -> List[Dict[str, Any]]:
-        """Make sure the previous task result exists in chat history before continuing."""
+    def _ensure_previous_result_logged(
+        self, expected_text: str | None, pending_history: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Make sure the previous task result is queued for chat history and return recent context."""
 
-        history = self._load_recent_chat_history()
-        if not expected_text:
-            return history
+        if expected_text and expected_text not in pending_history:
+            if expected_text not in _recent_chat_history_contents(30):
+                pending_history.append(expected_text)
 
-        found = any(
-            isinstance(entry, dict)
-            and str(entry.get("content") or "").strip() == expected_text
-            for entry in history
-        )
-        if found:
+        history = self._load_recent_chat_history()
+        if not pending_history:
             return history
+        queued = [{"role": "assistant", "content": text} for text in pending_history]
+        return (history + queued)[-30:]
 
-        _append_to_chat_history("assistant", expected_text, broadcast=True)
-        return self._load_recent_chat_history()
-
-    def _log_execution_result_to_history(self, result: ExecutionResult) -> str:
-        """Append a formatted execution result to chat history."""
+    def _log_execution_result_to_history(self, result: ExecutionResult, pending_history: List[str]) -> str:
+        """Queue a formatted execution result for chat history."""
 
         text = self._execution_result_text(result)
 
@@ -2000,20 +2550,28 @@ class MultiAgentOrchestrator:
         # but guarantee the final Browser Agent summary is persisted to chat_history.json
         # so the General view sidebar always shows it.
         try:
-            history = self._load_recent_chat_history(limit=40)
-            already_logged = any(
-                isinstance(entry, dict)
-                and str(entry.get("content") or "").strip() == text
-                for entry in history
-            )
+            already_logged = text in pending_history or text in _recent_chat_history_contents(40)
         except Exception:  # noqa: BLE001 - fallback to always write
             already_logged = False
 
         if not already_logged:
-            _append_to_chat_history("assistant", text, broadcast=True)
+            pending_history.append(text)
 
         return text
 
+    @staticmethod
+    def _flush_pending_history(pending_history: List[str]) -> None:
+        """Write buffered assistant entries to chat history in a single batch."""
+
+        if not pending_history:
+            return
+        texts = list(pending_history)
+        pending_history.clear()
+        try:
+            _append_to_chat_history_many([("assistant", text, None) for text in texts], broadcast=True)
+        except Exception as exc:  # noqa: BLE001
+            logging.error("Failed to persist orchestrator messages to chat history: %s", exc)
+
     def _format_assistant_messages(
         self,
         plan_summary: str | None,
@@ -2027,13 +2585,14 @@ class MultiAgentOrchestrator:
             else:
                 messages.append({"type": "status", "text": plan_summary})
 
+        result_text = self._execution_result_text
         for result in executions:
             messages.append(
                 {
                     "type": "execution",
                     "agent": result["agent"],
                     "status": result.get("status"),
-                    "text": self._execution_result_text(result),
+                    "text": result_text(result),
                 }
             )
 
@@ -2042,6 +2601,23 @@ class MultiAgentOrchestrator:
 
         return messages
 
+    @classmethod
+    def _plan_signature(cls, plan_summary: str | None, tasks: Iterable[Any]) -> int:
+        """Hash a plan's summary and task keys so unchanged plans compare as one int."""
+
+        task_key = cls._task_key
+        return hash((plan_summary or "", tuple(task_key(task) for task in tasks if isinstance(task, dict))))
+
+    @staticmethod
+    def _same_text(text: str, other: Any) -> bool:
+        """Compare history texts by their (cached) hash before falling back to a full scan."""
+
+        if text is other:
+            return True
+        if not isinstance(other, str) or hash(text) != hash(other):
+            return False
+        return text == other
+
     def _plan_history_entry(self, plan_summary: str | None, tasks: List[TaskSpec]) -> str:
         """Compose a chat_history entry describing the orchestrator's plan."""
 
@@ -2055,55 +2631,135 @@ class MultiAgentOrchestrator:
                 lines.append(summary)
         if tasks:
             lines.append("タスク一覧:")
-            for idx, task in enumerate(tasks, start=1):
-                agent = task.get("agent") or "agent"
-                agent_label = self._AGENT_DISPLAY_NAMES.get(agent, agent)
-                command = (task.get("command") or "").strip()
-                command_text = command or "内容が空のタスク"
-                lines.append(f"{idx}. [{agent_label}] {command_text}")
+            display_get = self._AGENT_DISPLAY_NAMES.get
+            lines.extend(
+                f"{idx}. [{display_get(agent := task.get('agent') or 'agent', agent)}] "
+                f"{(task.get('command') or '').strip() or '内容が空のタスク'}"
+                for idx, task in enumerate(tasks, start=1)
+            )
 
         if not lines:
             return ""
 
         return self._prepend_orchestrator_label("\n".join(lines))
 
-    def _snapshot_state(self, state: OrchestratorState) -> Dict[str, Any]:
+    def _snapshot_state(self, state: OrchestratorState, cache: Dict[str, Any] | None = None) -> Dict[str, Any]:
+        """Return the UI snapshot of ``state``.
+
+        ``cache`` is per-run bookkeeping (the run's ``emitted`` dict). It holds
+        (tasks, tasks snapshot, executions, executions snapshot, executions length, snapshot)
+        of the previous event so consecutive events can share unchanged parts.
+        """
+
         tasks_raw = state.get("tasks") or []
         executions_raw = state.get("executions") or []
-        tasks = [
-            {"agent": task.get("agent"), "command": task.get("command")}
-            for task in tasks_raw
-            if isinstance(task, dict)
-        ]
-        executions = [
-            {
-                "agent": entry.get("agent"),
-                "command": entry.get("command"),
-                "status": entry.get("status"),
-                "response": entry.get("response"),
-                "error": entry.get("error"),
-            }
-            for entry in executions_raw
-            if isinstance(entry, dict)
-        ]
-        return {
-            "plan_summary": state.get("plan_summary") or "",
-            "raw_plan": state.get("raw_plan"),
+
+        # run_stream replaces the task list on every re-plan and only ever appends to the
+        # executions list, so reuse the previous snapshot while the same lists are in play.
+        cached = cache.get("snapshot_cache") if cache is not None else None
+        if cached is not None and cached[0] is tasks_raw:
+            tasks = cached[1]
+        else:
+            tasks = [
+                {"agent": task.get("agent"), "command": task.get("command")}
+                for task in tasks_raw
+                if isinstance(task, dict)
+            ]
+
+        snapshot_from = 0
+        executions: List[Dict[str, Any]] = []
+        if cached is not None and cached[2] is executions_raw and cached[4] <= len(executions_raw):
+            snapshot_from = cached[4]
+            executions = cached[3]
+        if snapshot_from < len(executions_raw):
+            executions = executions + [
+                {
+                    "agent": entry.get("agent"),
+                    "command": entry.get("command"),
+                    "status": entry.get("status"),
+                    "response": entry.get("response"),
+                    "error": entry.get("error"),
+                }
+                for entry in executions_raw[snapshot_from:]
+                if isinstance(entry, dict)
+            ]
+
+        plan_summary = state.get("plan_summary") or ""
+        raw_plan = state.get("raw_plan")
+        current_index = state.get("current_index", 0)
+        # Progress ticks leave the state untouched; hand back the very same snapshot so the
+        # diff against the previous event short-circuits on identity. Reused task and execution
+        # lists already mean those parts are unchanged, so only the scalars need comparing.
+        if cached is not None and tasks is cached[1] and executions is cached[3]:
+            previous = cached[5]
+            if (
+                previous["plan_summary"] == plan_summary
+                and previous["raw_plan"] == raw_plan
+                and previous["current_index"] == current_index
+            ):
+                return previous
+
+        snapshot = {
+            "plan_summary": plan_summary,
+            "raw_plan": raw_plan,
             "tasks": tasks,
             "executions": executions,
-            "current_index": state.get("current_index", 0),
+            "current_index": current_index,
         }
+        if cache is not None:
+            cache["snapshot_cache"] = (tasks_raw, tasks, executions_raw, executions, len(executions_raw), snapshot)
+        return snapshot
+
+    @staticmethod
+    def _diff_snapshot(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the keys of ``current`` that changed since ``previous``.
+
+        Executions only ever grow during a run, so an extended list is sent as
+        ``executions_appended`` holding just the new tail, with ``executions_total``
+        letting consumers check they have not missed an earlier delta.
+        """
+
+        diff: Dict[str, Any] = {}
+        if current is previous:
+            return diff
+        for key, value in current.items():
+            before = previous.get(key)
+            if value is before or (key not in {"tasks", "executions"} and value == before):
+                continue
+            if key == "executions" and isinstance(before, list):
+                seen = len(before)
+                if seen <= len(value) and (not seen or value[seen - 1] is before[-1]):
+                    diff["executions_appended"] = value[seen:]
+                    diff["executions_total"] = len(value)
+                    continue
+            diff[key] = value
+        return diff
 
     def _event_payload(
         self,
         event_type: str,
         state: OrchestratorState,
+        *,
+        emitted: Dict[str, Any] | None = None,
         **extras: Any,
     ) -> Dict[str, Any]:
-        payload: Dict[str, Any] = {"event": event_type, "state": self._snapshot_state(state)}
+        snapshot = self._snapshot_state(state, emitted)
+        payload: Dict[str, Any] = {"event": event_type, "state": snapshot}
+        if emitted is not None:
+            # Per-run bookkeeping: plan/complete events carry the full state the UI renders,
+            # every other event only carries what changed since the previous event.
+            previous = emitted.get("state")
+            emitted["state"] = snapshot
+            emitted["seq"] = payload["seq"] = emitted.get("seq", 0) + 1
+            if previous is not None and event_type not in self._FULL_STATE_EVENTS:
+                payload["state"] = self._diff_snapshot(previous, snapshot)
+                payload["diff"] = True
         payload.update(extras)
         return payload
 
+    def _lazy_event(self, event_type: str, state: OrchestratorState, **kwargs: Any) -> _LazyEvent:
+        return _LazyEvent(event_type, partial(self._event_payload, event_type, state, **kwargs))
+
     def _run_memory_consolidation(
         self,
         llm_client: Any,
@@ -2115,7 +2771,7 @@ class MultiAgentOrchestrator:
         try:
             short_snapshot = None
             if short_history:
-                short_snapshot = MemoryManager("short_term_memory.json").consolidate_memory(
+                short_snapshot = get_memory_manager("short_term_memory.json").consolidate_memory(
                     short_history,
                     memory_kind="short",
                     llm=llm_client,
@@ -2123,13 +2779,13 @@ class MultiAgentOrchestrator:
 
             # Consolidate to long-term only when short-term has accumulated enough context
             if short_snapshot and len(short_history) >= 6:
-                MemoryManager("long_term_memory.json").consolidate_memory(
+                get_memory_manager("long_term_memory.json").consolidate_memory(
                     long_history or short_history,
                     memory_kind="long",
                     llm=llm_client,
                     short_snapshot=short_snapshot,
                 )
-                MemoryManager("short_term_memory.json").reset_short_memory(preserve_active_task=True)
+                get_memory_manager("short_term_memory.json").reset_short_memory(preserve_active_task=True)
         except Exception as exc:  # noqa: BLE001
             logging.warning("Background memory consolidation failed: %s", exc)
 
@@ -2160,233 +2816,334 @@ class MultiAgentOrchestrator:
         ).start()
 
     async def run_stream(self, user_input: str, *, log_history: bool = False) -> AsyncIterator[Dict[str, Any]]:
-        session_history = self._initial_session_history(user_input, log_history)
-        agent_connections = load_agent_connections()
-        state: OrchestratorState = {
-            "user_input": user_input,
-            "plan_summary": None,
-            "raw_plan": None,
-            "tasks": [],
-            "executions": [],
-            "current_index": 0,
-            "agent_connections": agent_connections,
-            "session_history": session_history,
-        }
-
-        plan_state = await self._plan_node(state)
-        state.update(plan_state)
-        state["tasks"] = list(state.get("tasks") or [])
-        state["executions"] = list(state.get("executions") or [])
-        state["current_index"] = 0
-
-        logged_history_texts: List[str] = []
-        plan_history_entry = self._plan_history_entry(state.get("plan_summary"), state["tasks"])
-        if plan_history_entry:
-            self._append_session_history_entry(state, "assistant", plan_history_entry)
-            if log_history:
-                _append_to_chat_history("assistant", plan_history_entry, broadcast=True)
-                logged_history_texts.append(plan_history_entry)
+        events = self._iter_events(user_input, log_history=log_history)
+        try:
+            async for event in events:
+                yield event.materialize()
+        finally:
+            await events.aclose()
 
-        yield self._event_payload("plan", state)
+    async def _iter_events(self, user_input: str, *, log_history: bool = False) -> AsyncIterator[_LazyEvent]:
+        session_history = self._initial_session_history(user_input, log_history)
+        # Assistant entries for chat_history.json are buffered during the run and written in
+        # one batch, so each task does not rewrite the file and trigger its own memory refresh.
+        pending_history: List[str] = []
+        emitted_state: Dict[str, Any] = {}
+        replan_task: asyncio.Task[OrchestratorState] | None = None
+        try:
+            agent_connections = load_agent_connections()
+            state: OrchestratorState = {
+                "user_input": user_input,
+                "plan_summary": None,
+                "raw_plan": None,
+                "tasks": [],
+                "executions": [],
+                "current_index": 0,
+                "agent_connections": agent_connections,
+                "session_history": session_history,
+            }
 
-        executions: List[ExecutionResult] = []
+            plan_state = await self._plan_node(state)
+            state.update(plan_state)
+            # _plan_node hands back lists it built itself, and tasks lists are only ever
+            # replaced (never mutated), so neither needs a defensive copy here.
+            state["tasks"] = state.get("tasks") or []
+            state["executions"] = state.get("executions") or []
+            state["current_index"] = 0
 
-        while True:
-            tasks = list(state.get("tasks") or [])
-            tasks = self._apply_execution_results_to_tasks(tasks, executions)
-            state["tasks"] = tasks
-            current_index = state.get("current_index", 0)
-            if current_index >= len(tasks):
-                break
-            task_spec = tasks[current_index]
-            task_run_index = len(executions)
-            state["current_index"] = task_run_index
+            # Only the most recent logged text is ever consulted, so keep just that slot.
+            last_logged: str | None = None
+            plan_history_entry = self._plan_history_entry(state.get("plan_summary"), state["tasks"])
+            if plan_history_entry:
+                self._append_session_history_entry(state, "assistant", plan_history_entry)
+                if log_history:
+                    pending_history.append(plan_history_entry)
+                    last_logged = plan_history_entry
 
-            history_context: List[Dict[str, Any]] = []
-            if log_history:
-                last_recorded = logged_history_texts[-1] if logged_history_texts else None
-                history_context = self._ensure_previous_result_logged(last_recorded)
+            yield self._lazy_event("plan", state, emitted=emitted_state)
 
-            yield self._event_payload(
-                "before_execution",
-                state,
-                task_index=task_run_index,
-                task=task_spec,
-                history_context=history_context,
-            )
+            executions: List[ExecutionResult] = []
+            # (agent, command) pairs of successful executions, grown as results arrive.
+            completed_keys: set[tuple[Any, str]] = set()
+            # Remaining tasks as the planner produced them, before execution context is appended.
+            planned_tasks: List[TaskSpec] = state["tasks"]
+            # Refilled before each re-plan; the previous re-plan is always awaited before reuse.
+            replan_input: OrchestratorState = {
+                "user_input": user_input,
+                "executions": executions,
+                "agent_connections": agent_connections,
+            }
 
-            result: ExecutionResult | None = None
+            while True:
+                tasks = self._apply_execution_results_to_tasks(state.get("tasks") or [], executions)
+                state["tasks"] = tasks
+                current_index = state.get("current_index", 0)
+                if current_index >= len(tasks):
+                    break
+                task_spec = tasks[current_index]
+                task_run_index = len(executions)
+                state["current_index"] = task_run_index
+                # Normally a single task; a run of planner-marked independent tasks executes together.
+                batch = self._parallel_batch(tasks, current_index)
 
-            if task_spec["agent"] == "browser":
-                yield self._event_payload(
-                    "browser_init",
-                    state,
-                    task_index=task_run_index,
-                    task=task_spec,
-                    history_context=history_context,
-                )
+                history_context: List[Dict[str, Any]] = []
+                if log_history:
+                    history_context = self._ensure_previous_result_logged(last_logged, pending_history)
+
+                for offset, batch_index in enumerate(batch):
+                    state["current_index"] = task_run_index + offset
+                    yield self._lazy_event(
+                        "before_execution",
+                        state,
+                        emitted=emitted_state,
+                        task_index=task_run_index + offset,
+                        task=tasks[batch_index],
+                        history_context=history_context,
+                    )
 
-                async for event in self._execute_browser_task_with_progress(task_spec):
-                    etype = event.get("type")
-                    if etype == "progress":
-                        yield self._event_payload(
-                            "execution_progress",
-                            state,
-                            task_index=task_run_index,
-                            task=task_spec,
-                            progress=event,
-                            history_context=history_context,
+                result: ExecutionResult | None = None
+
+                if len(batch) > 1:
+                    batch_tasks = [tasks[batch_index] for batch_index in batch]
+                    # One batched actionability round-trip for the whole group instead of one per task.
+                    assessments = await self._assess_actionability_many(batch_tasks)
+                    batch_results = list(
+                        await asyncio.gather(
+                            *(
+                                self._execute_task(batch_task, assessment=assessment)
+                                for batch_task, assessment in zip(batch_tasks, assessments)
+                            )
                         )
-                    elif etype == "result":
-                        maybe_result = event.get("result")
-                        if isinstance(maybe_result, dict):
-                            result = cast(ExecutionResult, maybe_result)
-
-                if result is None:
-                    result = self._browser_error_result(
-                        task_spec["command"],
-                        BrowserAgentError("ブラウザエージェントからの結果を取得できませんでした。"),
                     )
-            else:
-                result = await self._execute_task(task_spec)
-
-            executions.append(result)
-            state["executions"] = executions
-            state["current_index"] = len(executions)
-
-            execution_text = self._execution_result_text(result)
-            if log_history:
-                execution_text = self._log_execution_result_to_history(result)
-                logged_history_texts.append(execution_text)
-            self._append_session_history_entry(state, "assistant", execution_text)
-
-            yield self._event_payload(
-                "after_execution",
-                state,
-                task_index=task_run_index,
-                task=task_spec,
-                result=result,
-                history_context=history_context,
-            )
+                elif task_spec["agent"] == "browser":
+                    yield self._lazy_event(
+                        "browser_init",
+                        state,
+                        emitted=emitted_state,
+                        task_index=task_run_index,
+                        task=task_spec,
+                        history_context=history_context,
+                    )
 
-            if result.get("status") == "needs_info":
-                clarification = (result.get("response") or result.get("error") or "").strip()
-                request_text = (
-                    f"追加の情報が必要です。以下の質問に回答してください: {clarification}"
-                    if clarification
-                    else "追加の情報が必要です。上記の質問に回答してください。"
-                )
-                state["plan_summary"] = request_text
-                state["tasks"] = []
+                    browser_events = self._iter_progress_batches(self._execute_browser_task_with_progress(task_spec))
+                    try:
+                        async for event in browser_events:
+                            etype = event.get("type")
+                            if etype == "progress":
+                                yield self._lazy_event(
+                                    "execution_progress",
+                                    state,
+                                    emitted=emitted_state,
+                                    task_index=task_run_index,
+                                    task=task_spec,
+                                    progress=event,
+                                    history_context=history_context,
+                                )
+                            elif etype == "progress_batch":
+                                items = event["items"]
+                                yield self._lazy_event(
+                                    "execution_progress",
+                                    state,
+                                    emitted=emitted_state,
+                                    task_index=task_run_index,
+                                    task=task_spec,
+                                    progress=items[-1],
+                                    progress_batch=items,
+                                    history_context=history_context,
+                                )
+                            elif etype == "result":
+                                maybe_result = event.get("result")
+                                if isinstance(maybe_result, dict):
+                                    result = cast(ExecutionResult, maybe_result)
+                                    # Nothing after the result is forwarded, so stop consuming here.
+                                    break
+                    finally:
+                        # Closing unwinds the browser stream workers instead of leaving it to GC.
+                        await browser_events.aclose()
+
+                    if result is None:
+                        result = self._browser_error_result(
+                            task_spec["command"],
+                            BrowserAgentError("ブラウザエージェントからの結果を取得できませんでした。"),
+                        )
+                    batch_results = [result]
+                else:
+                    batch_results = [await self._execute_task(task_spec)]
+
+                for result in batch_results:
+                    executions.append(result)
+                    if result.get("status") == "success":
+                        completed_keys.add(self._task_key(result))
+
+                    execution_text = self._execution_result_text(result)
+                    if log_history:
+                        execution_text = self._log_execution_result_to_history(result, pending_history)
+                        last_logged = execution_text
+                    self._append_session_history_entry(state, "assistant", execution_text)
+                state["executions"] = executions
                 state["current_index"] = len(executions)
-                orchestrator_text = self._prepend_orchestrator_label(request_text)
-                self._append_session_history_entry(state, "assistant", orchestrator_text)
-                if log_history:
-                    _append_to_chat_history("assistant", orchestrator_text, broadcast=True)
-                    logged_history_texts.append(orchestrator_text)
-                yield self._event_payload("plan", state, incremental=True)
-                break
+                needs_info = next((res for res in batch_results if res.get("status") == "needs_info"), None)
+
+                # A plain success leaves the rest of the plan valid: the remaining commands get the
+                # new result appended as context below, so the planner round-trip can be skipped.
+                remaining_planned: List[TaskSpec] = []
+                # Signature of the plan as it stands once the executed tasks are done; a re-plan that
+                # reproduces it is not worth another history entry.
+                expected_plan_signature: int | None = None
+                if len(planned_tasks) == len(tasks):
+                    executed = set(batch)
+                    unexecuted = [task for idx, task in enumerate(planned_tasks) if idx not in executed]
+                    expected_plan_signature = self._plan_signature(state.get("plan_summary"), unexecuted)
+                    if ORCHESTRATOR_SKIP_REPLAN_ON_SUCCESS and all(
+                        res.get("status") == "success" for res in batch_results
+                    ):
+                        remaining_planned = unexecuted
+
+                if needs_info is None and not remaining_planned:
+                    # Re-plan after every execution so the next agent receives the latest context.
+                    # The planner call starts now and runs while after_execution is delivered.
+                    replan_input["plan_summary"] = state.get("plan_summary")
+                    replan_input["raw_plan"] = state.get("raw_plan")
+                    replan_input["tasks"] = tasks
+                    replan_input["current_index"] = len(executions)
+                    replan_input["retry_counts"] = state.get("retry_counts") or {}
+                    replan_input["session_history"] = state.get("session_history") or []
+                    replan_input["session_history_summary"] = state.get("session_history_summary") or ""
+                    replan_task = asyncio.create_task(self._replan(replan_input))
+
+                for offset, (batch_index, result) in enumerate(zip(batch, batch_results)):
+                    yield self._lazy_event(
+                        "after_execution",
+                        state,
+                        emitted=emitted_state,
+                        task_index=task_run_index + offset,
+                        task=tasks[batch_index],
+                        result=result,
+                        history_context=history_context,
+                    )
 
-            # Re-plan after every execution so the next agent receives the latest context.
-            replan_input: OrchestratorState = {
-                "user_input": user_input,
-                "plan_summary": state.get("plan_summary"),
-                "raw_plan": state.get("raw_plan"),
-                "tasks": tasks,
-                "executions": executions,
-                "current_index": len(executions),
-                "retry_counts": state.get("retry_counts") or {},
-                "agent_connections": agent_connections,
-                "session_history": state.get("session_history") or [],
-            }
-            replan_state = await self._plan_node(replan_input, incremental=True)
-            state.update(replan_state)
-            state["executions"] = executions
-            state["current_index"] = 0
+                if needs_info is not None:
+                    clarification = _first_nonempty_stripped(needs_info, "response", "error")
+                    request_text = (
+                        _NEEDS_INFO_QUESTION_PREFIX + clarification if clarification else _NEEDS_INFO_FALLBACK_TEXT
+                    )
+                    state["plan_summary"] = request_text
+                    state["tasks"] = []
+                    # The user is about to supply new information, so earlier plans no longer apply.
+                    self._replan_cache.clear()
+                    state["current_index"] = len(executions)
+                    orchestrator_text = self._prepend_orchestrator_label(request_text)
+                    self._append_session_history_entry(state, "assistant", orchestrator_text)
+                    if log_history:
+                        pending_history.append(orchestrator_text)
+                        last_logged = orchestrator_text
+                    yield self._lazy_event("plan", state, emitted=emitted_state, incremental=True)
+                    break
 
-            if executions:
-                completed = {
-                    (res.get("agent"), (res.get("command") or "").strip())
-                    for res in executions
-                    if res.get("status") == "success"
-                }
-                state["tasks"] = [
-                    task
-                    for task in state.get("tasks") or []
-                    if (task.get("agent"), (task.get("command") or "").strip()) not in completed
-                ]
-            state["tasks"] = self._apply_execution_results_to_tasks(state.get("tasks") or [], executions)
-            state["current_index"] = 0
+                if replan_task is not None:
+                    replan_state = await replan_task
+                    replan_task = None
+                    state.update(replan_state)
+                    state["executions"] = executions
+
+                    if completed_keys:
+                        task_key = self._task_key
+                        state["tasks"] = [
+                            task for task in state.get("tasks") or [] if task_key(task) not in completed_keys
+                        ]
+                    planned_tasks = state.get("tasks") or []
+                else:
+                    planned_tasks = remaining_planned
+                state["tasks"] = self._apply_execution_results_to_tasks(planned_tasks, executions)
+                state["current_index"] = 0
 
-            new_plan_history = self._plan_history_entry(state.get("plan_summary"), state.get("tasks") or [])
-            if new_plan_history:
-                session_history = state.get("session_history") or []
-                last_session_text = (
-                    session_history[-1].get("content") if session_history and isinstance(session_history[-1], dict) else None
-                )
-                already_logged = (
-                    bool(logged_history_texts and new_plan_history == logged_history_texts[-1])
-                    or new_plan_history == last_session_text
+                plan_unchanged = expected_plan_signature == self._plan_signature(
+                    state.get("plan_summary"), planned_tasks
                 )
-                if not already_logged:
-                    self._append_session_history_entry(state, "assistant", new_plan_history)
-                if log_history and not already_logged:
-                    _append_to_chat_history("assistant", new_plan_history, broadcast=True)
-                    logged_history_texts.append(new_plan_history)
-
-            yield self._event_payload("plan", state, incremental=True)
-
-        plan_summary = state.get("plan_summary") or ""
-        plan_summary = self._apply_execution_placeholders(plan_summary, executions)
-        state["plan_summary"] = plan_summary
-        assistant_messages = self._format_assistant_messages(plan_summary, executions)
-        if log_history:
-            updated_messages = []
-            for message in assistant_messages:
-                text = str(message.get("text") or "")
+                new_plan_history = self._plan_history_entry(state.get("plan_summary"), state.get("tasks") or [])
+                if new_plan_history and not plan_unchanged:
+                    session_history = state.get("session_history") or []
+                    last_session_text = (
+                        session_history[-1].get("content") if session_history and isinstance(session_history[-1], dict) else None
+                    )
+                    already_logged = self._same_text(new_plan_history, last_logged) or self._same_text(
+                        new_plan_history, last_session_text
+                    )
+                    if not already_logged:
+                        self._append_session_history_entry(state, "assistant", new_plan_history)
+                    if log_history and not already_logged:
+                        pending_history.append(new_plan_history)
+                        last_logged = new_plan_history
+
+                yield self._lazy_event("plan", state, emitted=emitted_state, incremental=True)
+
+            plan_summary = state.get("plan_summary") or ""
+            plan_summary = self._apply_execution_placeholders(plan_summary, executions)
+            state["plan_summary"] = plan_summary
+            assistant_messages = self._format_assistant_messages(plan_summary, executions)
+            if log_history:
+                # The messages were just built for this run, so label them in place.
                 # Only prepend [Orchestrator] label to Orchestrator's own messages (plan/status).
                 # Execution results already have their specific agent label (e.g. [Browser Agent]).
-                if message.get("type") in ("plan", "status"):
-                    text = self._prepend_orchestrator_label(text)
-                updated_messages.append({**message, "text": text})
-            assistant_messages = updated_messages
-
-        if log_history:
-            already_logged = bool(logged_history_texts)
-            if not already_logged:
-                for msg in assistant_messages:
-                    text = msg.get("text")
-                    if not isinstance(text, str) or not text.strip():
+                prepend_label = self._prepend_orchestrator_label
+                label_types = self._ORCHESTRATOR_MESSAGE_TYPES
+                for message in assistant_messages:
+                    if message.get("type") not in label_types:
                         continue
-                    _append_to_chat_history("assistant", text, broadcast=True)
+                    text = message.get("text")
+                    message["text"] = prepend_label(text if isinstance(text, str) else str(text or ""))
 
-        # Kick off memory consolidation without blocking the SSE stream.
-        session_history_for_memory = state.get("session_history") or []
-        if session_history_for_memory:
-            self._trigger_memory_consolidation(session_history_for_memory)
+            if log_history:
+                already_logged = last_logged is not None
+                if not already_logged:
+                    for msg in assistant_messages:
+                        text = msg.get("text")
+                        if not isinstance(text, str) or not text.strip():
+                            continue
+                        pending_history.append(text)
 
-        yield self._event_payload(
-            "complete",
-            state,
-            assistant_messages=assistant_messages,
-        )
+            # Kick off memory consolidation without blocking the SSE stream.
+            session_history_for_memory = state.get("session_history") or []
+            if session_history_for_memory:
+                self._trigger_memory_consolidation(session_history_for_memory)
+
+            self._flush_pending_history(pending_history)
+            yield self._lazy_event(
+                "complete",
+                state,
+                emitted=emitted_state,
+                assistant_messages=assistant_messages,
+            )
+        finally:
+            if replan_task is not None:
+                # The consumer went away before the re-plan was awaited.
+                if not replan_task.done():
+                    replan_task.cancel()
+                elif not replan_task.cancelled() and replan_task.exception() is not None:
+                    # Retrieve the failure so asyncio does not report it as never retrieved.
+                    logging.debug("Discarded re-plan failed: %s", replan_task.exception())
+            self._flush_pending_history(pending_history)
 
     async def run(self, user_input: str, *, log_history: bool = False) -> Dict[str, Any]:
         final_event: Dict[str, Any] | None = None
-        async for event in self.run_stream(user_input, log_history=log_history):
-            final_event = event
+        # Only the terminal event is needed; intermediate payloads are dropped as they arrive.
+        events = self._iter_events(user_input, log_history=log_history)
+        try:
+            async for event in events:
+                if event.event == "complete":
+                    final_event = event.materialize()
+        finally:
+            await events.aclose()
 
-        if not final_event or final_event.get("event") != "complete":
+        if final_event is None:
             raise OrchestratorError("オーケストレーターの実行が完了しませんでした。")
 
         final_state = final_event.get("state") or {}
         plan_summary = final_state.get("plan_summary") or ""
         tasks = final_state.get("tasks") or []
         executions = final_state.get("executions") or []
-        assistant_messages = final_event.get("assistant_messages") or self._format_assistant_messages(
-            plan_summary,
-            executions,
-        )
+        # _iter_events always attaches the formatted messages (never empty) to "complete".
+        assistant_messages = final_event["assistant_messages"]
 
         return {
             "plan_summary": plan_summary,
@@ -2409,10 +3166,25 @@ def _llm_signature(config: Dict[str, Any]) -> tuple[str, str, str, str]:
 
 _orchestrator_service: MultiAgentOrchestrator | None = None
 _orchestrator_signature: tuple[str, str, str, str] | None = None
+# Requests arriving in quick succession reuse the last resolved LLM settings for this long.
+# Saving model settings invalidates the cache immediately; only secrets.env edits wait it out.
+_ORCHESTRATOR_CONFIG_TTL = 5.0
+_orchestrator_config_checked_at = float("-inf")
+
+
+def _invalidate_orchestrator_config() -> None:
+    """Force the next ``_get_orchestrator`` call to re-resolve the LLM settings."""
+
+    global _orchestrator_config_checked_at
+    _orchestrator_config_checked_at = float("-inf")
 
 
 def _get_orchestrator() -> MultiAgentOrchestrator:
-    global _orchestrator_service, _orchestrator_signature
+    global _orchestrator_service, _orchestrator_signature, _orchestrator_config_checked_at
+
+    now = time.monotonic()
+    if _orchestrator_service is not None and now - _orchestrator_config_checked_at < _ORCHESTRATOR_CONFIG_TTL:
+        return _orchestrator_service
 
     try:
         llm_config = resolve_llm_config("orchestrator")
@@ -2428,4 +3200,5 @@ def _get_orchestrator() -> MultiAgentOrchestrator:
             raise
         except Exception as exc:  # noqa: BLE001
             raise OrchestratorError(f"オーケストレーターの初期化に失敗しました: {exc}") from exc
+    _orchestrator_config_checked_at = now
     return _orchestrator_service
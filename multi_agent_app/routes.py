@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import datetime
-import json
+import functools
+import itertools
 import logging
 import asyncio
+import os
+import stat
+from email.utils import parsedate_to_datetime
 from urllib.parse import quote
 from typing import Any, Dict, AsyncIterator
 
@@ -30,7 +34,9 @@ from .config import (
     _resolve_browser_embed_url,
 )
 from .errors import LifestyleAPIError, OrchestratorError
-from .history import _read_chat_history, _reset_chat_history
+from .history import _read_chat_history_bytes, _reset_chat_history
+from .http_client import _get_shared_async_client
+from .json_codec import json_dumps
 from .iot import (
     _build_iot_agent_url,
     _fetch_iot_model_selection,
@@ -62,20 +68,80 @@ from .settings import (
     save_model_settings,
     save_memory_settings,
 )
-from .orchestrator import _get_orchestrator
+from .orchestrator import _get_orchestrator, _invalidate_orchestrator_config
 from .agent_status import get_agent_status
-from .memory_manager import MemoryManager
+from .memory_manager import get_memory_manager
 from .request_context import set_browser_agent_bases, reset_browser_agent_bases
 
 router = APIRouter()
 
+# Relative bases would proxy back to this app and loopback bases point at this host, not an agent.
+_BROADCAST_SKIP_PREFIXES = (
+    "/",
+    "http://localhost",
+    "https://localhost",
+    "http://127.0.0.1",
+    "https://127.0.0.1",
+    "localhost",
+    "127.0.0.1",
+)
+
+# Compose service address always tried after any client-supplied Browser Agent bases.
+_SERVICE_DEFAULT_BROWSER_BASE = _canonicalise_browser_agent_base("http://browser-agent:5005")
+
+# Static assets may be reused by the browser for an hour; after that they are revalidated.
+_STATIC_CACHE_CONTROL = "public, max-age=3600"
+
+# In-flight background broadcasts; the set keeps tasks referenced until they finish and the
+# lock makes back-to-back saves reach the agents in the order they were made.
+_broadcast_tasks: set[asyncio.Task[None]] = set()
+_broadcast_lock = asyncio.Lock()
 
-def _format_sse_event(payload: Dict[str, Any]) -> str:
-    """Serialise an SSE event line with the payload JSON."""
+
+def _format_sse_event(payload: Dict[str, Any]) -> bytes:
+    """Serialise an SSE event line with the payload JSON, already UTF-8 encoded."""
 
     event_type = str(payload.get("event") or "message").strip() or "message"
-    data = json.dumps(payload, ensure_ascii=False)
-    return f"event: {event_type}\ndata: {data}\n\n"
+    return b"event: " + event_type.encode("utf-8") + b"\ndata: " + json_dumps(payload) + b"\n\n"
+
+
+@functools.lru_cache(maxsize=8)
+def _sse_error_frame(message: str) -> bytes:
+    """Serialised SSE error frame; an unavailable orchestrator repeats the same message."""
+
+    return _format_sse_event({"event": "error", "error": message})
+
+
+def _sse_error_response(message: str) -> Response:
+    """Single-frame event stream reporting ``message``, sent as one buffered body."""
+
+    return Response(
+        _sse_error_frame(message),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+def _is_not_modified(response: Response, request: Request) -> bool:
+    """Return True when the client's cached copy still matches ``response``."""
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison (RFC 9110 13.1.2): a "W/" prefix on either side is ignored.
+        etag = (response.headers.get("etag") or "").removeprefix("W/")
+        for tag in if_none_match.split(","):
+            tag = tag.strip()
+            if tag == "*" or (etag and tag.removeprefix("W/") == etag):
+                return True
+        return False
+    if_modified_since = request.headers.get("if-modified-since")
+    last_modified = response.headers.get("last-modified")
+    if not if_modified_since or not last_modified:
+        return False
+    try:
+        return parsedate_to_datetime(if_modified_since) >= parsedate_to_datetime(last_modified)
+    except (TypeError, ValueError):
+        return False
 
 
 def _flash_messages(request: Request) -> list[str]:
@@ -104,29 +170,54 @@ async def _broadcast_model_settings(selection: Dict[str, Any]) -> None:
 
     headers = {"X-Platform-Propagation": "1"}
 
-    async with httpx.AsyncClient(timeout=2.0) as client:
-        for agent, payload in agent_payloads.items():
-            if not payload or not isinstance(payload, dict):
-                continue
-            iter_bases, build_url = target_builders.get(agent, (None, None))
-            if not iter_bases or not build_url:
-                continue
-            for base in iter_bases():
-                if not base or base.startswith("/"):
-                    continue
-                if "localhost" in base or "127.0.0.1" in base:
-                    continue
-                url = build_url(base, "model_settings")
-                try:
-                    resp = await client.post(url, json=payload, headers=headers)
-                    if not resp.is_success:
-                        logging.warning(
-                            "Model settings push to %s failed: %s %s", url, resp.status_code, resp.text
-                        )
-                except httpx.RequestError as exc:
-                    logging.warning("Model settings push to %s skipped (%s)", url, exc)
-                except Exception as exc:  # noqa: BLE001
-                    logging.warning("Model settings push to %s failed: %s", url, exc)
+    targets: list[tuple[str, Dict[str, Any]]] = []
+    for agent, payload in agent_payloads.items():
+        if not payload or not isinstance(payload, dict):
+            continue
+        iter_bases, build_url = target_builders.get(agent, (None, None))
+        if not iter_bases or not build_url:
+            continue
+        # Distinct bases can still resolve to the same endpoint; post to each URL once.
+        urls = dict.fromkeys(
+            build_url(base, "model_settings")
+            for base in iter_bases()
+            if base and not base.startswith(_BROADCAST_SKIP_PREFIXES)
+        )
+        # Always push, even when unchanged: re-saving is how a restarted agent gets re-synced.
+        targets.extend((url, payload) for url in urls)
+
+    # Pushes reuse the pooled keep-alive client; saves repeatedly hit the same agent URLs.
+    client = _get_shared_async_client()
+
+    async def _push(url: str, payload: Dict[str, Any]) -> None:
+        try:
+            resp = await client.post(url, json=payload, headers=headers, timeout=2.0)
+            if not resp.is_success:
+                logging.warning(
+                    "Model settings push to %s failed: %s %s", url, resp.status_code, resp.text
+                )
+        except httpx.RequestError as exc:
+            logging.warning("Model settings push to %s skipped (%s)", url, exc)
+        except Exception as exc:  # noqa: BLE001
+            logging.warning("Model settings push to %s failed: %s", url, exc)
+
+    # Agents are independent, so one slow base costs a single timeout rather than the sum of them.
+    await asyncio.gather(*(_push(url, payload) for url, payload in targets))
+
+
+def _schedule_model_settings_broadcast(selection: Dict[str, Any]) -> None:
+    """Propagate ``selection`` in the background so saving does not wait on agent round-trips."""
+
+    async def _run() -> None:
+        async with _broadcast_lock:
+            try:
+                await _broadcast_model_settings(selection)
+            except Exception as exc:  # noqa: BLE001
+                logging.warning("Model settings broadcast failed: %s", exc)
+
+    task = asyncio.create_task(_run())
+    _broadcast_tasks.add(task)
+    task.add_done_callback(_broadcast_tasks.discard)
 
 
 @router.post("/orchestrator/chat", name="multi_agent_app.orchestrator_chat")
@@ -146,30 +237,26 @@ async def orchestrator_chat(request: Request) -> Response:
     log_history_requested = payload.get("log_history") is True
     log_history = log_history_requested or view_name == "general"
 
-    overrides: list[str] = []
-    overrides.extend(_normalise_browser_base_values(payload.get("browser_agent_base")))
-    overrides.extend(_normalise_browser_base_values(payload.get("browser_agent_bases")))
-    overrides = [value for value in overrides if value]
-    service_default = _canonicalise_browser_agent_base("http://browser-agent:5005")
-    if service_default and service_default not in overrides:
-        overrides.append(service_default)
+    # Client-supplied bases first, then the service default; each base is kept once, in order.
+    overrides = list(
+        dict.fromkeys(
+            value
+            for value in itertools.chain(
+                _normalise_browser_base_values(payload.get("browser_agent_base")),
+                _normalise_browser_base_values(payload.get("browser_agent_bases")),
+                (_SERVICE_DEFAULT_BROWSER_BASE,),
+            )
+            if value
+        )
+    )
 
     try:
         orchestrator = _get_orchestrator()
     except OrchestratorError as exc:
         logging.exception("Orchestrator initialisation failed: %s", exc)
-        error_message = str(exc)
-
-        async def _error_stream(message_text: str) -> AsyncIterator[str]:
-            yield _format_sse_event({"event": "error", "error": message_text})
-
-        return StreamingResponse(
-            _error_stream(error_message),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache"},
-        )
+        return _sse_error_response(str(exc))
 
-    async def _stream() -> AsyncIterator[str]:
+    async def _stream() -> AsyncIterator[bytes]:
         token = set_browser_agent_bases(overrides)
         try:
             async for event in orchestrator.run_stream(message, log_history=log_history):
@@ -344,7 +431,7 @@ async def proxy_scheduler_agent(request: Request, path: str = "") -> Response:
 @router.get("/chat_history", name="multi_agent_app.chat_history")
 async def chat_history() -> Any:
     """Fetch the entire chat history."""
-    return _read_chat_history()
+    return Response(_read_chat_history_bytes(), media_type="application/json")
 
 
 @router.post("/reset_chat_history", name="multi_agent_app.reset_chat_history")
@@ -381,19 +468,21 @@ async def api_memory(request: Request) -> Any:
             long_term_data = data.get("long_term_memory")
             short_term_data = data.get("short_term_memory")
 
+            # The two memory files are independent, so write them concurrently off the event loop.
+            writes = []
+            lt_mgr = get_memory_manager("long_term_memory.json")
             if long_term_full is not None:
-                lt_mgr = MemoryManager("long_term_memory.json")
-                lt_mgr.save_memory(long_term_full)
+                writes.append(asyncio.to_thread(lt_mgr.save_memory, long_term_full))
             elif long_term_data is not None:
-                lt_mgr = MemoryManager("long_term_memory.json")
-                lt_mgr.replace_with_user_payload(long_term_data)
+                writes.append(asyncio.to_thread(lt_mgr.replace_with_user_payload, long_term_data))
 
+            st_mgr = get_memory_manager("short_term_memory.json")
             if short_term_full is not None:
-                st_mgr = MemoryManager("short_term_memory.json")
-                st_mgr.save_memory(short_term_full)
+                writes.append(asyncio.to_thread(st_mgr.save_memory, short_term_full))
             elif short_term_data is not None:
-                st_mgr = MemoryManager("short_term_memory.json")
-                st_mgr.replace_with_user_payload(short_term_data)
+                writes.append(asyncio.to_thread(st_mgr.replace_with_user_payload, short_term_data))
+
+            await asyncio.gather(*writes)
 
             # Save settings
             save_memory_settings({
@@ -412,7 +501,7 @@ async def api_memory(request: Request) -> Any:
             return JSONResponse({"error": "Failed to save memory."}, status_code=500)
 
     try:
-        lt_mgr = MemoryManager("long_term_memory.json")
+        lt_mgr = get_memory_manager("long_term_memory.json")
         lt_mem = lt_mgr.load_memory()
         # Return both legacy format and new format for compatibility
         long_term_memory = lt_mem.get("summary_text", "")
@@ -425,7 +514,7 @@ async def api_memory(request: Request) -> Any:
         long_term_titles = {}
 
     try:
-        st_mgr = MemoryManager("short_term_memory.json")
+        st_mgr = get_memory_manager("short_term_memory.json")
         st_mem = st_mgr.load_memory()
         short_term_memory = st_mem.get("summary_text", "")
         short_term_categories = st_mem.get("category_summaries", {})
@@ -532,7 +621,8 @@ async def api_model_settings(request: Request) -> Any:
 
     try:
         saved = save_model_settings(data)
-        await _broadcast_model_settings(saved)
+        _invalidate_orchestrator_config()
+        _schedule_model_settings_broadcast(saved)
     except Exception as exc:  # noqa: BLE001
         logging.exception("Failed to save model settings: %s", exc)
         return JSONResponse({"error": "モデル設定の保存に失敗しました。"}, status_code=500)
@@ -574,13 +664,8 @@ async def scheduler_index(request: Request) -> Response:
                 "flash_messages": flash_messages,
             },
         )
-    
-    # Convert ISO format date strings back to datetime.date objects for Jinja
-    for week in data['calendar_data']:
-        for day_data in week:
-            day_data['date'] = datetime.date.fromisoformat(day_data['date'])
-    data['today'] = datetime.date.fromisoformat(data['today'])
-    
+
+    # _fetch_calendar_data already hands back datetime.date objects for Jinja.
     return templates.TemplateResponse(
         "scheduler_index.html",
         {
@@ -614,14 +699,7 @@ async def scheduler_calendar_partial(request: Request) -> Response:
         if not isinstance(data, dict):
              raise ValueError("Invalid response format")
              
-        for week in data.get('calendar_data', []):
-            for day_data in week:
-                if 'date' in day_data and isinstance(day_data['date'], str):
-                    day_data['date'] = datetime.date.fromisoformat(day_data['date'])
-        
-        if 'today' in data and isinstance(data['today'], str):
-            data['today'] = datetime.date.fromisoformat(data['today'])
-        else:
+        if not isinstance(data.get('today'), datetime.date):
             data['today'] = datetime.date.today()
             
     except (ConnectionError, ValueError, KeyError, TypeError) as exc:
@@ -669,22 +747,12 @@ async def scheduler_day_view(request: Request, date_str: str) -> Response:
         if not isinstance(data, dict):
              raise ValueError("Invalid response format")
 
-        if 'date' in data and isinstance(data['date'], str):
-            data['date'] = datetime.date.fromisoformat(data['date'])
-        else:
+        if not isinstance(data.get('date'), datetime.date):
             raise KeyError("Response missing 'date'")
 
     except (ConnectionError, ValueError, KeyError, TypeError) as exc:
         logging.error("Failed to fetch day view data for %s: %s", date_str, exc)
         return JSONResponse({"error": str(exc)}, status_code=502)
-    
-    # Convert timeline item dates if necessary (though they are usually just strings)
-    for item in data.get('timeline_items', []):
-        # Assuming 'log_memo' and 'is_done' might be None or boolean
-        if item.get('log_memo') is None:
-            item['log_memo'] = ""
-        if item.get('is_done') is None:
-            item['is_done'] = False
 
     return templates.TemplateResponse(
         "scheduler_day.html",
@@ -707,20 +775,12 @@ async def scheduler_day_view_timeline(request: Request, date_str: str) -> Respon
         if not isinstance(data, dict):
              raise ValueError("Invalid response format")
              
-        if 'date' in data and isinstance(data['date'], str):
-            data['date'] = datetime.date.fromisoformat(data['date'])
-        else:
+        if not isinstance(data.get('date'), datetime.date):
              raise KeyError("Response missing 'date'")
              
     except (ConnectionError, ValueError, KeyError, TypeError) as exc:
         logging.error("Failed to fetch day view timeline data for %s: %s", date_str, exc)
         return JSONResponse({"error": str(exc)}, status_code=502)
-    
-    for item in data.get('timeline_items', []):
-        if item.get('log_memo') is None:
-            item['log_memo'] = ""
-        if item.get('is_done') is None:
-            item['is_done'] = False
 
     return templates.TemplateResponse(
         "scheduler_timeline_partial.html",
@@ -812,8 +872,24 @@ async def serve_file(request: Request, path: str) -> Response:
         return await serve_index(request)
     base_path = request.app.state.base_dir
     candidate = (base_path / path).resolve()
-    if not str(candidate).startswith(str(base_path.resolve())):
+    if not candidate.is_relative_to(base_path):
+        return JSONResponse({"error": "Not Found"}, status_code=404)
+    try:
+        stat_result = os.stat(candidate)
+    except OSError:
         return JSONResponse({"error": "Not Found"}, status_code=404)
-    if not candidate.exists() or not candidate.is_file():
+    if not stat.S_ISREG(stat_result.st_mode):
         return JSONResponse({"error": "Not Found"}, status_code=404)
-    return FileResponse(candidate)
+    response = FileResponse(
+        candidate,
+        stat_result=stat_result,
+        headers={"Cache-Control": _STATIC_CACHE_CONTROL},
+    )
+    if _is_not_modified(response, request):
+        headers = {
+            key: value
+            for key, value in response.headers.items()
+            if key in ("cache-control", "etag", "last-modified")
+        }
+        return Response(status_code=304, headers=headers)
+    return response
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import asyncio
+import copy
 import json
 import logging
 import os
 import time
-from typing import Any, Dict, Iterable, List
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, List
 
 import httpx
 from fastapi import Request
@@ -19,13 +21,22 @@ from .config import (
     SCHEDULER_AGENT_TIMEOUT,
     SCHEDULER_MODEL_SYNC_CONNECT_TIMEOUT,
     SCHEDULER_MODEL_SYNC_TIMEOUT,
+    SCHEDULER_UI_CACHE_TTL,
 )
 from .errors import SchedulerAgentError
+from .http_client import _get_shared_async_client
 
 _scheduler_agent_preferred_base: str | None = None
 _host_failure_cache: Dict[str, float] = {}
 _HOST_FAILURE_COOLDOWN = 60.0  # seconds
 
+# Recent Scheduler UI reads keyed by (path, params) -> (expires_at, data), so the renders of a
+# browsing burst share one upstream call. Writes made through this app clear it; the generation
+# keeps a read that was already in flight from re-caching data older than the write.
+_ui_read_cache: Dict[tuple[str, tuple[tuple[str, Any], ...]], tuple[float, Any]] = {}
+_ui_read_cache_generation = 0
+_UI_READ_CACHE_MAX_ENTRIES = 64
+
 def _scheduler_timeout(connect_timeout: float | None, read_timeout: float | None) -> httpx.Timeout:
     return httpx.Timeout(
         connect=connect_timeout,
@@ -53,6 +64,12 @@ def _mark_host_up(base_url: str):
     if base_url in _host_failure_cache:
         del _host_failure_cache[base_url]
 
+def _invalidate_scheduler_ui_cache() -> None:
+    """Drop cached Scheduler UI reads so the next render sees a write."""
+    global _ui_read_cache_generation
+    _ui_read_cache_generation += 1
+    _ui_read_cache.clear()
+
 _USE_SCHEDULER_AGENT_MCP = os.environ.get("SCHEDULER_AGENT_USE_MCP", "1").strip().lower() not in {"0", "false", "no", "off"}
 _SCHEDULER_AGENT_MCP_TOOL = os.environ.get("SCHEDULER_AGENT_MCP_TOOL", "manage_schedule").strip() or "manage_schedule"
 _SCHEDULER_AGENT_MCP_CONVERSATION_TOOL = (
@@ -160,6 +177,9 @@ async def _proxy_scheduler_agent_request(request: Request, path: str) -> Respons
             message_lines.extend(f"- {error}" for error in connection_errors)
         return JSONResponse({"status": "unavailable", "error": "\n".join(message_lines)})
 
+    if request.method not in {"GET", "HEAD", "OPTIONS"}:
+        _invalidate_scheduler_ui_cache()
+
     proxy_response = Response(response.content, status_code=response.status_code)
     excluded_headers = {"content-encoding", "transfer-encoding", "connection", "content-length"}
     for header, value in response.headers.items():
@@ -250,8 +270,9 @@ async def _call_scheduler_agent(path: str, method: str = "GET", params: Dict[str
 
     timeout = _scheduler_timeout(SCHEDULER_AGENT_CONNECT_TIMEOUT, SCHEDULER_AGENT_TIMEOUT)
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(method, url, params=params, headers=headers)
+        response = await _get_shared_async_client().request(
+            method, url, params=params, headers=headers, timeout=timeout
+        )
         if not response.is_success:
             raise ConnectionError(
                 f"Scheduler Agent API returned {response.status_code} {response.reason_phrase}"
@@ -276,10 +297,13 @@ async def _post_scheduler_agent(path: str, payload: Dict[str, Any], *, method: s
 
     timeout = _scheduler_timeout(SCHEDULER_AGENT_CONNECT_TIMEOUT, SCHEDULER_AGENT_TIMEOUT)
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.request(method, url, json=payload, headers=headers)
+        response = await _get_shared_async_client().request(
+            method, url, json=payload, headers=headers, timeout=timeout
+        )
     except httpx.RequestError as exc:
         raise SchedulerAgentError(f"Scheduler Agent への接続に失敗しました: {exc}") from exc
+    finally:
+        _invalidate_scheduler_ui_cache()
 
     if not response.is_success:
         try:
@@ -372,6 +396,7 @@ async def _call_scheduler_agent_chat(command: str) -> Dict[str, Any]:
 
     mcp_result, mcp_errors = await _call_scheduler_agent_chat_via_mcp(command)
     if mcp_result is not None:
+        _invalidate_scheduler_ui_cache()
         return mcp_result
 
     try:
@@ -397,6 +422,8 @@ async def _call_scheduler_agent_conversation_review(
 
     mcp_result, mcp_errors = await _call_scheduler_agent_conversation_review_via_mcp(conversation_history)
     if mcp_result is not None:
+        # The review may register schedule entries on the agent's side.
+        _invalidate_scheduler_ui_cache()
         return mcp_result
 
     try:
@@ -480,19 +507,88 @@ async def _call_scheduler_agent_conversation_review_via_mcp(
     return None, errors
 
 
+def _parse_iso_date_field(data: Any, key: str) -> None:
+    """Replace an ISO date string at ``data[key]`` with a ``date`` in place."""
+
+    if isinstance(data, dict) and isinstance(data.get(key), str):
+        data[key] = date.fromisoformat(data[key])
+
+
+def _prepare_calendar_data(data: Any) -> Any:
+    """Convert the calendar's ISO date strings to ``date`` objects for the templates."""
+
+    if isinstance(data, dict):
+        parse_date = date.fromisoformat
+        for week in data.get("calendar_data") or []:
+            for day_data in week:
+                if isinstance(day_data, dict):
+                    day_value = day_data.get("date")
+                    if isinstance(day_value, str):
+                        day_data["date"] = parse_date(day_value)
+        _parse_iso_date_field(data, "today")
+    return data
+
+
+def _prepare_day_view_data(data: Any) -> Any:
+    """Parse the day's date and give timeline items the defaults the templates expect."""
+
+    _parse_iso_date_field(data, "date")
+    if isinstance(data, dict):
+        for item in data.get("timeline_items") or []:
+            if item.get("log_memo") is None:
+                item["log_memo"] = ""
+            if item.get("is_done") is None:
+                item["is_done"] = False
+    return data
+
+
+async def _cached_scheduler_read(
+    path: str,
+    params: Dict[str, Any] | None = None,
+    *,
+    prepare: Callable[[Any], Any] | None = None,
+) -> Any:
+    """GET ``path`` via ``_call_scheduler_agent``, reusing a recent response for a few seconds.
+
+    ``prepare`` runs once per upstream response, before it is cached. Callers receive their
+    own copy, so filling in fields does not touch the cache.
+    """
+
+    if SCHEDULER_UI_CACHE_TTL <= 0:
+        data = await _call_scheduler_agent(path, params=params)
+        return prepare(data) if prepare is not None else data
+
+    key = (path, tuple(sorted((params or {}).items())))
+    cached = _ui_read_cache.get(key)
+    if cached is not None and cached[0] > time.monotonic():
+        return copy.deepcopy(cached[1])
+
+    generation = _ui_read_cache_generation
+    data = await _call_scheduler_agent(path, params=params)
+    if prepare is not None:
+        data = prepare(data)
+    if generation == _ui_read_cache_generation:
+        if len(_ui_read_cache) >= _UI_READ_CACHE_MAX_ENTRIES:
+            _ui_read_cache.clear()
+        _ui_read_cache[key] = (time.monotonic() + SCHEDULER_UI_CACHE_TTL, data)
+    return copy.deepcopy(data)
+
+
 async def _fetch_calendar_data(year: int, month: int) -> Dict[str, Any]:
-    """Fetch calendar data from Scheduler Agent."""
-    return await _call_scheduler_agent("/api/calendar", params={"year": year, "month": month})
+    """Fetch calendar data from Scheduler Agent, with dates already parsed."""
+    return await _cached_scheduler_read(
+        "/api/calendar", params={"year": year, "month": month}, prepare=_prepare_calendar_data
+    )
 
 
 async def _fetch_day_view_data(date_str: str) -> Dict[str, Any]:
-    """Fetch day view data from Scheduler Agent."""
-    return await _call_scheduler_agent(f"/api/day/{date_str}")
+    """Fetch day view data from Scheduler Agent, with its date already parsed."""
+    return await _cached_scheduler_read(f"/api/day/{date_str}", prepare=_prepare_day_view_data)
 
 
 async def _fetch_routines_data() -> Dict[str, Any]:
     """Fetch routines data from Scheduler Agent."""
-    return await _call_scheduler_agent("/api/routines")
+    return await _cached_scheduler_read("/api/routines")
 
 
 async def _submit_day_form(date_str: str, form_data: Any) -> None:
@@ -524,6 +620,8 @@ async def _submit_day_form(date_str: str, form_data: Any) -> None:
             )
     except httpx.RequestError as exc:  # pragma: no cover - network failure
         raise ConnectionError(f"Failed to submit day form to Scheduler Agent at {url}: {exc}") from exc
+    finally:
+        _invalidate_scheduler_ui_cache()
 
     if response.status_code in {301, 302, 303, 307, 308}:
         return
@@ -5,10 +5,12 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import threading
 from pathlib import Path
-from typing import Any, Dict, List, Iterable
+from typing import Any, Callable, Dict, List, Iterable
 
 from .config import ORCHESTRATOR_MODEL
+from .json_codec import json_dumps_indented, json_loads
 
 DEFAULT_AGENT_CONNECTIONS: Dict[str, bool] = {
     "lifestyle": True,
@@ -95,6 +97,40 @@ _AGENT_ENV_PATHS: Dict[str, Path] = {
     "memory": _REPO_ROOT / "Multi-Agent-Platform" / "secrets.env",
 }
 
+# Normalised settings keyed by file name and validated against the file's
+# (mtime_ns, size), so per-request loads skip the read and JSON parse.
+_settings_cache: Dict[str, tuple[tuple[int, int], Any]] = {}
+_settings_cache_lock = threading.Lock()
+
+
+def _load_settings_file(filename: str, normalise: Callable[[Any], Any]) -> Any:
+    """Return ``normalise(parsed JSON)`` for ``filename``, reusing it while the file is unchanged.
+
+    Raises FileNotFoundError or json.JSONDecodeError like a direct read would.
+    """
+
+    stat = os.stat(filename)
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _settings_cache_lock:
+        cached = _settings_cache.get(filename)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with open(filename, "rb") as f:
+        value = normalise(json_loads(f.read()))
+    with _settings_cache_lock:
+        _settings_cache[filename] = (key, value)
+    return value
+
+
+def _write_settings_file(filename: str, value: Any) -> None:
+    """Persist ``value`` and drop the cached copy so the next load re-reads the file."""
+
+    content = json_dumps_indented(value)
+    with open(filename, "wb") as f:
+        f.write(content)
+    with _settings_cache_lock:
+        _settings_cache.pop(filename, None)
+
 
 def _coerce_bool(value: Any, fallback: bool) -> bool:
     if isinstance(value, bool):
@@ -168,19 +204,17 @@ def _merge_connections(raw: Any) -> Dict[str, bool]:
 def load_agent_connections() -> Dict[str, bool]:
     """Load the on/off state for each agent. Defaults to all enabled."""
     try:
-        with open(_AGENT_CONNECTIONS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        connections = _load_settings_file(_AGENT_CONNECTIONS_FILE, _merge_connections)
     except (FileNotFoundError, json.JSONDecodeError):
         return dict(DEFAULT_AGENT_CONNECTIONS)
 
-    return _merge_connections(data)
+    return dict(connections)
 
 
 def save_agent_connections(payload: Dict[str, Any]) -> Dict[str, bool]:
     """Persist the agent connection toggles to disk."""
     connections = _merge_connections(payload)
-    with open(_AGENT_CONNECTIONS_FILE, "w", encoding="utf-8") as f:
-        json.dump(connections, f, ensure_ascii=False, indent=2)
+    _write_settings_file(_AGENT_CONNECTIONS_FILE, connections)
     return connections
 
 
@@ -275,12 +309,11 @@ def load_model_settings() -> Dict[str, Dict[str, str]]:
     """Load the selected LLM per agent."""
 
     try:
-        with open(_MODEL_SETTINGS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        selection = _load_settings_file(_MODEL_SETTINGS_FILE, _merge_model_selection)
     except (FileNotFoundError, json.JSONDecodeError):
         return dict(DEFAULT_MODEL_SELECTIONS)
 
-    return _merge_model_selection(data)
+    return dict(selection)
 
 
 def save_model_settings(payload: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
@@ -297,8 +330,7 @@ def save_model_settings(payload: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
             merged_input[agent] = {**existing.get(agent, {}), **value}
 
     selection = _merge_model_selection(merged_input)
-    with open(_MODEL_SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(selection, f, ensure_ascii=False, indent=2)
+    _write_settings_file(_MODEL_SETTINGS_FILE, selection)
     return selection
 
 
@@ -346,12 +378,14 @@ def _normalize_memory_settings(raw: Dict[str, Any] | None) -> Dict[str, Any]:
 def load_memory_settings() -> Dict[str, Any]:
     """Load the memory usage settings."""
     try:
-        with open(_MEMORY_SETTINGS_FILE, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        settings = _load_settings_file(
+            _MEMORY_SETTINGS_FILE,
+            lambda data: _normalize_memory_settings(data if isinstance(data, dict) else {}),
+        )
     except (FileNotFoundError, json.JSONDecodeError):
         return dict(DEFAULT_MEMORY_SETTINGS)
 
-    return _normalize_memory_settings(data if isinstance(data, dict) else {})
+    return dict(settings)
 
 
 def save_memory_settings(payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -369,8 +403,7 @@ def save_memory_settings(payload: Dict[str, Any]) -> Dict[str, Any]:
         merged[key] = value
 
     settings = _normalize_memory_settings(merged)
-    with open(_MEMORY_SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(settings, f, ensure_ascii=False, indent=2)
+    _write_settings_file(_MEMORY_SETTINGS_FILE, settings)
     return settings
 
 
@@ -0,0 +1,109 @@
+import json
+
+from multi_agent_app import history as history_module
+
+
+def _use_tmp_history_paths(monkeypatch, tmp_path):
+    primary = tmp_path / "chat_history.json"
+    fallback = tmp_path / "var" / "chat_history.json"
+    monkeypatch.setattr(history_module, "_PRIMARY_CHAT_HISTORY_PATH", primary)
+    monkeypatch.setattr(history_module, "_FALLBACK_CHAT_HISTORY_PATH", fallback)
+    monkeypatch.setattr(history_module, "_LEGACY_CHAT_HISTORY_PATHS", [])
+    monkeypatch.setattr(history_module, "_chat_history_cache", {})
+    return primary, fallback
+
+
+def test_load_chat_history_reuses_parse_until_file_changes(monkeypatch, tmp_path):
+    primary, _ = _use_tmp_history_paths(monkeypatch, tmp_path)
+    primary.write_text(json.dumps([{"id": 1, "role": "user", "content": "hi"}]), encoding="utf-8")
+
+    first, path = history_module._load_chat_history()
+    assert path == primary
+    first.append({"id": 2, "role": "assistant", "content": "mutated"})
+
+    calls = []
+    real_loads = history_module.json_loads
+    monkeypatch.setattr(history_module, "json_loads", lambda raw: calls.append(raw) or real_loads(raw))
+
+    second, _ = history_module._load_chat_history()
+    assert second == [{"id": 1, "role": "user", "content": "hi"}]
+    assert calls == []
+
+    primary.write_text(
+        json.dumps([{"id": 1, "role": "user", "content": "hi"}, {"id": 2, "role": "user", "content": "again"}]),
+        encoding="utf-8",
+    )
+    third, _ = history_module._load_chat_history()
+    assert len(third) == 2
+    assert len(calls) == 1
+
+
+def test_write_chat_history_refreshes_cache(monkeypatch, tmp_path):
+    _, fallback = _use_tmp_history_paths(monkeypatch, tmp_path)
+    entries = [{"id": 1, "role": "user", "content": "hello"}]
+
+    history_module._write_chat_history(entries, preferred_path=fallback)
+    assert history_module._read_chat_history() == entries
+
+
+def test_recent_chat_history_contents_respects_window(monkeypatch, tmp_path):
+    _, fallback = _use_tmp_history_paths(monkeypatch, tmp_path)
+    monkeypatch.setattr(history_module, "_chat_history_contents_cache", {})
+    entries = [{"id": idx, "role": "assistant", "content": f" line {idx} "} for idx in range(1, 6)]
+    history_module._write_chat_history(entries, preferred_path=fallback)
+
+    recent = history_module._recent_chat_history_contents(2)
+    assert recent == frozenset({"line 4", "line 5"})
+    assert history_module._recent_chat_history_contents(2) is recent
+
+    history_module._write_chat_history(entries + [{"id": 6, "role": "user", "content": "line 6"}], fallback)
+    assert "line 6" in history_module._recent_chat_history_contents(2)
+
+
+def test_append_to_chat_history_many_writes_once(monkeypatch, tmp_path):
+    _, fallback = _use_tmp_history_paths(monkeypatch, tmp_path)
+    history_module._write_chat_history([{"id": 1, "role": "user", "content": "hi"}], fallback)
+
+    writes = []
+    real_write = history_module._write_chat_history
+    monkeypatch.setattr(
+        history_module,
+        "_write_chat_history",
+        lambda history, preferred_path=None: writes.append(len(history)) or real_write(history, preferred_path),
+    )
+    refreshes = []
+    monkeypatch.setattr(history_module, "_refresh_memory", lambda kind, recent: refreshes.append(len(recent)))
+    monkeypatch.setattr(history_module, "_consolidate_short_into_long", lambda recent: None)
+    monkeypatch.setattr(history_module, "load_memory_settings", lambda: {"history_sync_enabled": False})
+
+    history_module._append_to_chat_history_many(
+        [("assistant", "plan", None), ("assistant", "result", {"id": 99, "source": "test"})]
+    )
+
+    assert writes == [3]
+    saved = history_module._read_chat_history()
+    assert [entry["id"] for entry in saved] == [1, 2, 3]
+    assert saved[2]["source"] == "test"
+    assert len(refreshes) <= 1
+
+
+def test_write_chat_history_keeps_readable_utf8(monkeypatch, tmp_path):
+    _, fallback = _use_tmp_history_paths(monkeypatch, tmp_path)
+    entries = [{"id": 1, "role": "assistant", "content": "こんにちは"}]
+
+    history_module._write_chat_history(entries, preferred_path=fallback)
+
+    raw = fallback.read_text(encoding="utf-8")
+    assert "こんにちは" in raw
+    assert json.loads(raw) == entries
+
+
+def test_read_chat_history_bytes_serves_file_verbatim(monkeypatch, tmp_path):
+    primary, _ = _use_tmp_history_paths(monkeypatch, tmp_path)
+    raw = json.dumps([{"id": 1, "role": "user", "content": "こんにちは"}], ensure_ascii=False).encode("utf-8")
+    primary.write_bytes(raw)
+
+    assert history_module._read_chat_history_bytes() == raw
+
+    primary.write_text("{not json", encoding="utf-8")
+    assert json.loads(history_module._read_chat_history_bytes()) == []
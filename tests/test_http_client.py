@@ -0,0 +1,43 @@
+import asyncio
+
+from multi_agent_app import http_client
+
+
+def test_shared_client_is_reused_within_a_loop_and_not_across_loops():
+    async def _grab_twice():
+        first = http_client._get_shared_async_client()
+        second = http_client._get_shared_async_client()
+        await http_client._close_shared_async_client()
+        return first, second
+
+    first, second = asyncio.run(_grab_twice())
+    assert first is second
+    assert first.is_closed
+
+    other, _ = asyncio.run(_grab_twice())
+    assert other is not first
+
+
+def test_short_lived_loops_leave_no_pooled_clients(monkeypatch):
+    monkeypatch.setattr(http_client, "_clients", http_client.weakref.WeakKeyDictionary())
+
+    async def _use_client():
+        return http_client._get_shared_async_client()
+
+    clients = [asyncio.run(http_client._run_and_close_shared_async_client(_use_client())) for _ in range(3)]
+
+    assert len(http_client._clients) == 0
+    assert all(client.is_closed for client in clients)
+
+
+def test_orchestrator_run_async_closes_its_loop_client(monkeypatch):
+    from multi_agent_app.orchestrator import MultiAgentOrchestrator
+
+    monkeypatch.setattr(http_client, "_clients", http_client.weakref.WeakKeyDictionary())
+
+    async def _use_client():
+        http_client._get_shared_async_client()
+        return "done"
+
+    assert MultiAgentOrchestrator._run_async(_use_client()) == "done"
+    assert len(http_client._clients) == 0
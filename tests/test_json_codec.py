@@ -0,0 +1,14 @@
+import json
+
+from multi_agent_app import json_codec
+
+
+def test_stdlib_fallback_matches_orjson_output(monkeypatch):
+    value = {"name": "太郎", "items": [1, {"done": True}], "empty": None}
+    fast = (json_codec.json_dumps(value), json_codec.json_dumps_indented(value))
+
+    monkeypatch.setattr(json_codec, "orjson", None)
+    slow = (json_codec.json_dumps(value), json_codec.json_dumps_indented(value))
+
+    assert slow == fast
+    assert json.loads(slow[1]) == value
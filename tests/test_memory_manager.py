@@ -0,0 +1,40 @@
+import json
+
+from multi_agent_app import memory_manager as memory_module
+
+
+def test_get_formatted_memory_reuses_text_until_file_changes(monkeypatch, tmp_path):
+    monkeypatch.setattr(memory_module, "_formatted_memory_cache", {})
+    path = tmp_path / "long_term_memory.json"
+    manager = memory_module.MemoryManager(str(path))
+    memory = manager.load_memory()
+    memory["user_profile"] = {"name": "Taro"}
+    manager.save_memory(memory)
+
+    loads = []
+    real_load = manager.load_memory
+    monkeypatch.setattr(manager, "load_memory", lambda: loads.append(1) or real_load())
+
+    first = manager.get_formatted_memory()
+    assert "Taro" in first
+    assert manager.get_formatted_memory() == first
+    assert len(loads) == 1
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["user_profile"] = {"name": "Hanako"}
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    assert "Hanako" in manager.get_formatted_memory()
+    assert len(loads) == 2
+
+
+def test_save_memory_writes_readable_utf8(tmp_path):
+    path = tmp_path / "long_term_memory.json"
+    manager = memory_module.MemoryManager(str(path))
+    memory = manager.load_memory()
+    memory["user_profile"] = {"name": "太郎"}
+    manager.save_memory(memory)
+
+    text = path.read_text(encoding="utf-8")
+    assert "太郎" in text
+    assert json.loads(text)["user_profile"] == {"name": "太郎"}
+    assert manager.load_memory()["user_profile"] == {"name": "太郎"}
@@ -0,0 +1,601 @@
+import asyncio
+from collections import OrderedDict
+
+import httpx
+
+from multi_agent_app import orchestrator as orchestrator_module
+
+
+def _orchestrator_instance():
+    # Bypass __init__ to avoid external LLM config.
+    instance = orchestrator_module.MultiAgentOrchestrator.__new__(
+        orchestrator_module.MultiAgentOrchestrator
+    )
+    instance._replan_cache = OrderedDict()
+    instance._structured_llms = {}
+    instance._actionability_cache = OrderedDict()
+    instance.actionability_cache_stats = {"hits": 0, "misses": 0}
+    return instance
+
+
+def _execution(agent, command, status="success"):
+    return {"agent": agent, "command": command, "status": status, "response": "ok", "error": None}
+
+
+def test_snapshot_state_reuses_unchanged_tasks_and_extends_executions():
+    orchestrator = _orchestrator_instance()
+    tasks = [{"agent": "browser", "command": "open"}, {"agent": "iot", "command": "lights"}]
+    executions = [_execution("browser", "open")]
+    state = {"tasks": tasks, "executions": executions, "plan_summary": "plan"}
+    cache = {}
+
+    first = orchestrator._snapshot_state(state, cache)
+    second = orchestrator._snapshot_state(state, cache)
+    assert second["tasks"] is first["tasks"]
+    assert second["executions"] is first["executions"]
+    assert second is first
+    assert orchestrator._diff_snapshot(first, second) == {}
+    state["current_index"] = 1
+    assert orchestrator._snapshot_state(state, cache) is not first
+    # Another run keeps its own cache, so it neither reuses nor evicts this run's snapshot.
+    assert orchestrator._snapshot_state(state, {}) is not orchestrator._snapshot_state(state, cache)
+
+    executions.append(_execution("iot", "lights"))
+    third = orchestrator._snapshot_state(state, cache)
+    assert third["tasks"] is first["tasks"]
+    assert [entry["agent"] for entry in third["executions"]] == ["browser", "iot"]
+    assert len(first["executions"]) == 1
+
+    state["tasks"] = [{"agent": "scheduler", "command": "plan day"}]
+    fourth = orchestrator._snapshot_state(state, cache)
+    assert fourth["tasks"] == [{"agent": "scheduler", "command": "plan day"}]
+
+
+def test_is_trivially_actionable_prefilter():
+    orchestrator = _orchestrator_instance()
+    assert orchestrator._is_trivially_actionable("iot", "LEDを点灯して")
+    assert orchestrator._is_trivially_actionable("browser", "Yahoo!ニュースの主要トピックを3件調べて")
+    assert not orchestrator._is_trivially_actionable("browser", "Amazonで商品を購入して")
+    assert orchestrator._is_trivially_actionable("scheduler", "明日 10:00 に会議の予定を登録して")
+    assert not orchestrator._is_trivially_actionable("scheduler", "予定を登録して")
+    assert orchestrator._is_trivially_actionable("lifestyle", "おすすめのレシピを教えて")
+    assert not orchestrator._is_trivially_actionable("lifestyle", "冷蔵庫を買い替えたい")
+
+
+def test_parse_plan_handles_fenced_and_loose_json():
+    orchestrator = _orchestrator_instance()
+    fenced = 'こちらです\n```json\n{"plan_summary": "ok", "tasks": [],}\n```'
+    assert orchestrator._parse_plan(fenced) == {"plan_summary": "ok", "tasks": []}
+    embedded = 'Plan: {"plan_summary": "s", "tasks": [{"agent": "iot", "command": "c"}]} done'
+    assert orchestrator._parse_plan(embedded)["tasks"][0]["agent"] == "iot"
+    assert orchestrator._parse_plan("{'plan_summary': 'py', 'tasks': []}")["plan_summary"] == "py"
+
+
+def test_replan_reuses_plan_for_identical_context():
+    orchestrator = _orchestrator_instance()
+    calls = []
+
+    async def fake_plan_node(state, *, incremental=False):
+        calls.append(incremental)
+        return {"plan_summary": "next", "tasks": [{"agent": "iot", "command": "on"}], "executions": []}
+
+    orchestrator._plan_node = fake_plan_node
+    executions = [_execution("browser", "open")]
+    replan_input = {"user_input": "hi", "tasks": [], "executions": executions, "agent_connections": {"iot": True}}
+
+    first = asyncio.run(orchestrator._replan(replan_input))
+    first["tasks"].append({"agent": "iot", "command": "mutated"})
+    second = asyncio.run(orchestrator._replan(dict(replan_input)))
+
+    assert calls == [True]
+    assert second["tasks"] == [{"agent": "iot", "command": "on"}]
+    assert second["executions"] is executions
+
+    asyncio.run(orchestrator._replan({**replan_input, "executions": executions + [_execution("iot", "on")]}))
+    assert len(calls) == 2
+
+    # Another session with the same request and results has its own history, so it re-plans.
+    other_session = {**replan_input, "session_history": [{"role": "user", "content": "別の会話"}]}
+    asyncio.run(orchestrator._replan(other_session))
+    assert len(calls) == 3
+    asyncio.run(orchestrator._replan({**other_session, "session_history_summary": "要約"}))
+    assert len(calls) == 4
+
+
+def test_iter_progress_batches_coalesces_bursts_and_keeps_order():
+    orchestrator = _orchestrator_instance()
+
+    async def events():
+        for idx in range(3):
+            yield {"type": "progress", "text": f"p{idx}"}
+        await asyncio.sleep(0.15)
+        yield {"type": "progress", "text": "late"}
+        yield {"type": "result", "result": {"status": "success"}}
+
+    async def collect():
+        return [event async for event in orchestrator._iter_progress_batches(events())]
+
+    batched = asyncio.run(collect())
+    assert [event["type"] for event in batched] == ["progress_batch", "progress", "result"]
+    assert [item["text"] for item in batched[0]["items"]] == ["p0", "p1", "p2"]
+    assert batched[1]["text"] == "late"
+
+
+def test_iter_progress_batches_merges_updates_to_the_same_message():
+    orchestrator = _orchestrator_instance()
+
+    async def events():
+        yield {"type": "progress", "text": "a", "message_id": 7, "mode": "append"}
+        yield {"type": "progress", "text": "x", "message_id": None, "mode": "append"}
+        yield {"type": "progress", "text": "ab", "message_id": 7, "mode": "update"}
+        yield {"type": "result", "result": {"status": "success"}}
+
+    async def collect():
+        return [event async for event in orchestrator._iter_progress_batches(events())]
+
+    batched = asyncio.run(collect())
+    assert [(item["text"], item["mode"]) for item in batched[0]["items"]] == [("ab", "append"), ("x", "append")]
+
+
+def test_event_payload_sends_diffs_between_full_state_events():
+    orchestrator = _orchestrator_instance()
+    executions = [_execution("browser", "open")]
+    state = {"tasks": [{"agent": "iot", "command": "on"}], "executions": executions, "plan_summary": "p"}
+    emitted = {}
+
+    plan = orchestrator._event_payload("plan", state, emitted=emitted)
+    assert plan["seq"] == 1 and "diff" not in plan
+    assert plan["state"]["tasks"] == [{"agent": "iot", "command": "on"}]
+
+    executions.append(_execution("iot", "on"))
+    state["current_index"] = 2
+    after = orchestrator._event_payload("after_execution", state, emitted=emitted, task_index=1)
+    assert after["seq"] == 2 and after["diff"] is True
+    assert after["task_index"] == 1
+    assert set(after["state"]) == {"executions_appended", "executions_total", "current_index"}
+    assert after["state"]["executions_total"] == 2
+    assert [entry["agent"] for entry in after["state"]["executions_appended"]] == ["iot"]
+
+    complete = orchestrator._event_payload("complete", state, emitted=emitted)
+    assert len(complete["state"]["executions"]) == 2
+
+
+def test_same_text_checks_hash_before_content():
+    same = orchestrator_module.MultiAgentOrchestrator._same_text
+    text = "計画: " + "x" * 64
+    assert same(text, "".join(["計画: ", "x" * 64]))
+    assert not same(text, text + "y")
+    assert not same(text, None)
+
+
+def test_session_history_keeps_window_and_condenses_overflow():
+    cls = orchestrator_module.MultiAgentOrchestrator
+    state = {"session_history": []}
+    for idx in range(cls._SESSION_HISTORY_WINDOW + 2):
+        cls._append_session_history_entry(state, "assistant", f"entry {idx}")
+
+    assert len(state["session_history"]) == cls._SESSION_HISTORY_WINDOW
+    assert state["session_history"][0]["content"] == "entry 2"
+    assert state["session_history_summary"] == "assistant: entry 0\nassistant: entry 1"
+
+
+def test_run_stream_skips_replan_after_plain_success(monkeypatch):
+    orchestrator = _orchestrator_instance()
+    monkeypatch.setattr(orchestrator_module, "load_agent_connections", lambda: {})
+    monkeypatch.setattr(orchestrator_module, "ORCHESTRATOR_SKIP_REPLAN_ON_SUCCESS", True)
+    orchestrator._trigger_memory_consolidation = lambda history: None
+    plan_calls = []
+
+    async def fake_plan_node(state, *, incremental=False):
+        plan_calls.append(incremental)
+        tasks = [] if incremental else [{"agent": "iot", "command": "on"}, {"agent": "iot", "command": "off"}]
+        return {"plan_summary": "p", "tasks": tasks}
+
+    async def fake_execute_task(task):
+        return _execution(task["agent"], task["command"])
+
+    orchestrator._plan_node = fake_plan_node
+    orchestrator._execute_task = fake_execute_task
+
+    async def collect():
+        return [event async for event in orchestrator.run_stream("hi")]
+
+    events = asyncio.run(collect())
+    assert [event["event"] for event in events].count("after_execution") == 2
+    # Only the initial plan and the re-plan after the last task reach the planner.
+    assert plan_calls == [False, True]
+
+
+def test_run_stream_replans_after_every_success_by_default(monkeypatch):
+    orchestrator = _orchestrator_instance()
+    monkeypatch.setattr(orchestrator_module, "load_agent_connections", lambda: {})
+    monkeypatch.setattr(orchestrator_module, "ORCHESTRATOR_SKIP_REPLAN_ON_SUCCESS", False)
+    orchestrator._trigger_memory_consolidation = lambda history: None
+    plan_calls = []
+
+    async def fake_plan_node(state, *, incremental=False):
+        plan_calls.append(incremental)
+        executed = len(state.get("executions") or [])
+        tasks = [{"agent": "iot", "command": "on"}, {"agent": "iot", "command": "off"}][executed:]
+        return {"plan_summary": f"p{executed}", "tasks": tasks}
+
+    async def fake_execute_task(task):
+        return _execution(task["agent"], task["command"])
+
+    orchestrator._plan_node = fake_plan_node
+    orchestrator._execute_task = fake_execute_task
+
+    async def collect():
+        return [event async for event in orchestrator.run_stream("hi")]
+
+    events = asyncio.run(collect())
+    assert [event["event"] for event in events].count("after_execution") == 2
+    assert plan_calls == [False, True, True]
+
+
+def test_get_orchestrator_reuses_resolved_config_within_ttl(monkeypatch):
+    resolved = []
+
+    def fake_resolve(kind):
+        resolved.append(kind)
+        return {"provider": "openai", "model": "m", "base_url": "", "api_key_fingerprint": "k"}
+
+    monkeypatch.setattr(orchestrator_module, "resolve_llm_config", fake_resolve)
+    monkeypatch.setattr(orchestrator_module, "_orchestrator_service", _orchestrator_instance())
+    monkeypatch.setattr(orchestrator_module, "_orchestrator_signature", ("openai", "m", "", "k"))
+    monkeypatch.setattr(orchestrator_module, "_orchestrator_config_checked_at", float("-inf"))
+
+    first = orchestrator_module._get_orchestrator()
+    second = orchestrator_module._get_orchestrator()
+    assert first is second
+    assert resolved == ["orchestrator"]
+
+    orchestrator_module._invalidate_orchestrator_config()
+    orchestrator_module._get_orchestrator()
+    assert resolved == ["orchestrator", "orchestrator"]
+
+
+def test_first_nonempty_stripped_skips_blank_values():
+    pick = orchestrator_module._first_nonempty_stripped
+    assert pick({"response": "  ", "error": " boom "}, "response", "error") == "boom"
+    assert pick({"response": None}, "response", "error") == ""
+    assert pick({"plan": 3}, "plan_summary", "plan") == "3"
+
+
+def test_run_only_builds_the_complete_payload(monkeypatch):
+    orchestrator = _orchestrator_instance()
+    monkeypatch.setattr(orchestrator_module, "load_agent_connections", lambda: {})
+    orchestrator._trigger_memory_consolidation = lambda history: None
+
+    async def fake_plan_node(state, *, incremental=False):
+        return {"plan_summary": "p", "tasks": [] if incremental else [{"agent": "iot", "command": "on"}]}
+
+    async def fake_execute_task(task):
+        return _execution(task["agent"], task["command"])
+
+    orchestrator._plan_node = fake_plan_node
+    orchestrator._execute_task = fake_execute_task
+    built = []
+    real_event_payload = orchestrator._event_payload
+    orchestrator._event_payload = lambda event_type, *args, **kwargs: built.append(event_type) or real_event_payload(
+        event_type, *args, **kwargs
+    )
+
+    result = asyncio.run(orchestrator.run("hi"))
+    assert built == ["complete"]
+    assert [entry["agent"] for entry in result["executions"]] == ["iot"]
+
+
+def test_plan_signature_ignores_task_identity_but_not_content():
+    signature = orchestrator_module.MultiAgentOrchestrator._plan_signature
+    tasks = [{"agent": "iot", "command": "on "}]
+    assert signature("p", tasks) == signature("p", [{"agent": "iot", "command": "on"}])
+    assert signature("p", tasks) != signature("q", tasks)
+    assert signature("p", tasks) != signature("p", [])
+
+
+def test_run_stream_retrieves_failed_replan_when_consumer_leaves(monkeypatch):
+    import gc
+
+    orchestrator = _orchestrator_instance()
+    monkeypatch.setattr(orchestrator_module, "load_agent_connections", lambda: {})
+    monkeypatch.setattr(orchestrator_module, "ORCHESTRATOR_SKIP_REPLAN_ON_SUCCESS", False)
+    orchestrator._trigger_memory_consolidation = lambda history: None
+
+    async def fake_plan_node(state, *, incremental=False):
+        if incremental:
+            raise RuntimeError("planner down")
+        return {"plan_summary": "p", "tasks": [{"agent": "iot", "command": "on"}]}
+
+    async def fake_execute_task(task):
+        return _execution(task["agent"], task["command"])
+
+    orchestrator._plan_node = fake_plan_node
+    orchestrator._execute_task = fake_execute_task
+    unhandled = []
+
+    async def leave_during_after_execution():
+        asyncio.get_running_loop().set_exception_handler(lambda loop, context: unhandled.append(context))
+        stream = orchestrator.run_stream("hi")
+        async for event in stream:
+            if event["event"] == "after_execution":
+                # Let the re-plan fail before the consumer disconnects.
+                await asyncio.sleep(0.01)
+                break
+        await stream.aclose()
+        gc.collect()
+
+    asyncio.run(leave_during_after_execution())
+    assert unhandled == []
+
+
+def test_run_stream_runs_planner_marked_parallel_tasks_together(monkeypatch):
+    orchestrator = _orchestrator_instance()
+    monkeypatch.setattr(orchestrator_module, "load_agent_connections", lambda: {})
+    # Keep the planned scheduler task after the parallel batch instead of re-planning it away.
+    monkeypatch.setattr(orchestrator_module, "ORCHESTRATOR_SKIP_REPLAN_ON_SUCCESS", True)
+    orchestrator._trigger_memory_consolidation = lambda history: None
+
+    async def fake_plan_node(state, *, incremental=False):
+        if incremental:
+            return {"plan_summary": "done", "tasks": []}
+        tasks = [
+            {"agent": "iot", "command": "lights", "parallel": True},
+            {"agent": "lifestyle", "command": "recipe", "parallel": True},
+            {"agent": "scheduler", "command": "register"},
+        ]
+        return {"plan_summary": "p", "tasks": tasks}
+
+    running = []
+    overlapped = []
+
+    async def fake_assess_many(tasks):
+        return [{"status": "ok", "message": ""} for _ in tasks]
+
+    async def fake_execute_task(task, *, assessment=None):
+        assert assessment == {"status": "ok", "message": ""} or task["agent"] == "scheduler"
+        running.append(task["agent"])
+        await asyncio.sleep(0.01)
+        overlapped.append(len(running))
+        running.remove(task["agent"])
+        return _execution(task["agent"], task["command"])
+
+    orchestrator._plan_node = fake_plan_node
+    orchestrator._execute_task = fake_execute_task
+    orchestrator._assess_actionability_many = fake_assess_many
+
+    async def collect():
+        return [event async for event in orchestrator.run_stream("hi")]
+
+    events = asyncio.run(collect())
+    names = [event["event"] for event in events]
+    assert names[1:5] == ["before_execution", "before_execution", "after_execution", "after_execution"]
+    assert overlapped[:2] == [2, 1]
+    assert [event["task_index"] for event in events if event["event"] == "after_execution"] == [0, 1, 2]
+
+
+def test_assess_actionability_many_sends_one_llm_batch():
+    orchestrator = _orchestrator_instance()
+    batches = []
+
+    class FakeLLM:
+        def batch(self, inputs, config=None, return_exceptions=False):
+            batches.append(len(inputs))
+            return ['{"status": "needs_info", "message": "いつですか"}', RuntimeError("boom")]
+
+    orchestrator._llm = FakeLLM()
+    tasks = [
+        {"agent": "scheduler", "command": "明日 10:00 に会議を登録して"},
+        {"agent": "lifestyle", "command": "冷蔵庫を買い替えたい"},
+        {"agent": "scheduler", "command": "予定を登録して"},
+    ]
+
+    assessments = asyncio.run(orchestrator._assess_actionability_many(tasks))
+    assert batches == [2]
+    assert assessments == [
+        {"status": "ok", "message": ""},
+        {"status": "needs_info", "message": "いつですか"},
+        {"status": "ok"},
+    ]
+    assert asyncio.run(orchestrator._assess_actionability({"agent": "scheduler", "command": "？！…"}))[
+        "status"
+    ] == "needs_info"
+
+
+def test_assess_actionability_prefers_structured_output_and_falls_back_once():
+    orchestrator = _orchestrator_instance()
+    calls = []
+
+    class FailingStructured:
+        def invoke(self, messages):
+            calls.append("structured")
+            raise NotImplementedError("tools not supported")
+
+    class FakeLLM:
+        def with_structured_output(self, schema, method=None, include_raw=False):
+            return FailingStructured()
+
+        def invoke(self, messages):
+            calls.append("plain")
+            return '```json\n{"status": "needs_info", "message": "いつですか"}\n```'
+
+    orchestrator._llm = FakeLLM()
+    task = {"agent": "scheduler", "command": "予定を登録して"}
+    assert asyncio.run(orchestrator._assess_actionability(task)) == {"status": "needs_info", "message": "いつですか"}
+    asyncio.run(orchestrator._assess_actionability({"agent": "scheduler", "command": "会議を入れて"}))
+    assert calls == ["structured", "plain", "plain"]
+
+    parsed = orchestrator_module._ActionabilitySchema(status="ok")
+    assert orchestrator._structured_data({"raw": None, "parsed": parsed, "parsing_error": None}) == {
+        "status": "ok",
+        "message": "",
+    }
+
+
+def test_structured_output_survives_transient_and_parse_failures():
+    orchestrator = _orchestrator_instance()
+    calls = []
+
+    class FlakyStructured:
+        def invoke(self, messages):
+            calls.append("structured")
+            if calls.count("structured") == 1:
+                raise httpx.ReadTimeout("timed out")
+            if calls.count("structured") == 2:
+                return {"raw": "looks ok {but not json", "parsed": None, "parsing_error": None}
+            return {"raw": None, "parsed": orchestrator_module._ReviewSchema(review_status="ok"), "parsing_error": None}
+
+    class FakeLLM:
+        def with_structured_output(self, schema, method=None, include_raw=False):
+            return FlakyStructured()
+
+        def invoke(self, messages):
+            calls.append("plain")
+            return '{"review_status": "retry", "review_reason": "plain"}'
+
+    orchestrator._llm = FakeLLM()
+    schema = orchestrator_module._ReviewSchema
+    assert asyncio.run(orchestrator._invoke_structured(schema, []))["review_status"] == "retry"
+    assert asyncio.run(orchestrator._invoke_structured(schema, []))["review_status"] == "retry"
+    assert asyncio.run(orchestrator._invoke_structured(schema, []))["review_status"] == "ok"
+    assert calls == ["structured", "plain", "structured", "plain", "structured"]
+    assert orchestrator._structured_llms[schema] is not None
+
+
+def test_assess_actionability_reuses_llm_verdict_for_same_command():
+    orchestrator = _orchestrator_instance()
+    calls = []
+
+    class FakeLLM:
+        def invoke(self, messages):
+            calls.append(messages)
+            return '{"status": "needs_info", "message": "いつですか"}'
+
+    orchestrator._llm = FakeLLM()
+    task = {"agent": "scheduler", "command": "予定を登録して"}
+    first = asyncio.run(orchestrator._assess_actionability(task))
+    first["message"] = "mutated"
+    second = asyncio.run(orchestrator._assess_actionability({"agent": "scheduler", "command": " 予定を登録して "}))
+
+    assert second == {"status": "needs_info", "message": "いつですか"}
+    assert len(calls) == 1
+    assert orchestrator.actionability_cache_stats == {"hits": 1, "misses": 1}
+
+
+def test_normalise_tasks_reports_skipped_agents_past_the_task_cap(monkeypatch):
+    monkeypatch.setattr(orchestrator_module, "ORCHESTRATOR_MAX_TASKS", 1)
+    orchestrator = _orchestrator_instance()
+    raw_tasks = [
+        {"agent": "browser", "command": "open", "parallel": True},
+        {"agent": "lifestyle", "command": "recipe"},
+        {"agent": "IoT", "command": ""},
+        "ignored",
+    ]
+
+    tasks, skipped = orchestrator._normalise_tasks(
+        raw_tasks, allowed_agents=["browser", "lifestyle"], disabled_agents=["iot"]
+    )
+    assert tasks == [{"agent": "browser", "command": "open", "parallel": True}]
+    assert skipped == {"iot"}
+
+
+def test_history_messages_are_role_typed_and_merged():
+    entries = [
+        {"role": "user", "content": "献立を考えて"},
+        {"role": "assistant", "content": "計画"},
+        {"role": "assistant", "content": "結果"},
+        {"role": "user", "content": "登録して"},
+    ]
+    messages = orchestrator_module.MultiAgentOrchestrator._history_messages(entries)
+    assert [type(message).__name__ for message in messages] == ["HumanMessage", "AIMessage", "HumanMessage"]
+    assert messages[1].content == "計画\n結果"
+
+
+def test_browser_progress_reports_stream_connect_timeout_as_event(monkeypatch):
+    orchestrator = _orchestrator_instance()
+    history_calls = []
+
+    async def handler(request):
+        path = request.url.path
+        if path == "/api/history":
+            history_calls.append(path)
+            if len(history_calls) == 1:
+                return httpx.Response(200, json={"messages": []})
+            return httpx.Response(200, json={"messages": [{"id": 2, "role": "assistant", "content": "最終報告: 完了"}]})
+        if path == "/api/stream":
+            await asyncio.sleep(5)
+            return httpx.Response(200, text="")
+        return httpx.Response(200, json={"run_summary": "最終報告: 完了", "messages": [{"id": 2}]})
+
+    async def consume():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(orchestrator_module, "_get_shared_async_client", lambda: client)
+        monkeypatch.setattr(orchestrator_module, "BROWSER_AGENT_CONNECT_TIMEOUT", 0.05)
+        try:
+            return [
+                event
+                async for event in orchestrator._iter_browser_agent_progress_for_base("http://browser", "調べて")
+            ]
+        finally:
+            await client.aclose()
+
+    events = asyncio.run(asyncio.wait_for(consume(), timeout=3))
+    assert events[-1]["type"] == "result"
+    assert events[-1]["result"]["status"] == "success"
+
+
+def test_planner_prompt_describes_only_enabled_agents():
+    orchestrator = _orchestrator_instance()
+    prompt = orchestrator._planner_prompt(["iot"], ["browser"], None)
+    assert '"iot"（IoTエージェント）' in prompt
+    assert '"browser"（Browserエージェント）' not in prompt
+    assert '"scheduler"（Schedulerエージェント）' not in prompt
+    everything = orchestrator._planner_prompt(["lifestyle", "browser", "iot", "scheduler"], [], None)
+    assert all(f'"{agent}"（' in everything for agent in ("lifestyle", "browser", "iot", "scheduler"))
+
+
+def test_browser_progress_stops_a_stream_left_open_after_chat(monkeypatch):
+    orchestrator = _orchestrator_instance()
+    monkeypatch.setattr(orchestrator, "_BROWSER_STREAM_DRAIN_TIMEOUT", 0.1)
+    history_calls = []
+
+    async def idle_stream():
+        yield b": connected\n\n"
+        await asyncio.sleep(30)
+
+    async def handler(request):
+        path = request.url.path
+        if path == "/api/history":
+            history_calls.append(path)
+            if len(history_calls) == 1:
+                return httpx.Response(200, json={"messages": []})
+            return httpx.Response(200, json={"messages": [{"id": 2, "role": "assistant", "content": "最終報告: 完了"}]})
+        if path == "/api/stream":
+            return httpx.Response(200, content=idle_stream())
+        return httpx.Response(200, json={"run_summary": "最終報告: 完了", "messages": [{"id": 2}]})
+
+    async def consume():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        monkeypatch.setattr(orchestrator_module, "_get_shared_async_client", lambda: client)
+        try:
+            return [
+                event
+                async for event in orchestrator._iter_browser_agent_progress_for_base("http://browser", "調べて")
+            ]
+        finally:
+            await client.aclose()
+
+    events = asyncio.run(asyncio.wait_for(consume(), timeout=3))
+    assert events[-1]["result"]["status"] == "success"
+
+
+def test_iter_sse_frames_handles_split_chunks_and_crlf():
+    async def chunks():
+        yield b": hello\r\nevent: up"
+        yield b'date\r\ndata: {"a":\r\ndata: 1}\r\n\r\ndata: {"b": 2}\n'
+        yield b"\nignored\n"
+
+    async def collect():
+        return [frame async for frame in orchestrator_module._iter_sse_frames(chunks())]
+
+    assert asyncio.run(collect()) == [("update", b'{"a":\n1}'), ("message", b'{"b": 2}')]
@@ -0,0 +1,185 @@
+import asyncio
+
+import httpx
+
+from multi_agent_app import routes
+from multi_agent_app.request_context import get_browser_agent_bases
+
+
+def test_broadcast_model_settings_pushes_to_agents_concurrently(monkeypatch):
+    monkeypatch.setattr(routes, "_iter_iot_agent_bases", lambda: ["http://iot"])
+    monkeypatch.setattr(routes, "_iter_scheduler_agent_bases", lambda: ["http://scheduler", "http://scheduler", "http://localhost:5010"])
+    received = []
+
+    async def broadcast():
+        both_arrived = asyncio.Event()
+
+        async def handler(request):
+            received.append(str(request.url))
+            # Only answers once both pushes are in flight, so a serial broadcast would time out.
+            if len(received) == 2:
+                both_arrived.set()
+            await asyncio.wait_for(both_arrived.wait(), timeout=1)
+            return httpx.Response(200, json={})
+
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            monkeypatch.setattr(routes, "_get_shared_async_client", lambda: client)
+            await routes._broadcast_model_settings(
+                {"iot": {"provider": "openai"}, "scheduler": {"provider": "openai"}}
+            )
+
+    asyncio.run(broadcast())
+
+    assert sorted(received) == ["http://iot/model_settings", "http://scheduler/model_settings"]
+
+
+def test_broadcast_model_settings_repushes_unchanged_payloads(monkeypatch):
+    monkeypatch.setattr(routes, "_iter_iot_agent_bases", lambda: ["http://iot"])
+    received = []
+
+    def handler(request):
+        received.append(str(request.url))
+        return httpx.Response(200, json={})
+
+    async def broadcast(selection):
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            monkeypatch.setattr(routes, "_get_shared_async_client", lambda: client)
+            await routes._broadcast_model_settings(selection)
+
+    # A restarted agent loses its selection, so saving the same settings again must reach it.
+    asyncio.run(broadcast({"iot": {"provider": "openai", "model": "a"}}))
+    asyncio.run(broadcast({"iot": {"provider": "openai", "model": "a"}}))
+    assert received == ["http://iot/model_settings", "http://iot/model_settings"]
+
+
+def test_serve_file_answers_revalidation_with_not_modified(tmp_path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    (tmp_path / "app.js").write_text("console.log('hi');", encoding="utf-8")
+    app = FastAPI()
+    app.state.base_dir = tmp_path.resolve()
+    app.include_router(routes.router)
+    client = TestClient(app)
+
+    first = client.get("/app.js")
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == routes._STATIC_CACHE_CONTROL
+
+    cached = client.get("/app.js", headers={"If-None-Match": first.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    weak = client.get("/app.js", headers={"If-None-Match": f'"other", W/{first.headers["etag"]}'})
+    assert weak.status_code == 304
+    assert client.get("/app.js", headers={"If-None-Match": "*"}).status_code == 304
+    assert client.get("/app.js", headers={"If-None-Match": '"other"'}).status_code == 200
+
+    since = client.get("/app.js", headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert since.status_code == 304
+
+    assert client.get("/../outside.js").status_code == 404
+    assert client.get("/missing.js").status_code == 404
+
+
+def test_api_memory_post_writes_both_memory_files(monkeypatch, tmp_path):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    monkeypatch.chdir(tmp_path)
+    saved = {}
+
+    class FakeManager:
+        def __init__(self, path):
+            self.path = path
+
+        def save_memory(self, memory):
+            saved[self.path] = memory
+
+        def replace_with_user_payload(self, payload):
+            saved[self.path] = {"payload": payload}
+
+    monkeypatch.setattr(routes, "get_memory_manager", FakeManager)
+    monkeypatch.setattr(routes, "save_memory_settings", lambda settings: None)
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    response = TestClient(app).post(
+        "/api/memory",
+        json={"long_term_full": {"summary_text": "long"}, "short_term_memory": "short"},
+    )
+
+    assert response.status_code == 200
+    assert saved == {
+        "long_term_memory.json": {"summary_text": "long"},
+        "short_term_memory.json": {"payload": "short"},
+    }
+
+
+def test_scheduled_broadcasts_run_in_background_in_save_order(monkeypatch):
+    order = []
+
+    async def fake_broadcast(selection):
+        order.append(("start", selection["n"]))
+        await asyncio.sleep(0.01 if selection["n"] == 1 else 0)
+        order.append(("end", selection["n"]))
+
+    monkeypatch.setattr(routes, "_broadcast_model_settings", fake_broadcast)
+
+    async def save_twice():
+        monkeypatch.setattr(routes, "_broadcast_lock", asyncio.Lock())
+        routes._schedule_model_settings_broadcast({"n": 1})
+        routes._schedule_model_settings_broadcast({"n": 2})
+        assert order == []
+        await asyncio.gather(*routes._broadcast_tasks)
+
+    asyncio.run(save_twice())
+
+    assert order == [("start", 1), ("end", 1), ("start", 2), ("end", 2)]
+    assert not routes._broadcast_tasks
+
+
+def test_orchestrator_chat_reports_init_failure_as_single_sse_frame(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    def failing_orchestrator():
+        raise routes.OrchestratorError("unavailable")
+
+    monkeypatch.setattr(routes, "_get_orchestrator", failing_orchestrator)
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    response = TestClient(app).post("/orchestrator/chat", json={"message": "hi"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.content == routes._format_sse_event({"event": "error", "error": "unavailable"})
+
+
+def test_orchestrator_chat_dedupes_browser_bases_before_service_default(monkeypatch):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    seen_bases = []
+
+    class FakeOrchestrator:
+        async def run_stream(self, message, log_history=False):
+            seen_bases.append(get_browser_agent_bases())
+            yield {"event": "complete"}
+
+    monkeypatch.setattr(routes, "_get_orchestrator", lambda: FakeOrchestrator())
+    app = FastAPI()
+    app.include_router(routes.router)
+
+    TestClient(app).post(
+        "/orchestrator/chat",
+        json={
+            "message": "hi",
+            "browser_agent_base": "http://a:1, http://b:2",
+            "browser_agent_bases": ["http://a:1", "http://browser-agent:5005"],
+        },
+    )
+
+    assert seen_bases == [["http://a:1", "http://b:2", routes._SERVICE_DEFAULT_BROWSER_BASE]]
@@ -0,0 +1,45 @@
+import asyncio
+import datetime
+
+from multi_agent_app import scheduler
+
+
+def test_calendar_reads_are_reused_until_a_write(monkeypatch):
+    monkeypatch.setattr(scheduler, "_ui_read_cache", {})
+    calls = []
+
+    async def fake_call(path, method="GET", params=None):
+        calls.append((path, params))
+        return {"calendar_data": [[{"date": "2024-05-01"}]], "today": "2024-05-01"}
+
+    monkeypatch.setattr(scheduler, "_call_scheduler_agent", fake_call)
+
+    first = asyncio.run(scheduler._fetch_calendar_data(2024, 5))
+    assert first["today"] == datetime.date(2024, 5, 1)
+    first["calendar_data"][0][0]["date"] = "mutated"
+    second = asyncio.run(scheduler._fetch_calendar_data(2024, 5))
+    assert second["calendar_data"][0][0]["date"] == datetime.date(2024, 5, 1)
+    assert len(calls) == 1
+
+    asyncio.run(scheduler._fetch_calendar_data(2024, 6))
+    assert len(calls) == 2
+
+    scheduler._invalidate_scheduler_ui_cache()
+    asyncio.run(scheduler._fetch_calendar_data(2024, 5))
+    assert len(calls) == 3
+
+
+def test_day_view_items_get_template_defaults(monkeypatch):
+    monkeypatch.setattr(scheduler, "_ui_read_cache", {})
+
+    async def fake_call(path, method="GET", params=None):
+        return {"date": "2024-05-01", "timeline_items": [{"log_memo": None}, {"log_memo": "memo", "is_done": True}]}
+
+    monkeypatch.setattr(scheduler, "_call_scheduler_agent", fake_call)
+
+    data = asyncio.run(scheduler._fetch_day_view_data("2024-05-01"))
+    assert data["date"] == datetime.date(2024, 5, 1)
+    assert data["timeline_items"] == [
+        {"log_memo": "", "is_done": False},
+        {"log_memo": "memo", "is_done": True},
+    ]
@@ -0,0 +1,31 @@
+import json
+
+from multi_agent_app import settings as settings_module
+
+
+def test_settings_loaders_reuse_parse_until_saved(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings_module, "_settings_cache", {})
+    (tmp_path / "agent_connections.json").write_text(json.dumps({"iot": False}), encoding="utf-8")
+
+    calls = []
+    real_loads = settings_module.json_loads
+    monkeypatch.setattr(settings_module, "json_loads", lambda raw: calls.append(raw) or real_loads(raw))
+
+    first = settings_module.load_agent_connections()
+    assert first["iot"] is False
+    first["iot"] = True
+    assert settings_module.load_agent_connections()["iot"] is False
+    assert len(calls) == 1
+
+    settings_module.save_agent_connections({"iot": True, "browser": False})
+    reloaded = settings_module.load_agent_connections()
+    assert reloaded["iot"] is True and reloaded["browser"] is False
+    assert len(calls) == 2
+
+
+def test_memory_settings_default_when_file_missing(monkeypatch, tmp_path):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(settings_module, "_settings_cache", {})
+
+    assert settings_module.load_memory_settings() == settings_module.DEFAULT_MEMORY_SETTINGS